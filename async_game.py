@@ -0,0 +1,76 @@
+# async_game.py
+"""Run many games on one asyncio event loop.
+
+The engine coroutines (traverse_dungeon, start_battle, post_loot_menu, ...)
+await every prompt and pacing delay through their sink, so a session blocked on
+a slow player costs nothing while the others keep playing. Give each session an
+AsyncSink wired to that player's connection and gather them (server.py does
+this for TCP connections).
+
+Demo, e.g.  python async_game.py -n 500
+hosts 500 keyboard-style battles at once, each "player" answering every prompt
+with "1" (attack the first target) after a short think time.
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from battle_sim import party_classes
+from enemies import enemy_templates, spawn_enemy
+from game_io import AsyncSink
+from vivid_battle import start_battle
+
+
+class ScriptedPlayer:
+    """Stand-in for a remote player: collects output and answers prompts from a script."""
+
+    def __init__(self, answers=("1",), think_time=0.01):
+        self.answers = list(answers)
+        self.think_time = think_time
+        self.prompts = 0
+        self.output = []
+
+    def write(self, text):
+        self.output.append(text)
+
+    async def read_line(self):
+        await asyncio.sleep(self.think_time)
+        answer = self.answers[self.prompts % len(self.answers)]
+        self.prompts += 1
+        return answer
+
+
+async def demo_battle(index, pace, think_time, seed=0):
+    rng = random.Random(f"{seed}:{index}")  # one stream per session: interleaving never changes a battle
+    job = rng.choice(list(party_classes))
+    player = ScriptedPlayer(think_time=think_time)
+    sink = AsyncSink(player.write, player.read_line, pace=pace)
+    players = [party_classes[job](f"{job} {index}", rng)]
+    result = await start_battle(players, [spawn_enemy(rng.choice(list(enemy_templates)))], [], sink=sink, rng=rng)
+    return result, player.prompts
+
+
+async def host_demo(sessions, pace, think_time, seed=0):
+    return await asyncio.gather(*(demo_battle(i, pace, think_time, seed) for i in range(sessions)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Host many concurrent scripted battles on one event loop.")
+    parser.add_argument("-n", "--sessions", type=int, default=200, help="concurrent sessions")
+    parser.add_argument("--pace", type=float, default=0.05, help="scale for the game's pacing delays")
+    parser.add_argument("--think", type=float, default=0.01, help="seconds each scripted player takes to answer")
+    parser.add_argument("--seed", default=0, help="base seed; same seed => same battles")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = asyncio.run(host_demo(args.sessions, args.pace, args.think, args.seed))
+    elapsed = time.perf_counter() - start
+
+    wins = sum(result == "win" for result, _ in results)
+    prompts = sum(count for _, count in results)
+    print(f"{args.sessions} sessions, {prompts} prompts answered, {wins} wins in {elapsed:.2f}s on one thread")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+# battle_events.py
+"""What happened in a battle, as data.
+
+The engine reports each step of a fight as one of these events through
+sink.event(). Text sinks hand them to battle_render.TextRenderer, which turns
+them back into the colorama narration; headless sinks drop them without ever
+formatting a string, and EventLog keeps them for analytics or spectators.
+
+Units and spells are the live objects; numbers are captured at the moment the
+event happened.
+"""
+from dataclasses import dataclass
+
+from game_io import GameIO, NullSink
+
+
+@dataclass(slots=True)
+class BattleStarted:
+    players: list
+    enemies: list
+
+
+@dataclass(slots=True)
+class RoundStarted:
+    number: int
+    players: list
+    enemies: list
+    upcoming: list = ()         # next actors on the turn timeline, if the sink renders
+
+
+@dataclass(slots=True)
+class TurnStarted:
+    unit: object
+
+
+@dataclass(slots=True)
+class TurnLost:
+    unit: object
+    reason: str                 # "confused", "feared", "stunned", "madness", "terror"
+
+
+@dataclass(slots=True)
+class SpellCast:
+    caster: object
+    spell: object
+    kind: str = "cast"          # "melee", "enemy", "aoe", "guardian_shield", "blood_scent", "eviscerate"
+
+
+@dataclass(slots=True)
+class DamageDealt:
+    source: object
+    target: object
+    amount: int
+    dmg_type: str = "physical"
+    spell: object = None
+    cause: str = "spell"        # "melee", "cast", "spell", "madness", "mindfire", "bleed", "splash", "item", ...
+    sanity: int = 0
+
+
+@dataclass(slots=True)
+class Healed:
+    source: object
+    target: object
+    amount: int
+    spell: object = None
+    cause: str = "spell"        # "spell", "sentinel_oath", "sentinel_instinct", "drain", "miscast", "miscast_spill"
+
+
+@dataclass(slots=True)
+class SanityLost:
+    target: object
+    amount: int
+    spell: object = None
+
+
+@dataclass(slots=True)
+class Defended:
+    target: object
+    dmg_type: str
+    instinctive: bool = False
+
+
+@dataclass(slots=True)
+class Defending:
+    unit: object
+    reason: str = "guard"       # "guard", "fizzle", "madness"
+
+
+@dataclass(slots=True)
+class StatusApplied:
+    target: object
+    effect: str
+    spell_name: str = None
+
+
+@dataclass(slots=True)
+class StatusResisted:
+    target: object
+    effect: str
+    reason: str = "will"        # "will", "clarity"
+
+
+@dataclass(slots=True)
+class StatusExpired:
+    unit: object
+    effect: str
+
+
+@dataclass(slots=True)
+class MpLost:
+    target: object
+    amount: int
+    spell_name: str
+
+
+@dataclass(slots=True)
+class Warded:
+    caster: object
+    target: object
+    spell_name: str
+
+
+@dataclass(slots=True)
+class Intercepted:
+    guardian: object
+    target: object
+    amount: int
+    spell: object
+    kind: str = "guardian_shield"   # or "sentinel"
+
+
+@dataclass(slots=True)
+class ProtectionPrimed:
+    guardian: object
+    target: object
+
+
+@dataclass(slots=True)
+class ClingsToLife:
+    target: object
+    kind: str                   # "melee", "spell", "protect"
+
+
+@dataclass(slots=True)
+class SpellFailed:
+    caster: object
+    spell: object
+    reason: str                 # "miscast", "miscast_heal", "fizzle", "no_blood"
+    target: object = None
+
+
+@dataclass(slots=True)
+class Backlash:
+    caster: object
+    spell: object
+    affliction: str
+
+
+@dataclass(slots=True)
+class SanityEffect:
+    unit: object
+    kind: str                   # "strain", "insane", "brink", "hallucinate", "struggle", "awry", "falters"
+    sanity: int = 0
+
+
+@dataclass(slots=True)
+class MadnessScream:
+    unit: object
+
+
+@dataclass(slots=True)
+class UnitDefeated:
+    unit: object
+    cause: str = "damage"       # "damage", "bleed", "item"
+
+
+@dataclass(slots=True)
+class BattleEnded:
+    result: str                 # "win" or "lose"
+
+
+class EventLog(GameIO):
+    """Sink that keeps every battle event (and drops text), optionally passing everything on.
+
+    Wrap another sink to watch a live game: EventLog(console) renders as usual
+    while `events` fills up for analytics or a spectator feed.
+    """
+
+    def __init__(self, inner=None):
+        self.inner = inner or NullSink()
+        self.renders = self.inner.renders
+        self.events = []
+
+    def event(self, event):
+        self.events.append(event)
+        self.inner.event(event)
+
+    def emit(self, text=""):
+        self.inner.emit(text)
+
+    async def prompt(self, text=""):
+        return await self.inner.prompt(text)
+
+    async def pause(self, seconds):
+        await self.inner.pause(seconds)
+
+    def begin_round(self, number):
+        self.inner.begin_round(number)
@@ -0,0 +1,109 @@
+# battle_policy.py
+import random
+from colorama import Fore, Style
+from game_io import console
+from ui_utils import choose_healing_target, use_item_in_combat
+
+BATTLE_ACTIONS = ["Attack", "Cast Spell", "Use Item", "Inspect", "Defend"]
+
+
+class InteractivePolicy:
+    """Asks the person at the keyboard for every battle decision (the classic game)."""
+
+    def __init__(self, sink=console):
+        self.sink = sink
+
+    async def choose_action(self, unit, players, enemies):
+        for idx, action in enumerate(BATTLE_ACTIONS, 1):
+            self.sink.emit(f"  {idx}. {action}")
+        return (await self.sink.prompt(Fore.LIGHTWHITE_EX + "> " + Style.RESET_ALL)).strip()
+
+    async def choose_target(self, unit, units):
+        from vivid_battle import choose_target  # avoid circular imports
+        return await choose_target(units, sink=self.sink)
+
+    async def choose_spell(self, unit):
+        return await unit.choose_spell(sink=self.sink)
+
+    async def choose_heal_target(self, unit, players):
+        return await choose_healing_target(players, sink=self.sink)
+
+    async def choose_protect_target(self, unit, allies):
+        self.sink.emit("\nWho will you heal and protect?")
+        for i, ally in enumerate(allies, 1):
+            self.sink.emit(f"  {i}. {ally.name} ({ally.hp}/{ally.max_hp} HP)")
+        try:
+            choice = int(await self.sink.prompt("> ")) - 1
+            return allies[choice]
+        except (ValueError, IndexError):
+            return None
+
+    async def choose_fizzle_action(self, unit):
+        self.sink.emit(Fore.LIGHTWHITE_EX + f"\n🔄 {unit.name} may still inspect or defend:" + Style.RESET_ALL)
+        self.sink.emit("  1. Inspect Self")
+        self.sink.emit("  2. Defend")
+        return (await self.sink.prompt(Fore.LIGHTWHITE_EX + "> " + Style.RESET_ALL)).strip()
+
+    async def inspect(self, unit, returning_to="combat"):
+        await unit.inspect_character(sink=self.sink)
+        await self.sink.prompt(Fore.YELLOW + f"\nPress Enter to return to {returning_to}..." + Style.RESET_ALL)
+
+    async def use_item(self, unit, players, enemies, shared_inventory, rng=random):
+        await use_item_in_combat(unit, players, enemies, shared_inventory, sink=self.sink, rng=rng)
+
+
+class AutoPolicy:
+    """Deterministic scripted player used for headless battles and balance sweeps.
+
+    Heals the most wounded ally when someone drops below `heal_threshold`,
+    otherwise casts the strongest affordable attack spell, otherwise swings
+    the class melee weapon at the weakest enemy. It never draws from the
+    battle's RNG, so a headless battle rolls exactly the same numbers as an
+    interactive one fed the same choices.
+    """
+
+    def __init__(self, heal_threshold=0.4):
+        self.heal_threshold = heal_threshold
+        self._planned_spell = None
+
+    def _wounded(self, players):
+        return [p for p in players if 0 < p.hp < p.max_hp]
+
+    def _plan(self, unit, players):
+        affordable = [s for s in unit.spells if s.cost <= unit.mp]
+
+        heals = [s for s in affordable if s.category == "heal" and s.damage_range != (0, 0)]
+        if heals and any(p.hp < self.heal_threshold * p.max_hp for p in self._wounded(players)):
+            return max(heals, key=lambda s: s.damage_range[1])
+
+        attacks = [s for s in affordable if s.category in ("damage", "special")]
+        if attacks:
+            return max(attacks, key=lambda s: sum(s.damage_range))
+        return None
+
+    async def choose_action(self, unit, players, enemies):
+        self._planned_spell = self._plan(unit, players)
+        return "2" if self._planned_spell else "1"
+
+    async def choose_target(self, unit, units):
+        alive = [u for u in units if u.hp > 0]
+        return min(alive, key=lambda u: u.hp) if alive else None
+
+    async def choose_spell(self, unit):
+        return self._planned_spell
+
+    async def choose_heal_target(self, unit, players):
+        wounded = self._wounded(players)
+        return min(wounded, key=lambda p: p.hp / p.max_hp) if wounded else None
+
+    async def choose_protect_target(self, unit, allies):
+        return min(allies, key=lambda p: p.hp / p.max_hp)
+
+    async def choose_fizzle_action(self, unit):
+        return "2"
+
+    async def inspect(self, unit, returning_to="combat"):
+        pass
+
+    async def use_item(self, unit, players, enemies, shared_inventory, rng=random):
+        pass
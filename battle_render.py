@@ -0,0 +1,336 @@
+# battle_render.py
+"""Turns battle events back into the game's colorama narration.
+
+Every text sink owns one TextRenderer (see GameIO.event). Flavor picks — melee
+descriptions, enemy lore lines, fizzle omens, hallucinations — come from the
+renderer's own random.Random, so how a battle is shown never changes how it plays.
+"""
+import random
+from colorama import Fore, Style
+
+from battle_events import (BattleStarted, RoundStarted, TurnStarted, TurnLost, SpellCast, DamageDealt,
+                           Healed, SanityLost, Defended, Defending, StatusApplied, StatusResisted,
+                           StatusExpired, MpLost, Warded, Intercepted, ProtectionPrimed, ClingsToLife,
+                           SpellFailed, Backlash, SanityEffect, MadnessScream, UnitDefeated, BattleEnded)
+from ui_utils import display_combat_unit
+from status_table import applied_text, effects
+
+class_icons = {
+    "White Mage": "✨",
+    "Black Mage": "🧙",
+    "Tank": "🛡️",
+    "Occultist": "🔮"
+}
+
+fizzle_flavor_texts = [
+    "⛧ The air twists violently, whispering in tongues no one understands...",
+    "☍ An eye blinks open in the void, then vanishes without a trace...",
+    "✦ The runes shimmer briefly before crumbling into black ash...",
+    "☉ {name} hears laughter — it echoes from somewhere beneath the floor.",
+    "⟁ The veil wavers. Something watches — but chooses not to act.",
+    "✣ A stifling silence falls, as if the dungeon holds its breath.",
+    "☌ A chorus of unseen voices hums dissonantly around {name}...",
+    "⯎ The sigils sputter and flare, then collapse into themselves."
+]
+
+turn_lost_text = {
+    "confused": (Fore.LIGHTMAGENTA_EX, "{name} is confused and skips their turn..."),
+    "feared": (Fore.LIGHTBLUE_EX, "{name} hesitates in fear and cannot act!"),
+    "madness": (Fore.LIGHTRED_EX, "{name} is overtaken by madness and lashes out randomly!"),
+    "stunned": (Fore.LIGHTBLACK_EX, "{name} is stunned and cannot act!"),
+    "terror": (Fore.RED, "{name} is frozen by terror and does nothing!"),
+}
+
+defending_text = {
+    "guard": "{name} raises their guard and prepares for the next attack.",
+    "fizzle": "{name} steadies their stance after the failed casting attempt.",
+    "madness": "{name} curls into a ball defensively, whispering to unseen forces...",
+}
+
+sanity_text = {
+    "insane": (Fore.RED, "💀 {name} has gone completely insane!"),
+    "brink": (Fore.MAGENTA, "😱 {name} is on the brink of madness!"),
+    "struggle": (Fore.LIGHTMAGENTA_EX, "🌀 {name} struggles to maintain clarity..."),
+    "awry": (Fore.YELLOW, "{name}'s spell goes awry!"),
+    "falters": (Fore.YELLOW, "{name}'s concentration falters..."),
+}
+
+
+def enemy_spell_cast_text(enemy_name, spell_name, rng=random):
+    lore_lines = {
+        "Void Bolt": [
+            f"{enemy_name} chants in a forgotten tongue and hurls a bolt from the void!",
+            f"Space distorts around {enemy_name} as {spell_name} tears toward its prey!",
+            f"A whisper from the Outer Dark rides the {spell_name} released by {enemy_name}!"
+        ],
+        "Eldritch Flame": [
+            f"{enemy_name} ignites a flame that screams with the voices of dead stars!",
+            f"{spell_name} writhes unnaturally in {enemy_name}'s grasp before lashing out!",
+            f"An inferno born of madness erupts as {enemy_name} casts {spell_name}!"
+        ],
+        "Fireball": [
+            f"{enemy_name}'s eyes burn red as a blazing sphere engulfs the air!",
+            f"With an inhuman roar, {enemy_name} hurls {spell_name} from a burning sigil!",
+            f"The heat of ancient suns answers {enemy_name}'s call through {spell_name}!"
+        ],
+        "Arcane Cataclysm": [
+            f"The veil of reality rends as {enemy_name} unleashes {spell_name}!",
+            f"{spell_name} swirls with impossible geometry as {enemy_name} calls upon it!",
+            f"The dungeon trembles — {enemy_name} channels the will of Nyarlathotep!"
+        ]
+    }
+
+    return rng.choice(lore_lines.get(spell_name, [f"{enemy_name} casts {spell_name} with unsettling calm..."]))
+
+
+class TextRenderer:
+    """Narrates battle events to a sink, one handler per event type."""
+
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+        self.handlers = {
+            BattleStarted: self.battle_started,
+            RoundStarted: self.round_started,
+            TurnStarted: self.turn_started,
+            TurnLost: self.turn_lost,
+            SpellCast: self.spell_cast,
+            DamageDealt: self.damage_dealt,
+            Healed: self.healed,
+            SanityLost: self.sanity_lost,
+            Defended: self.defended,
+            Defending: self.defending,
+            StatusApplied: self.status_applied,
+            StatusResisted: self.status_resisted,
+            StatusExpired: self.status_expired,
+            MpLost: self.mp_lost,
+            Warded: self.warded,
+            Intercepted: self.intercepted,
+            ProtectionPrimed: self.protection_primed,
+            ClingsToLife: self.clings_to_life,
+            SpellFailed: self.spell_failed,
+            Backlash: self.backlash,
+            SanityEffect: self.sanity_effect,
+            MadnessScream: self.madness_scream,
+            UnitDefeated: self.unit_defeated,
+            BattleEnded: self.battle_ended,
+        }
+
+    def render(self, event, sink):
+        self.handlers[type(event)](event, sink)
+
+    def battle_started(self, e, sink):
+        sink.emit(Fore.RED + Style.BRIGHT + "\n⚔️  The battle begins!\n" + Style.RESET_ALL)
+
+    def round_started(self, e, sink):
+        sink.emit(Fore.LIGHTWHITE_EX + "\n👥 Party Status:" + Style.RESET_ALL)
+        for player in e.players:
+            if player.hp > 0:
+                display_combat_unit(player, sink=sink)
+
+        sink.emit(Fore.LIGHTWHITE_EX + "\n👹 Enemy Status:" + Style.RESET_ALL)
+        for enemy in e.enemies:
+            if enemy.hp > 0:
+                display_combat_unit(enemy, is_enemy=True, sink=sink)
+
+        if e.upcoming:
+            sink.emit(Fore.LIGHTBLACK_EX + "⏳ Next up: " + " → ".join(u.name for u in e.upcoming) + Style.RESET_ALL)
+
+    def turn_started(self, e, sink):
+        icon = class_icons.get(e.unit.job, "🎭")
+        sink.emit(Fore.CYAN + f"\n{icon}  {e.unit.name}'s Turn {icon}" + Style.RESET_ALL)
+
+    def turn_lost(self, e, sink):
+        color, text = turn_lost_text[e.reason]
+        sink.emit(color + text.format(name=e.unit.name) + Style.RESET_ALL)
+
+    def spell_cast(self, e, sink):
+        caster, spell = e.caster.name, e.spell.name
+        if e.kind == "melee":
+            sink.emit(Fore.CYAN + self.rng.choice(e.spell.description_pool) + Style.RESET_ALL)
+        elif e.kind == "enemy":
+            sink.emit(Fore.RED + f"\n👹 {enemy_spell_cast_text(caster, spell, self.rng)}" + Style.RESET_ALL)
+        elif e.kind == "aoe":
+            sink.emit(Fore.MAGENTA + f"\n✨ {caster} unleashes {spell}, targeting all enemies!" + Style.RESET_ALL)
+        elif e.kind == "guardian_shield":
+            sink.emit(Fore.YELLOW + f"\n🛡️ {caster} activates Guardian Shield, ready to protect allies!" + Style.RESET_ALL)
+            sink.emit(Fore.YELLOW + f"\n🛡️ {caster} braces to intercept incoming attacks!" + Style.RESET_ALL)
+        elif e.kind == "blood_scent":
+            sink.emit(Fore.RED + f"{spell} locks onto the scent of blood — {caster} strikes with savage precision!" + Style.RESET_ALL)
+        elif e.kind == "eviscerate":
+            sink.emit(Fore.RED + f"{spell} carves into open wounds — the bleeding makes it worse!" + Style.RESET_ALL)
+
+    def damage_dealt(self, e, sink):
+        target, n = e.target.name, e.amount
+        source = e.source.name if e.source else None
+        spell = e.spell.name if e.spell else None
+
+        if e.cause == "melee":
+            if n == 0:
+                sink.emit(self.rng.choice([
+                    f"{source}'s strike glances off {target}, dealing no damage.",
+                    f"{target} shrugs off the attack — unscathed.",
+                    f"{source} fails to penetrate {target}'s defense."
+                ]))
+            elif n <= 3:
+                sink.emit(f"A light hit — {source} deals just {n} damage.")
+            else:
+                sink.emit(Fore.GREEN + f"\n🗡️ {source} hits {target} for {n} damage!" + Style.RESET_ALL)
+        elif e.cause == "cast":
+            sink.emit(Fore.MAGENTA + f"\n🔥 {source} successfully casts {spell} and hits {target} for {n} damage!" + Style.RESET_ALL)
+        elif e.cause == "spell":
+            color = Fore.RED if e.dmg_type == "physical" else Fore.MAGENTA
+            sink.emit(color + f"{target} takes {n} {e.dmg_type} damage from {spell} cast by {source}!" + Style.RESET_ALL)
+        elif e.cause == "madness":
+            sink.emit(Fore.RED + f"{source} attacks {target} in a fit of madness for {n} damage!" + Style.RESET_ALL)
+        elif e.cause == "self":
+            sink.emit(Fore.RED + f"{target} lashes out at unseen horrors, taking {n} self-inflicted damage!" + Style.RESET_ALL)
+        elif e.cause == "mindfire":
+            sink.emit(Fore.RED + f"🔥 {target} suffers {n} HP and {e.sanity} sanity from Mindfire!" + Style.RESET_ALL)
+        elif e.cause == "bleed":
+            sink.emit(Fore.LIGHTRED_EX + f"🩸 {target} bleeds for {n} damage!" + Style.RESET_ALL)
+        elif e.cause == "sear":
+            sink.emit(Fore.LIGHTRED_EX + f"🔥 {target} is seared for {n} HP and {e.sanity} sanity!" + Style.RESET_ALL)
+        elif e.cause == "splash":
+            sink.emit(Fore.LIGHTRED_EX + f"🔥 Splash damage from {spell} scorches {target} for {n} HP!" + Style.RESET_ALL)
+        elif e.cause == "eviscerate":
+            sink.emit(Fore.LIGHTRED_EX + f"{target} takes an extra {n} damage due to bleeding!" + Style.RESET_ALL)
+        elif e.cause == "backlash":
+            sink.emit(Fore.RED + f"{target} suffers {n} backlash damage!" + Style.RESET_ALL)
+        elif e.cause == "miscast_self":
+            sink.emit(Fore.RED + f"{source}'s {spell} explodes in their hands, dealing {n} self-inflicted damage!" + Style.RESET_ALL)
+        elif e.cause == "miscast_wild":
+            sink.emit(Fore.YELLOW + f"{source}'s {spell} wildly fires at {target}, dealing {n} damage!" + Style.RESET_ALL)
+        elif e.cause == "item":
+            sink.emit(Fore.RED + f"{target} takes {n} damage!" + Style.RESET_ALL)
+
+    def healed(self, e, sink):
+        source, target, n = e.source.name, e.target.name, e.amount
+        spell = e.spell.name if e.spell else None
+        if e.cause == "spell":
+            sink.emit(Fore.GREEN + f"\n✨ {source} casts {spell} and heals {target} for {n} HP!" + Style.RESET_ALL)
+        elif e.cause == "sentinel_oath":
+            sink.emit(Fore.GREEN + f"\n✨ {source} casts {spell}, healing {target} for {n} HP!" + Style.RESET_ALL)
+        elif e.cause == "sentinel_instinct":
+            sink.emit(Fore.GREEN + f"{target} is enveloped in protective light and recovers {n} HP!" + Style.RESET_ALL)
+        elif e.cause == "drain":
+            sink.emit(Fore.MAGENTA + f"{target} drains {n} HP from {source}!" + Style.RESET_ALL)
+        elif e.cause == "miscast":
+            sink.emit(Fore.GREEN + f"{target} heals for {n} HP..." + Style.RESET_ALL)
+        elif e.cause == "miscast_spill":
+            sink.emit(Fore.LIGHTRED_EX + f"💢 The remaining {n} healing energy is absorbed by {target}!" + Style.RESET_ALL)
+
+    def sanity_lost(self, e, sink):
+        sink.emit(Fore.MAGENTA + f"{e.target.name} loses {e.amount} sanity under the {e.spell.name}!" + Style.RESET_ALL)
+
+    def defended(self, e, sink):
+        if e.instinctive:
+            sink.emit(Fore.CYAN + f"{e.target.name} defends instinctively against the blow!" + Style.RESET_ALL)
+        else:
+            sink.emit(Fore.CYAN + f"{e.target.name} defends and takes reduced {e.dmg_type} damage!" + Style.RESET_ALL)
+
+    def defending(self, e, sink):
+        sink.emit(Fore.LIGHTYELLOW_EX + defending_text[e.reason].format(name=e.unit.name) + Style.RESET_ALL)
+
+    def status_applied(self, e, sink):
+        color, text = applied_text(e.effect, e.spell_name)
+        sink.emit(color + text.format(name=e.target.name) + Style.RESET_ALL)
+
+    def status_resisted(self, e, sink):
+        if e.reason == "clarity":
+            sink.emit(Fore.YELLOW + f"{e.target.name} resists the {e.effect} due to mental clarity!" + Style.RESET_ALL)
+        elif e.effect == "random_mental":
+            sink.emit(Fore.YELLOW + f"{e.target.name} resists the creeping madness!" + Style.RESET_ALL)
+        else:
+            sink.emit(Fore.YELLOW + f"{e.target.name} resists the {e.effect}!" + Style.RESET_ALL)
+
+    def status_expired(self, e, sink):
+        if e.effect == "guardian_shield":
+            sink.emit(Fore.LIGHTWHITE_EX + f"{e.unit.name}'s Guardian Shield fades." + Style.RESET_ALL)
+            return
+        sink.emit(Fore.YELLOW + effects[e.effect].expired.format(name=e.unit.name) + Style.RESET_ALL)
+
+    def mp_lost(self, e, sink):
+        sink.emit(Fore.BLUE + f"{e.target.name} loses {e.amount} MP to {e.spell_name}!" + Style.RESET_ALL)
+
+    def warded(self, e, sink):
+        caster, target = e.caster.name, e.target.name
+        if e.spell_name == "Pure of Mind":
+            sink.emit(Fore.CYAN + f"{caster} casts Pure of Mind!" + Style.RESET_ALL)
+            sink.emit(Fore.LIGHTWHITE_EX + f"A calming glow surrounds {target}, clearing their mind and bolstering it against future corruption." + Style.RESET_ALL)
+        else:
+            sink.emit(Fore.CYAN + f"{caster} invokes the {e.spell_name}!" + Style.RESET_ALL)
+            sink.emit(Fore.LIGHTWHITE_EX + f"An intangible silence shields {target}'s mind from intrusion." + Style.RESET_ALL)
+
+    def intercepted(self, e, sink):
+        guardian, target, spell = e.guardian.name, e.target.name, e.spell.name
+        if e.kind == "sentinel":
+            sink.emit(Fore.CYAN + f"\n🛡️ {guardian} senses danger and intercepts the {spell} meant for {target}!" + Style.RESET_ALL)
+        else:
+            sink.emit(Fore.CYAN + f"{guardian} intercepts the blow from {spell}, taking {e.amount} damage for {target}!" + Style.RESET_ALL)
+
+    def protection_primed(self, e, sink):
+        sink.emit(Fore.LIGHTCYAN_EX + f"🛡️ {e.guardian.name} prepares to intercept any attack against {e.target.name}!" + Style.RESET_ALL)
+
+    def clings_to_life(self, e, sink):
+        name = e.target.name
+        if e.kind == "melee":
+            sink.emit(Fore.YELLOW + f"{name} clings to life with a sliver of strength!" + Style.RESET_ALL)
+        elif e.kind == "spell":
+            sink.emit(Fore.YELLOW + f"{name}'s form flickers—barely hanging on!" + Style.RESET_ALL)
+        else:
+            sink.emit(Fore.YELLOW + f"⚠️ {name} clings to life... something in the air shifts protectively." + Style.RESET_ALL)
+
+    def spell_failed(self, e, sink):
+        caster, spell = e.caster.name, e.spell.name
+        if e.reason == "miscast":
+            sink.emit(Fore.YELLOW + f"{caster}'s concentration wavers — the spell misfires!" + Style.RESET_ALL)
+        elif e.reason == "miscast_heal":
+            sink.emit(Fore.YELLOW + f"{caster} miscasts {spell} — distorted energies ripple outward!" + Style.RESET_ALL)
+        elif e.reason == "fizzle":
+            sink.emit(Fore.YELLOW + f"{caster} loses focus — the spell fizzles before it forms!" + Style.RESET_ALL)
+
+            # 🎭 Add eerie flavor text
+            fizzle_line = self.rng.choice(fizzle_flavor_texts)
+            if "{name}" in fizzle_line:
+                fizzle_line = fizzle_line.format(name=caster)
+            sink.emit(Fore.LIGHTBLACK_EX + fizzle_line + Style.RESET_ALL)
+        elif e.reason == "no_blood":
+            sink.emit(Fore.YELLOW + f"{caster} lunges with {spell}, but {e.target.name} isn't bleeding — the spell fizzles!" + Style.RESET_ALL)
+
+    def backlash(self, e, sink):
+        sink.emit(Fore.LIGHTMAGENTA_EX + f"The miscast {e.spell.name} echoes back into {e.caster.name}'s mind, inducing {e.affliction}!" + Style.RESET_ALL)
+
+    def sanity_effect(self, e, sink):
+        name = e.unit.name
+        if e.kind == "strain":
+            if e.sanity < 25:
+                sink.emit(Fore.MAGENTA + f"😱 {name} is on the edge of madness, whispering to unseen horrors..." + Style.RESET_ALL)
+            elif e.sanity < 50:
+                sink.emit(Fore.MAGENTA + f"🌀 {name}'s hands shake as visions cloud their eyes..." + Style.RESET_ALL)
+            else:
+                sink.emit(Fore.MAGENTA + f"😧 {name} breathes heavily, shadows swirling in the corners of their vision." + Style.RESET_ALL)
+        elif e.kind == "hallucinate":
+            sink.emit(Fore.LIGHTMAGENTA_EX + self.rng.choice([
+                f"{name} whispers about the eyes in the floor...",
+                f"{name} sees something reaching from the walls...",
+                f"{name} claws at their skin, muttering eldritch syllables..."
+            ]) + Style.RESET_ALL)
+        else:
+            color, text = sanity_text[e.kind]
+            sink.emit(color + text.format(name=name) + Style.RESET_ALL)
+
+    def madness_scream(self, e, sink):
+        sink.emit(Fore.LIGHTMAGENTA_EX + f"{e.unit.name} screams at the darkness, hands clutching their skull — doing nothing useful!" + Style.RESET_ALL)
+
+    def unit_defeated(self, e, sink):
+        # Battle damage never announced a fallen unit; only bleeding out and thrown items do
+        if e.cause == "bleed":
+            sink.emit(Fore.RED + f"{e.unit.name} succumbs to blood loss..." + Style.RESET_ALL)
+        elif e.cause == "item":
+            sink.emit(Fore.GREEN + f"{e.unit.name} has been defeated!" + Style.RESET_ALL)
+
+    def battle_ended(self, e, sink):
+        if e.result == "win":
+            sink.emit(Fore.GREEN + Style.BRIGHT + "\n🎉 Victory! The enemies have been defeated!" + Style.RESET_ALL)
+        else:
+            sink.emit(Fore.RED + Style.BRIGHT + "\n💀 Your party has fallen to the dungeon..." + Style.RESET_ALL)
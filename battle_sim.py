@@ -0,0 +1,154 @@
+# battle_sim.py
+"""Monte Carlo balance sweep: every enemy template against every 1-3 member party.
+
+Run from the command line, e.g.  python battle_sim.py -n 200 -j 8
+
+Each pairing is one task for the process pool. Every battle gets its own
+random.Random seeded from (seed, enemy, party, battle index), so results are
+identical whatever the worker count or scheduling order. (Except with
+--boss-ai: the lookahead boss searches against the clock.)
+"""
+import argparse
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations_with_replacement
+
+from battle_policy import AutoPolicy
+from enemies import enemy_templates, spawn_enemy
+from enemy_ai import LookaheadAI
+from game_io import NullSink, run_sync
+from party_setup import WhiteMage, BlackMage, Tank, Occultist
+from vivid_battle import start_battle
+
+party_classes = {
+    "White Mage": WhiteMage,
+    "Black Mage": BlackMage,
+    "Tank": Tank,
+    "Occultist": Occultist,
+}
+
+MAX_ROUNDS = 200
+
+
+class RoundLimitReached(Exception):
+    pass
+
+
+class RoundCounter(NullSink):
+    """Silent sink that counts rounds and aborts battles that stall."""
+
+    def __init__(self, max_rounds=MAX_ROUNDS):
+        self.rounds = 0
+        self.max_rounds = max_rounds
+
+    def begin_round(self, number):
+        self.rounds = number
+        if number > self.max_rounds:
+            raise RoundLimitReached()
+
+
+def all_parties(max_size=3):
+    """Every party of 1..max_size members (order doesn't matter, repeats allowed)."""
+    jobs = list(party_classes)
+    parties = []
+    for size in range(1, max_size + 1):
+        parties.extend(combinations_with_replacement(jobs, size))
+    return parties
+
+
+def battle_seed(seed, enemy_name, party, index):
+    return f"{seed}:{enemy_name}:{'/'.join(party)}:{index}"
+
+
+def simulate_pairing(enemy_name, party, battles, seed=0, max_rounds=MAX_ROUNDS, boss_ai=None):
+    """Run `battles` seeded fights of one party against one enemy and summarise them.
+
+    `boss_ai` is a per-decision time budget in seconds for a LookaheadAI boss.
+    """
+    ai = LookaheadAI(boss_ai) if boss_ai else None
+    wins = draws = 0
+    rounds = hp = mp = sanity = 0
+
+    for index in range(battles):
+        rng = random.Random(battle_seed(seed, enemy_name, party, index))
+        players = [party_classes[job](f"{job} {i + 1}", rng) for i, job in enumerate(party)]
+        enemies = [spawn_enemy(enemy_name, boss_ai=ai)]
+        sink = RoundCounter(max_rounds)
+
+        try:
+            result = run_sync(start_battle(players, enemies, [], policy=AutoPolicy(), sink=sink, rng=rng))
+        except RoundLimitReached:
+            result = "draw"
+
+        wins += result == "win"
+        draws += result == "draw"
+        rounds += min(sink.rounds, max_rounds)
+        hp += sum(p.hp for p in players)
+        mp += sum(p.mp for p in players)
+        sanity += sum(p.sanity for p in players)
+
+    return {
+        "enemy": enemy_name,
+        "party": party,
+        "battles": battles,
+        "win_rate": wins / battles,
+        "draw_rate": draws / battles,
+        "avg_rounds": rounds / battles,
+        "avg_hp": hp / battles,
+        "avg_mp": mp / battles,
+        "avg_sanity": sanity / battles,
+        "ai": ai.summary() if ai and ai.stats["decisions"] else None,
+    }
+
+
+def _run_task(task):
+    return simulate_pairing(*task)
+
+
+def run_sweep(battles=100, workers=None, seed=0, enemy_names=None, max_party_size=3, max_rounds=MAX_ROUNDS, boss_ai=None):
+    """Simulate every enemy x party pairing across a process pool.
+
+    Returns one summary dict per pairing, in a stable order.
+    """
+    enemy_names = enemy_names or list(enemy_templates)
+    tasks = [(name, party, battles, seed, max_rounds, boss_ai)
+             for name in enemy_names
+             for party in all_parties(max_party_size)]
+
+    if workers == 1:
+        return [_run_task(task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_task, tasks, chunksize=max(1, len(tasks) // (4 * (workers or os.cpu_count() or 1)))))
+
+
+def format_report(results):
+    lines = [f"{'Enemy':<24} {'Party':<38} {'Win%':>6} {'Draw%':>6} {'Rounds':>7} {'HP':>7} {'MP':>7} {'SAN':>7}"]
+    for r in results:
+        lines.append(
+            f"{r['enemy']:<24} {' + '.join(r['party']):<38} {r['win_rate'] * 100:>6.1f} {r['draw_rate'] * 100:>6.1f}"
+            f" {r['avg_rounds']:>7.1f} {r['avg_hp']:>7.1f} {r['avg_mp']:>7.1f} {r['avg_sanity']:>7.1f}"
+        )
+        if r.get("ai"):
+            lines.append(f"{'':<24} {r['ai']}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo balance sweep over enemies and party compositions.")
+    parser.add_argument("-n", "--battles", type=int, default=100, help="battles per pairing")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", default=0, help="base seed; same seed => same report")
+    parser.add_argument("--enemy", action="append", dest="enemies", help="limit to this enemy (repeatable)")
+    parser.add_argument("--max-party", type=int, default=3, help="largest party size to simulate")
+    parser.add_argument("--boss-ai", type=float, metavar="MS", help="give bosses the lookahead AI with this budget per decision")
+    args = parser.parse_args()
+
+    boss_ai = args.boss_ai / 1000 if args.boss_ai else None
+    results = run_sweep(args.battles, args.workers, args.seed, args.enemies, args.max_party, boss_ai=boss_ai)
+    print(format_report(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+# benchmarks.py
+"""Micro-benchmarks for engine hot paths.
+
+    python benchmarks.py snapshot       battle snapshot/restore against deepcopy, per unit
+    python benchmarks.py transposition  boss lookahead with and without its transposition table
+    python benchmarks.py spawn          spawn_enemy per template, fresh and pooled
+    python benchmarks.py memory         bytes per unit: __slots__ against the same attributes in a __dict__
+    python benchmarks.py status         one status tick for a million units: StatusArrays against a Player loop
+    python benchmarks.py rows           a round's unit rows from unit_view's cache against rendering them afresh
+    python benchmarks.py inventory      a long farming run's pickups and key checks: Inventory against the old list
+"""
+import argparse
+import copy
+import random
+import sys
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from battle_policy import AutoPolicy
+from battle_sim import party_classes
+from enemies import EnemyPool, enemy_templates, spawn_enemy
+from enemy_ai import LookaheadAI
+from game_io import NullSink, run_sync
+from inventory import Inventory
+from items import item_lookup
+from replay import attrs_of
+from status_arrays import StatusArrays
+from status_effects import handle_status_effects, handle_sanity_effects
+from status_set import EFFECT_NAMES, StatusSet
+from status_table import effects
+from turn_scheduler import TurnScheduler
+from ui_utils import combat_unit_row
+from unit_view import unit_row
+from vivid_battle import Battle, apply_aoe_spell
+from spells import spell_lookup
+
+
+def build_battle(units, seed=0):
+    """A Battle of `units` combatants: half of them (up to 4) in the party, the rest enemies."""
+    rng = random.Random(seed)
+    jobs = list(party_classes)
+    players = [party_classes[jobs[i % len(jobs)]](f"Hero {i + 1}", rng) for i in range(min(4, max(1, units // 2)))]
+    names = list(enemy_templates)
+    enemies = [spawn_enemy(names[i % len(names)]) for i in range(units - len(players))]
+    battle = Battle(players, enemies, AutoPolicy(), NullSink(), rng)
+    battle.scheduler = TurnScheduler(players + enemies)
+    battle.scheduler.start_round()
+    return battle
+
+
+def per_unit(seconds, units):
+    return f"{seconds / units * 1e6:7.2f} µs/unit"
+
+
+def bench_snapshot(sizes, number):
+    print(f"{'units':>6}  {'snapshot':>16}  {'restore':>16}  {'deepcopy':>16}")
+    for units in sizes:
+        battle = build_battle(units)
+        saved = battle.snapshot()
+
+        # Sanity check: a wild turn of damage and statuses rolls back exactly
+        run_sync(apply_aoe_spell(spell_lookup["Curse of the Stars"], battle.enemies[0], battle.players, sink=battle.sink, rng=battle.rng))
+        battle.restore(saved)
+        assert battle.snapshot() == saved, "restore() did not roll the battle back"
+
+        snap = min(timeit.repeat(battle.snapshot, number=number, repeat=5)) / number
+        back = min(timeit.repeat(lambda: battle.restore(saved), number=number, repeat=5)) / number
+        combatants = battle.players + battle.enemies
+        deep = min(timeit.repeat(lambda: copy.deepcopy(combatants), number=max(1, number // 100), repeat=3)) / max(1, number // 100)
+        print(f"{units:>6}  {per_unit(snap, units):>16}  {per_unit(back, units):>16}  {per_unit(deep, units):>16}")
+    print("(snapshot and restore include the rng state, a fixed few µs per call)")
+
+
+def bench_transposition(decisions):
+    party = build_battle(6).players  # three heroes
+    boss = spawn_enemy("Avatar of Nyarlathotep")
+    battle = Battle(party, [boss], AutoPolicy(), NullSink(), random.Random(0))
+
+    print(f"{'table':>6}  {'first decision':>15}  {'repeat decisions':>17}")
+    for label, table_size in (("off", 0), ("on", 4096)):
+        ai = LookaheadAI(budget=10.0, table_size=table_size)  # bounded by samples, not time
+        first = timeit.timeit(lambda: ai.choose(battle, boss), number=1)
+        repeat = timeit.timeit(lambda: ai.choose(battle, boss), number=decisions) / decisions
+        print(f"{label:>6}  {first * 1000:>12.2f} ms  {repeat * 1000:>14.3f} ms")
+
+    hasher, values = ai.hash_position.zobrist, battle.unit_values()
+    changed = (values[0] - 1,) + values[1:]
+    full = min(timeit.repeat(lambda: hasher.hash_values(changed), number=10000, repeat=3)) / 10000
+    step = min(timeit.repeat(lambda: hasher.update(0, values, changed), number=10000, repeat=3)) / 10000
+    print(f"Zobrist hash of {len(values)} fields: {full * 1e6:.2f} µs full, {step * 1e6:.2f} µs incremental (one change)")
+
+
+def bench_spawn(number):
+    pool = EnemyPool()
+
+    def pooled(name):
+        pool.release(spawn_enemy(name, pool=pool))
+
+    print(f"{'enemy':<24}  {'fresh':>10}  {'pooled':>10}")
+    for name in enemy_templates:
+        fresh = min(timeit.repeat(lambda: spawn_enemy(name), number=number, repeat=5)) / number
+        reused = min(timeit.repeat(lambda: pooled(name), number=number, repeat=5)) / number
+        print(f"{name:<24}  {fresh * 1e6:>7.2f} µs  {reused * 1e6:>7.2f} µs")
+
+
+class DictUnit:
+    """A unit's attributes kept in a per-instance __dict__, the way Player and Enemy stored them before __slots__."""
+
+    def __init__(self, attrs):
+        for name, value in attrs.items():
+            setattr(self, name, value)
+
+
+def bytes_per_object(make, count):
+    """Memory allocated per make() call, averaged over `count` live objects."""
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    objects = [make() for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0] - start - sys.getsizeof(objects)
+    tracemalloc.stop()
+    return size / count
+
+
+def slotted_copy(unit):
+    """A new object of the unit's class sharing its attribute values (no fresh lists or strings).
+
+    The StatusSet is per unit, so the copy gets its own and it is counted.
+    """
+    clone = object.__new__(type(unit))
+    for cls in type(unit).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if hasattr(unit, name):
+                setattr(clone, name, getattr(unit, name))
+    clone.status = StatusSet()
+    return clone
+
+
+def bench_memory(count):
+    rng = random.Random(0)
+    units = [party_classes[job](job, rng) for job in party_classes]
+    units += [spawn_enemy(name) for name in enemy_templates]
+    print(f"{'unit':<24}  {'fields':>6}  {'__dict__':>10}  {'__slots__':>10}")
+    for unit in units:
+        attrs = attrs_of(unit)
+        before = bytes_per_object(lambda: DictUnit(attrs), count)
+        after = bytes_per_object(lambda: slotted_copy(unit), count)
+        print(f"{unit.name:<24}  {len(attrs):>6}  {before:>8.0f} B  {after:>8.0f} B")
+    print("(the unit record alone; attribute values such as spell lists are shared and not counted)")
+
+
+def bench_status(count):
+    # A third of the units carry effects, each one on about 30% of them; sanity anywhere in 0-100
+    rng = np.random.default_rng(0)
+    status = StatusArrays(count)
+    sick = np.flatnonzero(rng.random(count) < 1 / 3)
+    for effect in range(len(EFFECT_NAMES)):
+        idx = sick[rng.random(sick.size) < 0.3]
+        status.set(idx, effect, rng.integers(1, effects[EFFECT_NAMES[effect]].turns + 2, idx.size))
+    hp = np.full(count, 100, np.int32)
+    sanity = rng.integers(0, 101, count, dtype=np.int32)
+    masks, turns = status.mask.copy(), status.turns.copy()
+
+    def tick():  # a tick spends turns, so every run starts from the same effects (the copy is timed too)
+        status.mask[:], status.turns[:] = masks, turns
+        status.tick(hp, sanity, rng)
+
+    def check():
+        status.sanity_check(hp, sanity, rng)
+
+    vector = min(timeit.repeat(tick, number=1, repeat=5))
+    vector_sanity = min(timeit.repeat(check, number=1, repeat=5))
+
+    # The scalar engine on Player objects with the same effects, timed on a slice and scaled up
+    sample = min(count, 20000)
+    players = [party_classes["Tank"]("Hero", random.Random(0)) for _ in range(sample)]
+    for player, mask, t, san in zip(players, masks, turns.T, sanity):
+        player.status.mask, player.status.turns[:] = int(mask), t.tolist()
+        player.sanity = int(san)
+    sink, py_rng = NullSink(), random.Random(0)
+    loop = timeit.timeit(lambda: [handle_status_effects(p, sink=sink, rng=py_rng) for p in players], number=1)
+    loop_sanity = timeit.timeit(lambda: [handle_sanity_effects(p, sink=sink, rng=py_rng) for p in players], number=1)
+
+    scale = count / sample
+    print(f"{count:,} units, {sick.size:,} with effects")
+    print(f"{'':>14}  {'StatusArrays':>14}  {'Player loop':>14}")
+    print(f"{'status tick':>14}  {vector * 1000:>11.1f} ms  {loop * scale * 1000:>11.0f} ms")
+    print(f"{'sanity check':>14}  {vector_sanity * 1000:>11.1f} ms  {loop_sanity * scale * 1000:>11.0f} ms")
+    print(f"(the Player loop is timed on {sample:,} units and scaled up)")
+
+
+def bench_rows(sizes, number):
+    print(f"{'units':>6}  {'rendered':>16}  {'cached':>16}  {'one unit hit':>16}")
+    for units in sizes:
+        battle = build_battle(units)
+        combatants = [(unit, unit in battle.enemies) for unit in battle.players + battle.enemies]
+
+        def fresh():
+            for unit, is_enemy in combatants:
+                combat_unit_row(unit, is_enemy, False)
+
+        def cached():
+            for unit, is_enemy in combatants:
+                unit_row(unit, combat_unit_row, is_enemy, False)
+
+        def one_hit():  # the usual round: one unit changed, the rest drawn from cache
+            target = combatants[0][0]
+            target.hp = target.hp - 1 if target.hp > 1 else target.max_hp
+            cached()
+
+        cached()
+        assert all(unit_row(u, combat_unit_row, e, False) == combat_unit_row(u, e, False) for u, e in combatants)
+        timings = [min(timeit.repeat(f, number=number, repeat=5)) / number for f in (fresh, cached, one_hit)]
+        print(f"{units:>6}  " + "  ".join(f"{per_unit(t, units):>16}" for t in timings))
+
+
+def bench_inventory(pickups):
+    """Every encounter drop, then the Silver Key check made on each room move, as a run goes on."""
+    rng = random.Random(0)
+    potions = [item for item in item_lookup.values() if item.item_type in ("healing", "mana")]
+    drops = [rng.choice(potions) for _ in range(pickups)]
+
+    def as_list():  # what random_encounter and traverse_dungeon did with the list of dicts
+        stash = []
+        for item in drops:
+            stash.append({"item": item, "qty": 1})
+            any(entry["item"].name == "Silver Key" for entry in stash)
+        return len(stash)
+
+    def as_inventory():
+        stash = Inventory()
+        for item in drops:
+            stash.add(item)
+            "Silver Key" in stash
+        return len(stash)
+
+    print(f"{pickups} pickups: the list ends with {as_list()} entries, the Inventory with {as_inventory()} stacks")
+    for label, run in (("list of dicts", as_list), ("Inventory", as_inventory)):
+        seconds = min(timeit.repeat(run, number=1, repeat=3))
+        print(f"{label:>14}  {seconds * 1000:>9.2f} ms  ({seconds / pickups * 1e6:.2f} µs per pickup + key check)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time engine hot paths.")
+    parser.add_argument("bench", choices=["snapshot", "transposition", "spawn", "memory", "status", "rows", "inventory"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2, 4, 16, 64], help="combatants per battle")
+    parser.add_argument("-n", "--number", type=int, default=2000, help="calls per timing run (decisions for transposition)")
+    args = parser.parse_args()
+
+    if args.bench == "snapshot":
+        bench_snapshot(args.sizes, args.number)
+    elif args.bench == "transposition":
+        bench_transposition(min(args.number, 50))
+    elif args.bench == "spawn":
+        bench_spawn(args.number * 10)
+    elif args.bench == "memory":
+        bench_memory(args.number * 10)
+    elif args.bench == "status":
+        bench_status(args.number * 500)
+    elif args.bench == "rows":
+        bench_rows(args.sizes, args.number)
+    elif args.bench == "inventory":
+        bench_inventory(args.number)
+
+
+if __name__ == "__main__":
+    main()
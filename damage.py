@@ -0,0 +1,74 @@
+# damage.py
+"""The one damage formula: roll + attack/magic power - defense/resistance, halved when defending.
+
+Melee spells hit with attack power against defense (physical damage); every
+other spell uses magic power against resistance (magical damage).
+
+resolve_hits() rolls a spell against a batch of targets and returns one Hit
+per target without touching anyone's HP; the caller applies the hits and
+narrates them. Batches of NUMPY_BATCH or more targets are rolled and reduced
+in one vectorized step. vector_sim runs mitigate_array() on its own rolls, so
+the simulator and the game share the same arithmetic.
+"""
+import random
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional for the game itself; small batches never need it
+    np = None
+
+NUMPY_BATCH = 64  # targets; below this the per-target loop is faster than building arrays
+
+
+@dataclass(slots=True)
+class Hit:
+    target: object
+    amount: int
+    dmg_type: str               # "physical" or "magical"
+    defended: bool = False      # True if the target's guard halved it
+
+
+def damage_stats(spell):
+    """(power attribute, armour attribute, damage type) that `spell` hits with."""
+    if spell.category == "melee":
+        return "attack_power", "defense", "physical"
+    return "magic_power", "resistance", "magical"
+
+
+def mitigate(raw, power, armor, defending=False):
+    """Damage that gets through: never negative, halved (rounded down) against a defending target."""
+    dmg = max(0, raw + power - armor)
+    return dmg // 2 if defending else dmg
+
+
+def mitigate_array(raw, power, armor, defending=False):
+    """mitigate() for NumPy arrays; any argument may be an array."""
+    dmg = np.maximum(0, raw + power - armor)
+    return dmg // np.where(defending, 2, 1)
+
+
+def resolve_hits(caster, spell, targets, rng=random, defend=True):
+    """Roll `spell` from `caster` against every target, in order, and return their Hits.
+
+    Pass defend=False for damage that ignores a raised guard (wild miscasts).
+    """
+    power_attr, armor_attr, dmg_type = damage_stats(spell)
+    power = getattr(caster, power_attr)
+    low, high = spell.damage_range
+
+    if np is not None and len(targets) >= NUMPY_BATCH:
+        # One draw from the battle rng seeds the whole batch, so big fights stay reproducible
+        raw = np.random.default_rng(rng.getrandbits(64)).integers(low, high + 1, len(targets))
+        armor = np.fromiter((getattr(t, armor_attr) for t in targets), int, len(targets))
+        defending = np.fromiter((defend and getattr(t, "defending", False) for t in targets), bool, len(targets))
+        amounts = mitigate_array(raw, power, armor, defending)
+        return [Hit(t, amount, dmg_type, guarded)
+                for t, amount, guarded in zip(targets, amounts.tolist(), defending.tolist())]
+
+    hits = []
+    for target in targets:
+        defending = defend and getattr(target, "defending", False)
+        amount = mitigate(rng.randint(low, high), power, getattr(target, armor_attr), defending)
+        hits.append(Hit(target, amount, dmg_type, defending))
+    return hits
@@ -3,15 +3,15 @@
 from colorama import Fore, Style
 from vivid_battle import start_battle
 from random_encounter import random_encounter
-from rooms import rooms_map
 from items import item_lookup
-from enemies import boss_enemy
+from enemies import spawn_enemy
 from ui_utils import post_loot_menu, cycle_party_inspect
 from items import apply_item_effect, teach_spell_to_party
 from rooms import spawn_treasure_room
+from game_state import GameState
 from status_effects import handle_status_effects
-visited_room_ids = set()
-battles_won = 0
+from status_set import afflicted
+from game_io import console
 
 # Room connection logic
 room_connections = {
@@ -43,148 +43,145 @@ room_connections = {
     26: {},  # Final boss room - no exits
 }
 
-# Cleared rooms (no repeat loot or battles)
-cleared_rooms = set()
-boss_defeated = False
+async def traverse_dungeon(players, shared_inventory, overlay=None, enemies=None, state=None, sink=console):
+    """Main dungeon crawl loop. A coroutine, like start_battle: every prompt and delay goes through `sink`.
 
-def traverse_dungeon(players, shared_inventory, overlay=None, enemies=None):
-    """Main dungeon crawl loop."""
-    global battles_won
-    current_room = 13  # Start at Room 13
+    All run state (rooms, progress, found items) lives in `state`, a fresh
+    GameState unless one is passed in, so concurrent games never share a dungeon.
+    """
+    state = state or GameState()
 
     while True:
-        room = rooms_map[current_room]
-        print(Fore.CYAN + f"\n🧭 You are now in Room {room.RoomNumber}!")
-        print(Fore.WHITE + room.RoomDescription)
+        room = state.rooms_map[state.current_room]
+        state.visited_room_ids.add(state.current_room)
+        sink.emit(Fore.CYAN + f"\n🧭 You are now in Room {room.RoomNumber}!")
+        sink.emit(Fore.WHITE + room.RoomDescription)
 
         # 🎒 Item Pickup Logic
-        if current_room not in cleared_rooms and room.contents:
-            print(Fore.YELLOW + f"\n✨ You spot an item: {', '.join(room.contents)}!")
-            pickup = input(Fore.LIGHTWHITE_EX + "Pick up the item? (Y/N): ").strip().lower()
+        if state.current_room not in state.cleared_rooms and room.contents:
+            sink.emit(Fore.YELLOW + f"\n✨ You spot an item: {', '.join(room.contents)}!")
+            pickup = (await sink.prompt(Fore.LIGHTWHITE_EX + "Pick up the item? (Y/N): ")).strip().lower()
 
             if pickup == "y":
                 for item_name in room.contents:
                     matching_item = item_lookup.get(item_name.strip())
                     if not matching_item:
-                        print(Fore.RED + f"\n⚠️  ERROR: {item_name} not found in item database.")
+                        sink.emit(Fore.RED + f"\n⚠️  ERROR: {item_name} not found in item database.")
                         continue
 
-                    existing = next((entry for entry in shared_inventory if entry["item"].name == matching_item.name), None)
-
                     if matching_item.pickup_text:
-                        print(matching_item.pickup_text)
+                        sink.emit(matching_item.pickup_text)
 
                     was_effective = False
                     if matching_item.item_type == "scroll":
-                        was_effective = teach_spell_to_party(players, matching_item)
+                        was_effective = teach_spell_to_party(players, matching_item, state, sink=sink)
                         if was_effective:
-                            print(Fore.LIGHTBLACK_EX + "The scroll fades after sharing its knowledge." + Style.RESET_ALL)
+                            sink.emit(Fore.LIGHTBLACK_EX + "The scroll fades after sharing its knowledge." + Style.RESET_ALL)
                     elif matching_item.stat_boost:
                         for player in players:
-                            if apply_item_effect(player, matching_item):
+                            if apply_item_effect(player, matching_item, sink=sink):
                                 was_effective = True
 
-                    if existing:
-                        existing["qty"] += 1
-                        print(Fore.GREEN + f"\nAnother {matching_item.name} added to the party stash! (x{existing['qty']})")
+                    stack = shared_inventory.add(matching_item)
+                    if stack.qty > 1:
+                        sink.emit(Fore.GREEN + f"\nAnother {matching_item.name} added to the party stash! (x{stack.qty})")
                     else:
-                        shared_inventory.append({"item": matching_item, "qty": 1})
-                        print(Fore.GREEN + f"\n{matching_item.name} added to the party stash!")
+                        sink.emit(Fore.GREEN + f"\n{matching_item.name} added to the party stash!")
 
                 room.contents = []
 
         # Show post-loot menu only if the room hasn't been cleared
-        if current_room not in cleared_rooms:
-            post_loot_menu(players, shared_inventory, current_room)
+        if state.current_room not in state.cleared_rooms:
+            await post_loot_menu(players, shared_inventory, state.current_room, sink=sink, rng=state.rng.combat)
 
         # ☠️ Random Encounter Check
         room.just_fought = False
-        result = random_encounter(players, current_room, shared_inventory, enemies, overlay)
+        result = await random_encounter(players, state.current_room, shared_inventory, state, enemies, overlay, sink=sink)
 
         if result == "win":
-            if current_room != 26:
-                print(Fore.CYAN + "\n🛡️ You have a brief moment to heal before moving on.")
-                post_loot_menu(players, shared_inventory, current_room)
+            if state.current_room != 26:
+                sink.emit(Fore.CYAN + "\n🛡️ You have a brief moment to heal before moving on.")
+                await post_loot_menu(players, shared_inventory, state.current_room, sink=sink, rng=state.rng.combat)
 
-            battles_won += 1
-            if battles_won >= 3:
-                treasure_room = spawn_treasure_room(battles_won, visited_room_ids)
+            state.battles_won += 1
+            if state.battles_won >= 3:
+                treasure_room = spawn_treasure_room(state)
                 if treasure_room:
-                    print(Fore.CYAN + "\n✨ A hidden treasure room has been revealed somewhere in the dungeon!" + Style.RESET_ALL)
+                    sink.emit(Fore.CYAN + "\n✨ A hidden treasure room has been revealed somewhere in the dungeon!" + Style.RESET_ALL)
 
         elif result == "lose":
-            print(Fore.RED + "\n⚔️ The dungeon consumes your party. Game over.")
+            sink.emit(Fore.RED + "\n⚔️ The dungeon consumes your party. Game over.")
             return
 
         elif result == "none":
             pass  # No battle occurred
 
                 # 🛡️ Final Boss Room
-        if current_room == 26 and not boss_defeated:
-            print(Fore.RED + Style.BRIGHT + "\n👹 You have entered the final chamber...")
+        if state.current_room == 26 and not state.boss_defeated:
+            sink.emit(Fore.RED + Style.BRIGHT + "\n👹 You have entered the final chamber...")
             if enemies is not None:
                 enemies.clear()
-                enemies.append(boss_enemy)
+                enemies.append(spawn_enemy("Avatar of Nyarlathotep", sink=sink, boss_ai=state.boss_ai))
 
-            result = start_battle(players, enemies, shared_inventory, overlay)
+            result = await start_battle(players, enemies, shared_inventory, overlay, sink=sink, rng=state.rng.combat)
 
             if result == "lose":
-                print(Fore.RED + "\n⚔️ The dungeon consumes your party. Game over.")
+                sink.emit(Fore.RED + "\n⚔️ The dungeon consumes your party. Game over.")
                 return
 
-            print(Fore.GREEN + "\n🏆 You have conquered the Dungeon of the Silver Key!")
-            print(Fore.CYAN + "\nThanks for playing! The shadows retreat... for now.")
-            boss_defeated = True
+            sink.emit(Fore.GREEN + "\n🏆 You have conquered the Dungeon of the Silver Key!")
+            sink.emit(Fore.CYAN + "\nThanks for playing! The shadows retreat... for now.")
+            state.boss_defeated = True
             return  # ⬅ This cleanly exits the game loop
 
-        if current_room != 26:
-            cleared_rooms.add(current_room)
+        if state.current_room != 26:
+            state.cleared_rooms.add(state.current_room)
 
         # 🧭 Show Movement Options
-        if current_room not in room_connections:
-            print(Fore.RED + f"\n⚠️ Room {current_room} has no known exits... The air is still." + Style.RESET_ALL)
+        if state.current_room not in room_connections:
+            sink.emit(Fore.RED + f"\n⚠️ Room {state.current_room} has no known exits... The air is still." + Style.RESET_ALL)
             available_moves = []
         else:
             # 🧭 Show Movement Options
             available_moves = []
-            if 'n' in room_connections[current_room]: available_moves.append('N')
-            if 's' in room_connections[current_room]: available_moves.append('S')
-            if 'e' in room_connections[current_room]: available_moves.append('E')
-            if 'w' in room_connections[current_room]: available_moves.append('W')
+            if 'n' in room_connections[state.current_room]: available_moves.append('N')
+            if 's' in room_connections[state.current_room]: available_moves.append('S')
+            if 'e' in room_connections[state.current_room]: available_moves.append('E')
+            if 'w' in room_connections[state.current_room]: available_moves.append('W')
 
-        print(Fore.GREEN + f"\nAvailable exits: {', '.join(available_moves)}")
-        print(Fore.LIGHTWHITE_EX + "You may also [P]arty Inspect.\n")
+        sink.emit(Fore.GREEN + f"\nAvailable exits: {', '.join(available_moves)}")
+        sink.emit(Fore.LIGHTWHITE_EX + "You may also [P]arty Inspect.\n")
 
-        move = input("Choose a direction or press 'P' to inspect party: ").strip().lower()
+        move = (await sink.prompt("Choose a direction or press 'P' to inspect party: ")).strip().lower()
 
         if move == "dev":
             try:
-                current_room = int(input("🧪 Enter room number to teleport to: "))
+                state.current_room = int(await sink.prompt("🧪 Enter room number to teleport to: "))
                 continue
             except:
-                print("❌ Invalid room.")
+                sink.emit("❌ Invalid room.")
                 continue
 
         if move == "p":
-            cycle_party_inspect(players, shared_inventory)
+            await cycle_party_inspect(players, shared_inventory, sink=sink)
             continue
 
-        if move in room_connections[current_room]:
-            current_room = room_connections[current_room][move]
+        if move in room_connections[state.current_room]:
+            state.current_room = room_connections[state.current_room][move]
 
-            # 🔁 Decrement status effects each room move
-            for player in players:
-                _ = handle_status_effects(player)
+            # 🔁 Decrement status effects each room move (afflicted players only; the rolls use the seeded combat stream)
+            for player in afflicted(players):
+                _ = handle_status_effects(player, sink=sink, rng=state.rng.combat)
 
             # 🚪 Instant Boss Portal Trigger (on room arrival)
-            if current_room == 15 and any(entry["item"].name == "Silver Key" for entry in shared_inventory):
-                print(Fore.MAGENTA + "\nThe Silver Key vibrates violently! A portal opens...")
-                input(Fore.LIGHTCYAN_EX + "\nPress [Enter] to step into the portal...\n")
-                current_room = 26  # Teleport to final boss room
+            if state.current_room == 15 and "Silver Key" in shared_inventory:
+                sink.emit(Fore.MAGENTA + "\nThe Silver Key vibrates violently! A portal opens...")
+                await sink.prompt(Fore.LIGHTCYAN_EX + "\nPress [Enter] to step into the portal...\n")
+                state.current_room = 26  # Teleport to final boss room
                 continue  # Jump to next loop to process Room 26 immediately
 
 
         else:
-            print(Fore.RED + "\n⚠️ Invalid move. Try again.")
+            sink.emit(Fore.RED + "\n⚠️ Invalid move. Try again.")
             continue
 
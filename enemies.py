@@ -1,66 +1,134 @@
 # enemies.py
 import random
+from bisect import bisect_right
+from dataclasses import dataclass
 from colorama import Fore, Style
 from spells import spell_lookup
 from colorama import Fore
 from ui_utils import render_bar
+from game_io import console
+from damage import resolve_hits
+from status_set import StatusHolder, StatusSet
 
-class Enemy:
-    def __init__(self, name, hp, mp, speed, attack_power, magic_power,
-                 defense=0, resistance=0, spells=None, description=""):
-        self.name = name
-        self.hp = hp
-        self.max_hp = hp
-        self.mp = mp
-        self.max_mp = mp
-        self.speed = speed
-        self.attack_power = attack_power
-        self.magic_power = magic_power
-        self.defense = defense
-        self.resistance = resistance
-        self.spells = spells or []
-        self.description = description
+class ActionTable:
+    """An enemy's spells sorted into buckets once, so picking an action is a bisect and a lookup.
+
+    affordable(mp) and healing(mp) return the spells castable with `mp`, in
+    spell-list order (so rng.choice picks exactly as a scan would); melee and
+    zero_cost are the fallbacks. AI policies can query it too.
+    """
+
+    def __init__(self, spells):
+        self.spells = tuple(spells)
+        self.melee = tuple(s for s in self.spells if s.category == "melee")
+        self.zero_cost = tuple(s for s in self.spells if s.cost == 0)
+        self._costs, self._affordable = self._by_cost(self.spells)
+        self._heal_costs, self._healing = self._by_cost([s for s in self.spells if s.category == "heal"])
+
+    @staticmethod
+    def _by_cost(spells):
+        """Sorted distinct costs, and for each one the spells costing no more than it."""
+        costs = sorted({s.cost for s in spells})
+        return costs, [tuple(s for s in spells if s.cost <= cost) for cost in costs]
+
+    @staticmethod
+    def _lookup(costs, buckets, mp):
+        i = bisect_right(costs, mp)
+        return buckets[i - 1] if i else ()
+
+    def affordable(self, mp):
+        return self._lookup(self._costs, self._affordable, mp)
+
+    def healing(self, mp):
+        return self._lookup(self._heal_costs, self._healing, mp)
+
+
+@dataclass(frozen=True, slots=True)
+class EnemyTemplate:
+    """What every enemy of one kind shares, compiled once: stats, resolved Spells and the action table."""
+    name: str
+    hp: int
+    mp: int
+    speed: int
+    attack_power: int
+    magic_power: int
+    defense: int
+    resistance: int
+    spells: tuple
+    description: str
+    tier: str = "normal"
+    actions: ActionTable = None
+
+    @classmethod
+    def compile(cls, data):
+        """Build a template from an enemy_templates entry, resolving its spell names."""
+        spells = tuple(spell_lookup[s] for s in data["spells"] if s in spell_lookup)
+        return cls(data["name"], data["hp"], data["mp"], data["speed"], data["attack_power"],
+                   data["magic_power"], data["defense"], data["resistance"], spells,
+                   data["description"], data.get("tier", "normal"), ActionTable(spells))
+
+
+def _shared(field):
+    """A read-only Enemy attribute served by its template."""
+    return property(lambda self: getattr(self.template, field))
+
+
+class Enemy(StatusHolder):
+    """One enemy in play: a shared EnemyTemplate plus the state that changes while it fights."""
+
+    name = _shared("name")
+    max_hp = _shared("hp")
+    max_mp = _shared("mp")
+    speed = _shared("speed")
+    attack_power = _shared("attack_power")
+    magic_power = _shared("magic_power")
+    defense = _shared("defense")
+    resistance = _shared("resistance")
+    spells = _shared("spells")
+    actions = _shared("actions")
+    description = _shared("description")
+
+    __slots__ = ("template", "hp", "mp", "ai", "status", "view")  # view: unit_view.UnitView, made on first draw
+
+    def __init__(self, template):
+        self.template = template
+        self.reset()
+
+    def reset(self):
+        """Back to full HP/MP with no statuses and no AI, as if freshly spawned."""
+        template = self.template
+        self.hp = template.hp
+        self.mp = template.mp
+        self.ai = None  # optional decision maker (enemy_ai.LookaheadAI) used instead of choose_action
         # Mental and physical status effects
-        self.is_confused = False
-        self.is_feared = False
-        self.is_insane = False
-        self.is_mindfired = False
-        self.is_bleeding = False
-        self.is_stunned = False
-        self.mindfire_turns = 0
-        self.bleeding_turns = 0
-        self.mental_resistance_turns = 0
-        self.confusion_turns = 0
-        self.fear_turns = 0
-        self.madness_turns = 0
+        self.status = StatusSet()
 
     def is_alive(self):
         return self.hp > 0
 
-    def display_bars(self):
+    def display_bars(self, sink=console):
         hp_bar = render_bar("HP", self.hp, self.max_hp, Fore.RED, bar_width=25)
-        print(f"{self.name:<15} {hp_bar}")
-        print()  # Adds vertical spacing between enemies
+        sink.emit(f"{self.name:<15} {hp_bar}")
+        sink.emit()  # Adds vertical spacing between enemies
 
-    def choose_action(self):
+    def choose_action(self, rng=random):
+        actions = self.actions
         if self.hp < (0.4 * self.max_hp):
-            healing_spells = [s for s in self.spells if s.category == "heal" and s.cost <= self.mp]
+            healing_spells = actions.healing(self.mp)
             if healing_spells:
-                return "spell", random.choice(healing_spells)
+                return "spell", rng.choice(healing_spells)
 
-        affordable_spells = [s for s in self.spells if s.cost <= self.mp]
-        if affordable_spells and random.random() < 0.6:
-            return "spell", random.choice(affordable_spells)
+        affordable_spells = actions.affordable(self.mp)
+        if affordable_spells and rng.random() < 0.6:
+            return "spell", rng.choice(affordable_spells)
 
         # Use melee spell as fallback (no longer "attack")
-        melee_spells = [s for s in self.spells if s.category == "melee"]
-        if melee_spells:
-            return "spell", random.choice(melee_spells)
+        if actions.melee:
+            return "spell", rng.choice(actions.melee)
 
         # Absolute fallback (some 0-cost magic spell, or default behavior)
-        zero_cost_spells = [s for s in self.spells if s.cost == 0]
-        if zero_cost_spells:
-            return "spell", random.choice(zero_cost_spells)
+        if actions.zero_cost:
+            return "spell", rng.choice(actions.zero_cost)
 
         return "skip", None  # nothing usable
 
@@ -75,88 +143,11 @@ class Enemy:
         self.hp = max(0, self.hp - reduced)
         return reduced
 
-    def cast_spell(self, spell, target):
+    def cast_spell(self, spell, target, rng=random):
         self.mp -= spell.cost
-        base_dmg = random.randint(*spell.damage_range)
-        total_dmg = base_dmg + self.magic_power
-        reduced_dmg = max(0, total_dmg - target.resistance)
-        target.hp = max(0, target.hp - reduced_dmg)
-        return reduced_dmg
-
-# ------------------------------------
-# 🎭 Enemy List
-# ------------------------------------
-
-lesser_spawn = Enemy(
-    name="Lesser Spawn", hp=60, mp=20, speed=25, # MP Currently unused; reserved for future spell expansion
-    attack_power=12, magic_power=8, defense=2, resistance=3,
-    spells=[spell_lookup["Claw"], spell_lookup["Unsettling Gaze"], spell_lookup["Sanguine Pounce"]],
-    description="A twisted horror, vaguely humanoid, dripping with ichor."
-)
-
-shoggoth = Enemy(
-    name="Shoggoth", hp=90, mp=50, speed=15, 
-    attack_power=16, magic_power=18, defense=6, resistance=10,
-    spells=[spell_lookup["Void Bolt"], spell_lookup["Engulf"], spell_lookup["Mutilate"], spell_lookup["Unsettling Gaze"], spell_lookup["Cosmic Vampirism"]],
-    description="A roiling mass of eyes and mouths, oozing through the cracks of the dungeon."
-)
-
-moon_beast = Enemy(
-    name="Moon-Beast", hp=120, mp=55, speed=20,
-    attack_power=20, magic_power=20, defense=5, resistance=8,
-    spells=[spell_lookup["Void Bolt"], spell_lookup["Eldritch Flame"], spell_lookup["Bite"], spell_lookup["Tear"], spell_lookup["Snap"]],
-    description="A bloated monstrosity that shambles forward, guided by unseen forces."
-)
-
-clay_golem = Enemy(
-    name="Clay Golem", hp=100, mp=0, speed=10,
-    attack_power=25, magic_power=0, defense=12, resistance=3,
-    spells=[spell_lookup["Pummel"], spell_lookup["Smash"], spell_lookup["Stomp"]],
-    description="A hulking mass of hardened clay, cracks running deep in its body."
-)
-
-hunting_horror = Enemy(
-    name="Hunting Horror", hp=80, mp=30, speed=30,
-    attack_power=18, magic_power=10, defense=4, resistance=5,
-    spells=[spell_lookup["Void Bolt"], spell_lookup["Tentacle Swipe"], spell_lookup["Hypnotic Gaze"]],
-    description="A long, sinewy creature that slithers silently through shadowed halls."
-)
-
-flying_polyp = Enemy(
-    name="Flying Polyp", hp=75, mp=65, speed=35,
-    attack_power=14, magic_power=22, defense=2, resistance=12,
-    spells=[spell_lookup["Bite"], spell_lookup["Void Bolt"], spell_lookup["Fireball"], spell_lookup["Cosmic Wind"], spell_lookup["Unnerving Aura"], spell_lookup["Foul Affliction"], spell_lookup["Horrific Wail"]],
-    description="A formless terror that whips the air with invisible appendages."
-)
-
-dimensional_shambler = Enemy(
-    name="Dimensional Shambler", hp=95, mp=30, speed=28,
-    attack_power=22, magic_power=15, defense=5, resistance=6,
-    spells=[spell_lookup["Void Bolt"], spell_lookup["Strangle"], spell_lookup["Eviscerate"], spell_lookup["Unsettling Gaze"]],
-    description="An aberrant being phasing in and out of existence."
-)
-
-# ------------------------------------
-# 👑 Final Boss
-# ------------------------------------
-
-boss_enemy = Enemy(
-    name="Avatar of Nyarlathotep", hp=450, mp=150, speed=40,
-    attack_power=30, magic_power=35, defense=10, resistance=15,
-    spells=[
-        spell_lookup["Abyssal Grasp"],
-        spell_lookup["Void Bolt"],
-        spell_lookup["Fireball"],
-        spell_lookup["Eldritch Flame"],
-        spell_lookup["Arcane Cataclysm"],
-        spell_lookup["Cursed Blow"],
-        spell_lookup["Gaze of the Abyss"],
-        spell_lookup["Hypnotic Gaze"],
-        spell_lookup["Dread Aura"],
-        spell_lookup["Curse of the Stars"]
-    ],
-    description=Fore.RED + "The Servant of the Nameless Mist, whispering promises of oblivion..." + Fore.RESET
-)
+        hit, = resolve_hits(self, spell, [target], rng)
+        target.hp = max(0, target.hp - hit.amount)
+        return hit.amount
 
 # ------------------------------------
 # 🧬 Enemy Templates
@@ -256,6 +247,7 @@ enemy_templates = {
         "magic_power": 35,
         "defense": 10,
         "resistance": 15,
+        "tier": "boss",
         "spells": [
             "Abyssal Grasp", "Void Bolt", "Fireball", "Eldritch Flame",
             "Arcane Cataclysm", "Cursed Blow", "Gaze of the Abyss",
@@ -265,28 +257,44 @@ enemy_templates = {
     }
 }
 
+# Compiled once at import; every spawn shares these
+compiled_templates = {name: EnemyTemplate.compile(data) for name, data in enemy_templates.items()}
+
 # ------------------------------------
 # 🧪 Factory Function to Spawn New Enemy
 # ------------------------------------
 
-def spawn_enemy(name):
-    data = enemy_templates.get(name)
-    if not data:
-        print(Fore.RED + f"⚠️  Enemy template '{name}' not found." + Style.RESET_ALL)
+def spawn_enemy(name, sink=console, boss_ai=None, pool=None):
+    """A fresh Enemy from its compiled template (recycled from `pool` if given).
+
+    Boss-tier enemies get `boss_ai` (e.g. an enemy_ai.LookaheadAI) if given.
+    """
+    template = compiled_templates.get(name)
+    if not template:
+        sink.emit(Fore.RED + f"⚠️  Enemy template '{name}' not found." + Style.RESET_ALL)
         return None
 
-    # Translate spell names to spell objects
-    resolved_spells = [spell_lookup[s] for s in data["spells"] if s in spell_lookup]
-
-    return Enemy(
-        name=data["name"],
-        hp=data["hp"],
-        mp=data["mp"],
-        speed=data["speed"],
-        attack_power=data["attack_power"],
-        magic_power=data["magic_power"],
-        defense=data["defense"],
-        resistance=data["resistance"],
-        spells=resolved_spells,
-        description=data["description"]
-    )
+    enemy = pool.acquire(template) if pool is not None else Enemy(template)
+    if template.tier == "boss":
+        enemy.ai = boss_ai
+    return enemy
+
+
+class EnemyPool:
+    """Spent Enemy objects kept per template and reset for the next spawn_enemy(..., pool=pool)."""
+
+    def __init__(self):
+        self._free = {}
+
+    def acquire(self, template):
+        free = self._free.get(template.name)
+        if free:
+            enemy = free.pop()
+            enemy.reset()
+            return enemy
+        return Enemy(template)
+
+    def release(self, *enemies):
+        """Hand enemies back once their fight is over; nothing else may still hold them."""
+        for enemy in enemies:
+            self._free.setdefault(enemy.template.name, []).append(enemy)
@@ -0,0 +1,127 @@
+# enemy_ai.py
+"""Lookahead AI for boss-tier enemies: Monte Carlo expectimax under a hard time budget.
+
+Every candidate move (a spell, plus a target for single-target spells) is a
+chance node. The AI plays the move out on the live battle through the real
+engine (vivid_battle.enemy_cast) with a silent sink and a throwaway rng,
+scores the position, and rolls everything back with Battle.snapshot() and
+restore(). Moves are sampled round-robin, so each gets an even share of the
+budget, and when the deadline arrives the move with the best average score so
+far is played.
+
+Results are kept in a transposition table keyed on the Zobrist hash of the
+position, so when a position comes round again (every battle against the
+same party opens the same way) the search picks up where it left off, and
+a move already sampled `samples_per_move` times is answered at once.
+
+Before each sample the AI checks that one more (at the slowest cost seen so
+far) and the final rollback still fit before the deadline, so decisions finish
+inside the budget unless a sample stalls or the process is starved of CPU. `stats` counts decisions, samples, total and worst
+decision time and budget overruns; summary() formats them for a log line.
+"""
+import random
+import time
+
+from game_io import NullSink, run_sync
+from spell_handlers import FIZZLED
+from transposition import PositionHasher, TranspositionTable
+from vivid_battle import enemy_cast
+
+DEFAULT_BUDGET = 0.020  # seconds per decision
+
+
+def evaluate(battle, enemy):
+    """How good the position is for the enemy side (higher is better)."""
+    score = 0.5 * enemy.hp / enemy.max_hp
+    for p in battle.players:
+        if p.hp <= 0:
+            score += 2.0
+            continue
+        score += 1 - p.hp / p.max_hp
+        score += 0.3 * (1 - p.sanity / 100)
+        score += 0.15 * (p.is_confused + p.is_feared + p.is_insane + p.is_stunned)
+        score += 0.1 * (p.is_bleeding + p.is_mindfired)
+    return score
+
+
+class LookaheadAI:
+    """Chooses an enemy's (spell, target) by sampling each option on the real engine."""
+
+    def __init__(self, budget=DEFAULT_BUDGET, samples_per_move=64, table_size=4096):
+        self.budget = budget
+        self.samples_per_move = samples_per_move  # stop early once every move has this many
+        self.table = TranspositionTable(table_size)
+        self.hash_position = PositionHasher()
+        self.stats = {"decisions": 0, "samples": 0, "total_time": 0.0, "worst_time": 0.0, "overruns": 0}
+
+    def moves(self, battle, enemy):
+        alive = [p for p in battle.players if p.hp > 0]
+        if not alive:
+            return []
+        moves = []
+        for spell in enemy.actions.affordable(enemy.mp):
+            moves.extend((spell, target) for target in (alive[:1] if spell.is_aoe else alive))
+        return moves
+
+    def choose(self, battle, enemy):
+        """Best (spell, target) found within the budget, or None to fall back on choose_action."""
+        start = time.perf_counter()
+        deadline = start + self.budget
+        moves = self.moves(battle, enemy)
+        if not moves:
+            return None
+
+        key = (self.hash_position(battle), battle.enemies.index(enemy))
+        entry = self.table.get(key)
+        if entry is None or len(entry[0]) != len(moves):
+            entry = ([0.0] * len(moves), [0] * len(moves))
+        totals, counts = entry
+        done = sum(counts)  # samples already taken in this position on earlier turns
+        saved = battle.snapshot()
+        real_sink, real_rng = battle.sink, battle.rng
+        battle.sink, battle.rng = NullSink(), random.Random()
+        samples = 0
+        longest = 0.0  # slowest sample so far
+        now = time.perf_counter()
+        try:
+            while done + samples < self.samples_per_move * len(moves):
+                if samples and now + 2 * longest > deadline:
+                    break  # another sample plus the final rollback could overshoot the budget
+                i = (done + samples) % len(moves)
+                spell, target = moves[i]
+                battle.rng.seed(done + samples)  # restore() rewound it to the real state; draw fresh luck
+                outcome = run_sync(enemy_cast(battle, enemy, spell, target))
+                value = evaluate(battle, enemy)
+                if outcome == FIZZLED:
+                    value -= 0.5  # the enemy side also loses the rest of the round
+                totals[i] += value
+                counts[i] += 1
+                samples += 1
+                battle.restore(saved)
+                sampled, now = now, time.perf_counter()
+                longest = max(longest, now - sampled)
+        finally:
+            battle.sink, battle.rng = real_sink, real_rng
+            battle.restore(saved)
+        self.table.put(key, entry)
+
+        best = max((i for i in range(len(moves)) if counts[i]), key=lambda i: totals[i] / counts[i])
+        self._record(time.perf_counter() - start, samples)
+        return moves[best]
+
+    def _record(self, elapsed, samples):
+        stats = self.stats
+        stats["decisions"] += 1
+        stats["samples"] += samples
+        stats["total_time"] += elapsed
+        stats["worst_time"] = max(stats["worst_time"], elapsed)
+        stats["overruns"] += elapsed > self.budget
+
+    def summary(self):
+        s = self.stats
+        if not s["decisions"]:
+            return f"lookahead AI: no decisions yet (budget {self.budget * 1000:.0f} ms)"
+        return (f"lookahead AI: {s['decisions']} decisions, {s['samples'] / s['decisions']:.0f} samples each, "
+                f"mean {s['total_time'] / s['decisions'] * 1000:.1f} ms, worst {s['worst_time'] * 1000:.1f} ms, "
+                f"{s['overruns']} over the {self.budget * 1000:.0f} ms budget, "
+                f"{self.table.hits} of {self.table.hits + self.table.misses} positions seen before")
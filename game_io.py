@@ -0,0 +1,208 @@
+# game_io.py
+"""Everything the game shows or asks goes through a GameIO ("sink").
+
+    emit(text)        show a line of text
+    await prompt(t)   show t and return the player's next line of input
+    await pause(s)    pacing delay for dramatic effect
+    event(e)          a typed battle event (battle_events), narrated by text sinks
+    begin_round(n)    hook called at the top of every battle round
+    renders           False if the output is thrown away (skip building it)
+
+Implementations: ConsoleSink (keyboard and terminal), ScriptedSink (answers
+from a list or file), SocketSink (one TCP connection), NullSink (headless).
+"""
+import asyncio
+import re
+import time
+
+
+class GameIO:
+    renders = True
+    renderer = None
+
+    def emit(self, text=""):
+        raise NotImplementedError
+
+    def event(self, event):
+        """A battle event (see battle_events); text sinks narrate it via a TextRenderer."""
+        if self.renderer is None:
+            from battle_render import TextRenderer  # avoid circular imports
+            self.renderer = TextRenderer()
+        self.renderer.render(event, self)
+
+    async def prompt(self, text=""):
+        raise NotImplementedError
+
+    async def pause(self, seconds):
+        pass
+
+    def begin_round(self, number):
+        pass
+
+
+class ConsoleSink(GameIO):
+    """Default output: prints game text to the terminal and honours pacing delays."""
+
+    def emit(self, text=""):
+        print(text)
+
+    async def prompt(self, text=""):
+        return input(text)
+
+    async def pause(self, seconds):
+        time.sleep(seconds)
+
+
+class NullSink(GameIO):
+    """Headless output: drops all text and skips every delay."""
+    renders = False
+
+    def emit(self, text=""):
+        pass
+
+    def event(self, event):
+        pass
+
+    async def prompt(self, text=""):
+        return ""
+
+
+class ListSink(GameIO):
+    """Headless output that keeps the text (useful for debugging simulated battles)."""
+
+    def __init__(self):
+        self.lines = []
+        self.rounds = 0
+
+    def emit(self, text=""):
+        self.lines.append(text)
+
+    async def prompt(self, text=""):
+        return ""
+
+    def begin_round(self, number):
+        self.rounds = number
+
+
+class ScriptExhausted(EOFError):
+    pass
+
+
+class ScriptedSink(ListSink):
+    """Answers every prompt from a prepared list of inputs and keeps the transcript.
+
+    Pass `echo` (e.g. console) to also show the text and the scripted answers.
+    Raises ScriptExhausted when the game asks for more input than the script has.
+    """
+
+    def __init__(self, answers, echo=None):
+        super().__init__()
+        self.answers = list(answers)
+        self.prompts = 0
+        self.echo = echo
+
+    @classmethod
+    def from_file(cls, path, echo=None):
+        with open(path, encoding="utf-8") as f:
+            return cls(f.read().splitlines(), echo)
+
+    def emit(self, text=""):
+        self.lines.append(text)
+        if self.echo:
+            self.echo.emit(text)
+
+    async def prompt(self, text=""):
+        self.lines.append(text)
+        if self.prompts >= len(self.answers):
+            raise ScriptExhausted(f"script ran out after {self.prompts} answers")
+        answer = self.answers[self.prompts]
+        self.prompts += 1
+        if self.echo:
+            self.echo.emit(text + answer)
+        return answer
+
+
+class AsyncSink(GameIO):
+    """Output for a session hosted on an event loop.
+
+    `write(text)` sends text to the player and `read_line()` is a coroutine
+    returning their next line of input. Prompts and pacing delays are awaited,
+    so one loop can run many sessions side by side. `pace` scales every delay.
+    """
+
+    def __init__(self, write, read_line, pace=1.0):
+        self.write = write
+        self.read_line = read_line
+        self.pace = pace
+
+    def emit(self, text=""):
+        self.write(text + "\n")
+
+    async def prompt(self, text=""):
+        self.write(text)
+        return await self.read_line()
+
+    async def pause(self, seconds):
+        await asyncio.sleep(seconds * self.pace)
+
+
+class ConnectionClosed(Exception):
+    pass
+
+
+TELNET_COMMAND = re.compile(rb"\xff[\xfb-\xfe].|\xff[\xf0-\xfa]", re.DOTALL)
+
+
+class SocketSink(AsyncSink):
+    """Game output for one asyncio stream connection, buffered until the game next waits."""
+
+    def __init__(self, reader, writer, pace=1.0, idle_timeout=None):
+        super().__init__(self._buffer_text, self._read_line, pace)
+        self.reader = reader
+        self.writer = writer
+        self.idle_timeout = idle_timeout
+        self._buffer = []
+
+    def _buffer_text(self, text):
+        self._buffer.append(text)
+
+    async def flush(self):
+        if not self._buffer:
+            return
+        data = "".join(self._buffer).replace("\n", "\r\n")
+        self._buffer.clear()
+        self.writer.write(data.encode())
+        await self.writer.drain()
+
+    async def _read_line(self):
+        line = await asyncio.wait_for(self.reader.readline(), self.idle_timeout)
+        if not line:
+            raise ConnectionClosed()
+        return TELNET_COMMAND.sub(b"", line).decode(errors="replace").rstrip("\r\n")
+
+    async def prompt(self, text=""):
+        self.write(text)
+        await self.flush()
+        return await self.read_line()
+
+    async def pause(self, seconds):
+        await self.flush()
+        await super().pause(seconds)
+
+
+def run_sync(coro):
+    """Run a game coroutine to completion without an event loop.
+
+    Console, scripted and headless sinks never actually suspend, so the whole
+    battle or dungeon runs in a single step. Sessions that really wait
+    (AsyncSink, SocketSink) must be awaited on an event loop instead.
+    """
+    try:
+        coro.send(None)
+    except StopIteration as done:
+        return done.value
+    coro.close()
+    raise RuntimeError("game coroutine suspended; await it on an event loop instead")
+
+
+console = ConsoleSink()
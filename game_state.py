@@ -0,0 +1,49 @@
+# game_state.py
+import random
+from rooms import build_rooms_map
+
+START_ROOM = 13
+
+
+class RngStreams:
+    """Independent, reproducible random streams for one session.
+
+    combat      every roll inside a battle, item effects and party creation
+    loot        potion tiers, treasure rooms and bonus caches
+    encounters  whether danger appears, which horror, hazards
+
+    Each stream is seeded from (seed, name), so extra draws in one (say, a
+    longer battle) never shift what the others produce.
+    """
+    names = ("combat", "loot", "encounters")
+
+    def __init__(self, seed=None):
+        self.seed = random.randrange(2 ** 63) if seed is None else seed
+        for name in self.names:
+            setattr(self, name, random.Random(f"{self.seed}:{name}"))
+
+
+class GameState:
+    """Everything one playthrough mutates: rooms, progress and collected unique items.
+
+    Each session gets its own GameState, so several games can share one
+    interpreter without stepping on each other's dungeon. Pass a seed to make
+    the run reproducible; `rng.seed` records the one chosen otherwise.
+    """
+
+    def __init__(self, seed=None):
+        self.rng = RngStreams(seed)
+        self.rooms_map = build_rooms_map()
+        self.current_room = START_ROOM
+        self.cleared_rooms = set()     # no repeat loot or battles
+        self.visited_room_ids = set()
+        self.battles_won = 0
+        self.boss_defeated = False
+        self.found_items = set()       # names of unique items already collected
+        self.boss_ai = None            # optional enemy_ai.LookaheadAI driving the final boss
+
+    def is_found(self, item):
+        return item.name in self.found_items
+
+    def mark_found(self, item):
+        self.found_items.add(item.name)
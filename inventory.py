@@ -0,0 +1,97 @@
+# inventory.py
+"""The party stash: one stack per item, indexed by name.
+
+Stacks are listed in the order their item was first picked up (a stack that
+runs out and comes back goes to the end, as before), and every lookup,
+pickup and use is a dict operation, however long the run. Menus number the
+stacks from 1, so inventory[i] is the (i+1)-th stack in that order.
+
+    stash = Inventory()
+    stash.add(item_lookup["Health Potion"])     # -> Stack(item, qty=1), or +1 on the stack
+    "Silver Key" in stash
+    stash.healing                               # the healing stacks, in display order
+    stash.remove(item)                          # one used; the stack goes at 0
+"""
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class Stack:
+    item: object
+    qty: int = 1
+
+
+class Inventory:
+    def __init__(self, items=()):
+        self._stacks = {}   # item name -> Stack, in display order
+        self._by_type = {}  # item_type -> {item name: Stack}, in the same order
+        self._listing = None  # tuple of the stacks, rebuilt when one is added or emptied
+        for item in items:
+            self.add(item)
+
+    def __len__(self):
+        return len(self._stacks)
+
+    def __iter__(self):
+        return iter(self._stacks.values())
+
+    def __contains__(self, name):
+        return name in self._stacks
+
+    def __getitem__(self, index):
+        return self.stacks()[index]
+
+    def stacks(self):
+        """Every stack, in display order."""
+        if self._listing is None:
+            self._listing = tuple(self._stacks.values())
+        return self._listing
+
+    def get(self, name):
+        return self._stacks.get(name)
+
+    def qty(self, name):
+        stack = self._stacks.get(name)
+        return stack.qty if stack else 0
+
+    def add(self, item, qty=1):
+        """Put `qty` of `item` in the stash, on its stack if it has one; returns the stack."""
+        stack = self._stacks.get(item.name)
+        if stack:
+            stack.qty += qty
+            return stack
+        stack = self._stacks[item.name] = Stack(item, qty)
+        self._by_type.setdefault(item.item_type, {})[item.name] = stack
+        self._listing = None
+        return stack
+
+    def remove(self, item, qty=1):
+        """Take `qty` of `item` out (used up); an emptied stack leaves the list. Returns what is left."""
+        stack = self._stacks[item.name]
+        stack.qty -= qty
+        if stack.qty <= 0:
+            del self._stacks[item.name]
+            del self._by_type[item.item_type][item.name]
+            self._listing = None
+            return 0
+        return stack.qty
+
+    def of_type(self, item_type):
+        """The stacks of one item_type, in display order."""
+        return tuple(self._by_type.get(item_type, {}).values())
+
+    @property
+    def healing(self):
+        return self.of_type("healing")
+
+    @property
+    def mana(self):
+        return self.of_type("mana")
+
+    @property
+    def attack(self):
+        return self.of_type("attack")
+
+    @property
+    def scroll(self):
+        return self.of_type("scroll")
@@ -3,6 +3,7 @@
 from colorama import Fore, Style
 from spells import spell_lookup
 from status_effects import try_inflict_status
+from game_io import console
 
 class Item:
     def __init__(self, name, description, item_type="misc",
@@ -21,20 +22,19 @@ class Item:
         self.pickup_text = pickup_text
         self.unique = unique
         self.effect = effect
-        self.found = False if unique else None
 
-    def inspect_item(self):
-        print(Fore.CYAN + f"\n{self.name}: {self.description}" + Style.RESET_ALL)
+    def inspect_item(self, sink=console):
+        sink.emit(Fore.CYAN + f"\n{self.name}: {self.description}" + Style.RESET_ALL)
         if self.heal_range:
-            print(Fore.GREEN + f"• Heals: {self.heal_range[0]}-{self.heal_range[1]} HP" + Style.RESET_ALL)
+            sink.emit(Fore.GREEN + f"• Heals: {self.heal_range[0]}-{self.heal_range[1]} HP" + Style.RESET_ALL)
         if self.mana_restore:
-            print(Fore.BLUE + f"• Restores: {self.mana_restore} MP" + Style.RESET_ALL)
+            sink.emit(Fore.BLUE + f"• Restores: {self.mana_restore} MP" + Style.RESET_ALL)
         if self.damage_range:
-            print(Fore.RED + f"• Deals: {self.damage_range[0]}-{self.damage_range[1]} damage" + Style.RESET_ALL)
+            sink.emit(Fore.RED + f"• Deals: {self.damage_range[0]}-{self.damage_range[1]} damage" + Style.RESET_ALL)
         if self.stat_boost:
-            print(Fore.YELLOW + f"• Boosts stats by {self.stat_boost}" + Style.RESET_ALL)
+            sink.emit(Fore.YELLOW + f"• Boosts stats by {self.stat_boost}" + Style.RESET_ALL)
         if self.teaches_spell:
-            print(Fore.MAGENTA + f"• Teaches Spell: {self.teaches_spell}" + Style.RESET_ALL)
+            sink.emit(Fore.MAGENTA + f"• Teaches Spell: {self.teaches_spell}" + Style.RESET_ALL)
 
 # Add these references at the bottom to support lookup
 item_lookup = {}
@@ -46,7 +46,7 @@ def register_item(item, aliases=None):
             item_lookup[alias] = item
     return item
 
-def apply_item_effect(player, item):
+def apply_item_effect(player, item, sink=console):
     """Apply immediate stat boosts or teach a spell (if applicable)."""
     effect_applied = False
 
@@ -55,57 +55,57 @@ def apply_item_effect(player, item):
         for stat, value in item.stat_boost.items():
             if hasattr(player, stat):
                 setattr(player, stat, getattr(player, stat) + value)
-                print(Fore.YELLOW + f"{player.name}'s {stat} increased by {value}!" + Style.RESET_ALL)
+                sink.emit(Fore.YELLOW + f"{player.name}'s {stat} increased by {value}!" + Style.RESET_ALL)
                 effect_applied = True
 
     # Spell-teaching (single target, e.g., outside battle use)
     if item.teaches_spell:
         spell = spell_lookup.get(item.teaches_spell)
         if not spell:
-            print(Fore.RED + "⚠️ This scroll seems damaged or incomplete." + Style.RESET_ALL)
+            sink.emit(Fore.RED + "⚠️ This scroll seems damaged or incomplete." + Style.RESET_ALL)
             return effect_applied
 
         if player.job not in spell.allowed_classes:
-            print(Fore.RED + f"{player.name} cannot learn {spell.name} (wrong class)." + Style.RESET_ALL)
+            sink.emit(Fore.RED + f"{player.name} cannot learn {spell.name} (wrong class)." + Style.RESET_ALL)
         elif spell in player.spells:
-            print(Fore.LIGHTBLUE_EX + f"{player.name} already knows {spell.name}." + Style.RESET_ALL)
+            sink.emit(Fore.LIGHTBLUE_EX + f"{player.name} already knows {spell.name}." + Style.RESET_ALL)
         else:
             player.spells.append(spell)
-            print(Fore.YELLOW + f"\n✨ {player.name} has learned the spell: {spell.name}!" + Style.RESET_ALL)
+            sink.emit(Fore.YELLOW + f"\n✨ {player.name} has learned the spell: {spell.name}!" + Style.RESET_ALL)
             effect_applied = True
 
     return effect_applied
 
 
-def teach_spell_to_party(players, item):
+def teach_spell_to_party(players, item, state, sink=console):
     """Teaches a spell to all eligible party members. Only for unique scrolls."""
     if not item.teaches_spell:
         return False
 
     spell = spell_lookup.get(item.teaches_spell)
     if not spell:
-        print(Fore.RED + f"⚠️ The spell {item.teaches_spell} could not be found." + Style.RESET_ALL)
+        sink.emit(Fore.RED + f"⚠️ The spell {item.teaches_spell} could not be found." + Style.RESET_ALL)
         return False
 
-    if item.found:
-        print(Fore.LIGHTBLACK_EX + "The scroll has already been used." + Style.RESET_ALL)
+    if state.is_found(item):
+        sink.emit(Fore.LIGHTBLACK_EX + "The scroll has already been used." + Style.RESET_ALL)
         return False
 
     taught_anyone = False
     for player in players:
         if player.job in spell.allowed_classes and spell not in player.spells:
             player.spells.append(spell)
-            print(Fore.YELLOW + f"✨ {player.name} learns the spell: {spell.name}!" + Style.RESET_ALL)
+            sink.emit(Fore.YELLOW + f"✨ {player.name} learns the spell: {spell.name}!" + Style.RESET_ALL)
             taught_anyone = True
         elif player.job in spell.allowed_classes:
-            print(Fore.LIGHTBLUE_EX + f"{player.name} already knows {spell.name}." + Style.RESET_ALL)
+            sink.emit(Fore.LIGHTBLUE_EX + f"{player.name} already knows {spell.name}." + Style.RESET_ALL)
         else:
-            print(Fore.RED + f"{player.name} cannot learn {spell.name}." + Style.RESET_ALL)
+            sink.emit(Fore.RED + f"{player.name} cannot learn {spell.name}." + Style.RESET_ALL)
 
     if not taught_anyone:
-        print(Fore.LIGHTBLACK_EX + "No one could learn from the scroll." + Style.RESET_ALL)
+        sink.emit(Fore.LIGHTBLACK_EX + "No one could learn from the scroll." + Style.RESET_ALL)
     else:
-        item.found = True
+        state.mark_found(item)
 
     return taught_anyone
 
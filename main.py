@@ -1,10 +1,16 @@
 # Main.py
+import argparse
+import random
 from colorama import Fore, Style
 from pyfiglet import Figlet
 from party_setup import setup_party
 from dungeon_traverse import traverse_dungeon
+from game_io import console, run_sync, ScriptedSink, ScriptExhausted
+from game_state import GameState
+from inventory import Inventory
+from enemy_ai import LookaheadAI
 
-def DisplayTitle():
+def DisplayTitle(sink=console):
     CustomTitle = Figlet(font='cyberlarge')
     CustomArt = """
 
@@ -15,11 +21,11 @@ def DisplayTitle():
 
     """
     Title = (CustomTitle.renderText("""DUNGEON OF THE SILVER KEY"""))
-    print(Fore.YELLOW + Title)
-    print(Fore.WHITE + CustomArt)
+    sink.emit(Fore.YELLOW + Title)
+    sink.emit(Fore.WHITE + CustomArt)
 
-def intro_text():
-    print(Fore.WHITE + """
+def intro_text(sink=console):
+    sink.emit(Fore.WHITE + """
 The entrance to the dungeon is a large, menacing crevice. On the walls, the names and messages of those
 who came before you are visible. You decide to leave a simple note, and leave your name among the hundreds
 that challenged the dungeon before you.
@@ -40,66 +46,115 @@ Note: If you choose not to, you can still view your SANITY status in combat with
 """
 
 
-def setup_game():
-    players = setup_party()
+async def setup_game(sink=console, offer_overlay=True, rng=random):
+    """Party creation and options. Returns None if the party turns back at the entrance."""
+    players = await setup_party(sink=sink, rng=rng)
 
     # 💠 Prompt to show SANITY in status bar
-    print(Fore.MAGENTA + sanity_intro_text + Style.RESET_ALL)
+    sink.emit(Fore.MAGENTA + sanity_intro_text + Style.RESET_ALL)
     while True:
-        track_sanity = input(Fore.LIGHTMAGENTA_EX + "Display sanity in party status bars? (Y/N): " + Style.RESET_ALL).strip().lower()
+        track_sanity = (await sink.prompt(Fore.LIGHTMAGENTA_EX + "Display sanity in party status bars? (Y/N): " + Style.RESET_ALL)).strip().lower()
         if track_sanity in ["y", "n"]:
             show_sanity_bar = (track_sanity == "y")
             break
         else:
-            print(Fore.YELLOW + "Please enter Y or N." + Style.RESET_ALL)
-
-    print(Fore.CYAN + "\n🧠 OPTIONAL: Enable real-time overlay UI window?" + Style.RESET_ALL)
-    while True:
-        enable_overlay_input = input(Fore.LIGHTCYAN_EX + "Enable overlay? (Y/N): " + Style.RESET_ALL).strip().lower()
-        if enable_overlay_input in ["y", "n"]:
-            enable_overlay = (enable_overlay_input == "y")
-            break
-        else:
-            print("Please enter Y or N.")
+            sink.emit(Fore.YELLOW + "Please enter Y or N." + Style.RESET_ALL)
+
+    enable_overlay = False
+    if offer_overlay:
+        sink.emit(Fore.CYAN + "\n🧠 OPTIONAL: Enable real-time overlay UI window?" + Style.RESET_ALL)
+        while True:
+            enable_overlay_input = (await sink.prompt(Fore.LIGHTCYAN_EX + "Enable overlay? (Y/N): " + Style.RESET_ALL)).strip().lower()
+            if enable_overlay_input in ["y", "n"]:
+                enable_overlay = (enable_overlay_input == "y")
+                break
+            else:
+                sink.emit("Please enter Y or N.")
 
     for player in players:
         player.show_sanity_bar = show_sanity_bar  # Dynamically attach to each player
 
     while True:
-        EnterTheDungeon = input(Fore.YELLOW + "\nYour mark has been left. Enter the dungeon? (Y/N): ").strip().lower()
+        EnterTheDungeon = (await sink.prompt(Fore.YELLOW + "\nYour mark has been left. Enter the dungeon? (Y/N): ")).strip().lower()
         if EnterTheDungeon == "y":
-            print(Fore.GREEN + "You steel your resolve and descend into the abyss.")
+            sink.emit(Fore.GREEN + "You steel your resolve and descend into the abyss.")
             break
         elif EnterTheDungeon == "n":
-            print(Fore.RED + "\nYou think back to all those depending on you...")
-            AreYouSure = input(Fore.YELLOW + "Let those who are counting on you down? (Y/N): ").strip().lower()
+            sink.emit(Fore.RED + "\nYou think back to all those depending on you...")
+            AreYouSure = (await sink.prompt(Fore.YELLOW + "Let those who are counting on you down? (Y/N): ")).strip().lower()
             if AreYouSure == "y":
-                print(Fore.RED + "\nThis world has no room for cowards such as you.")
-                print(Fore.RED + "You have been deemed unworthy. Perhaps the world will find a more suitable hero.")
-                exit()
+                sink.emit(Fore.RED + "\nThis world has no room for cowards such as you.")
+                sink.emit(Fore.RED + "You have been deemed unworthy. Perhaps the world will find a more suitable hero.")
+                return None
             elif AreYouSure == "n":
-                print(Fore.GREEN + "\nThe thoughts of those who depend on you bolster your courage.")
+                sink.emit(Fore.GREEN + "\nThe thoughts of those who depend on you bolster your courage.")
                 continue
         else:
-            print(Fore.YELLOW + "\nPlease make a clear choice.")
+            sink.emit(Fore.YELLOW + "\nPlease make a clear choice.")
     return players, enable_overlay, show_sanity_bar
 
-def game_start(players, shared_inventory, overlay=None, enemies=None):
-    print(Fore.YELLOW + "\nThe dungeon's cold breath greets you...\n")
-    traverse_dungeon(players, shared_inventory, overlay, enemies)  # 🎯 Dungeon crawling system
+async def game_start(players, shared_inventory, overlay=None, enemies=None, state=None, sink=console):
+    sink.emit(Fore.YELLOW + "\nThe dungeon's cold breath greets you...\n")
+    await traverse_dungeon(players, shared_inventory, overlay, enemies, state=state, sink=sink)  # 🎯 Dungeon crawling system
 
-if __name__ == "__main__":
-    DisplayTitle()
-    intro_text()
-    players, enable_overlay, show_sanity_bar = setup_game()
-    shared_inventory = []
+class Session:
+    """One playthrough: its GameState (and seed) plus the party and what it carries."""
+
+    def __init__(self, seed=None, boss_ai=None):
+        self.state = GameState(seed)
+        self.state.boss_ai = boss_ai
+        self.players = []
+        self.shared_inventory = Inventory()
+        self.enemies = []  # Shared reference with the overlay
+        self.overlay = None
 
-    if enable_overlay:
+
+async def play(session, sink=console, offer_overlay=True, allow_overlay=True):
+    """Title, party creation and the dungeon, start to finish, for one session.
+
+    `offer_overlay` asks the overlay question; `allow_overlay=False` still asks
+    it (so recorded answers line up) but never opens the window.
+    """
+    DisplayTitle(sink)
+    intro_text(sink)
+    setup = await setup_game(sink, offer_overlay, rng=session.state.rng.combat)
+    if setup is None:
+        return False
+    session.players, enable_overlay, show_sanity_bar = setup
+
+    if enable_overlay and allow_overlay:
         from overlay_ui import StatOverlay
-        enemies = []  # Shared reference
-        overlay = StatOverlay(players, enemies, show_sanity=show_sanity_bar)
-    else:
-        enemies = []
-        overlay = None
+        session.overlay = StatOverlay(session.players, session.enemies, show_sanity=show_sanity_bar)
 
-    game_start(players, shared_inventory, overlay, enemies)
+    await game_start(session.players, session.shared_inventory, session.overlay, session.enemies,
+                     state=session.state, sink=sink)
+    return True
+
+if __name__ == "__main__":
+    from replay import RecordingSink, save_recording
+
+    parser = argparse.ArgumentParser(description="Dungeon of the Silver Key")
+    parser.add_argument("--script", metavar="FILE", help="answer every prompt from FILE (one line each) instead of the keyboard")
+    parser.add_argument("--seed", type=int, help="seed the run so it can be replayed exactly")
+    parser.add_argument("--record", metavar="FILE", help="save the seed and every answer to FILE for replay.py")
+    parser.add_argument("--boss-ai", type=float, metavar="MS", help="the final boss thinks ahead, MS milliseconds per move")
+    args = parser.parse_args()
+    if args.boss_ai and args.record:
+        parser.error("--boss-ai searches against the clock, so its runs can't be recorded for replay")
+    sink = ScriptedSink.from_file(args.script, echo=console) if args.script else console
+    boss_ai = LookaheadAI(args.boss_ai / 1000) if args.boss_ai else None
+    session = Session(args.seed, boss_ai)
+    offer_overlay = not args.script
+    if args.record:
+        sink = RecordingSink(sink)
+
+    try:
+        run_sync(play(session, sink, offer_overlay))
+    except ScriptExhausted as e:
+        print(Fore.YELLOW + f"\n📜 {e}." + Style.RESET_ALL)
+    except (KeyboardInterrupt, EOFError):
+        print(Fore.YELLOW + "\n🚪 You flee the dungeon." + Style.RESET_ALL)
+    finally:
+        if args.record:
+            save_recording(args.record, session, sink.inputs, offer_overlay)
+            print(Fore.LIGHTBLACK_EX + f"📼 Run recorded to {args.record} (seed {session.state.rng.seed})." + Style.RESET_ALL)
@@ -1,6 +1,8 @@
 # overlay_ui.py
 import tkinter as tk
 
+from unit_view import status_icons, unit_row
+
 # Exact terminal-style color codes
 HP_COLOR_PLAYER = "#00FF00"     # Bright green
 HP_COLOR_ENEMY = "#FF0000"      # Bright red
@@ -59,7 +61,7 @@ class StatOverlay:
             "Occultist": "🔮"
         }
         icon = class_icons.get(job, "")
-        status = self._get_effect_icons(unit)
+        status = status_icons(unit)
         defeated = " (Defeated)" if unit.hp <= 0 else ""
         name_text = f"{unit.name} the {job} {icon} {defeated} {status}".strip()
 
@@ -78,32 +80,6 @@ class StatOverlay:
 
         return output_lines
 
-    def _get_effect_icons(self, unit):
-        icons = []
-
-        if getattr(unit, 'is_bleeding', False):
-            t = getattr(unit, 'bleeding_turns', 0)
-            icons.append(f"🩸({t})" if t > 0 else "🩸")
-        if getattr(unit, 'is_mindfired', False):
-            t = getattr(unit, 'mindfire_turns', 0)
-            icons.append(f"🔥({t})" if t > 0 else "🔥")
-        if getattr(unit, 'is_confused', False):
-            t = getattr(unit, 'confusion_turns', 0)
-            icons.append(f"❓({t})" if t > 0 else "❓")
-        if getattr(unit, 'is_feared', False):
-            t = getattr(unit, 'fear_turns', 0)
-            icons.append(f"😨({t})" if t > 0 else "😨")
-        if getattr(unit, 'is_insane', False):
-            t = getattr(unit, 'madness_turns', 0)
-            icons.append(f"🧠({t})" if t > 0 else "🧠")
-        if getattr(unit, 'is_stunned', False):
-            t = getattr(unit, 'stun_turns', 0)
-            icons.append(f"💫({t})" if t > 0 else "💫")
-        if getattr(unit, 'mental_resistance_turns', 0) > 0:
-            icons.append(f"🔰({unit.mental_resistance_turns})")
-
-        return " ".join(icons)
-
     def schedule_update(self):
         self.update_display()
         self.root.after(500, self.schedule_update)
@@ -119,7 +95,7 @@ class StatOverlay:
         party_title.pack(anchor="w")
 
         for unit in self.party_ref:
-            unit_block = self._render_unit_block(unit, is_enemy=False)
+            unit_block = unit_row(unit, self._render_unit_block, False)
             for line, color in unit_block:
                 label = tk.Label(self.party_frame, text=line, fg=color, bg="black", font=("Consolas", 14))
                 label.pack(anchor="w")
@@ -130,7 +106,7 @@ class StatOverlay:
 
         if self.enemies_ref:
             for unit in self.enemies_ref:
-                unit_block = self._render_unit_block(unit, is_enemy=True)
+                unit_block = unit_row(unit, self._render_unit_block, True)
                 for line, color in unit_block:
                     label = tk.Label(self.enemy_frame, text=line, fg=color, bg="black", font=("Consolas", 14))
                     label.pack(anchor="w")
@@ -0,0 +1,169 @@
+# replay.py
+"""Record a run as seed + answers, then replay it headless in milliseconds.
+
+    python main.py --seed 7 --record bug.json      play (or reproduce a report)
+    python replay.py bug.json                      replay and verify the end state
+    python replay.py recordings/*.json             ...as a regression suite
+
+A recording holds the session seed, whether the overlay question was asked,
+every line the player typed and a hash of the final game state. Replaying
+feeds the answers back through the same engine with all text dropped and all
+pauses skipped, then checks that the state hash still matches.
+"""
+import argparse
+import hashlib
+import json
+import sys
+import time
+from itertools import chain
+
+from game_io import GameIO, NullSink, ScriptExhausted, run_sync
+from main import Session, play
+from inventory import Inventory
+from status_set import StatusSet
+
+FORMAT = "silver-key-replay"
+VERSION = 1
+
+
+class RecordingSink(GameIO):
+    """Wraps a sink and remembers every answer the player gives."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.renders = inner.renders
+        self.inputs = []
+
+    def emit(self, text=""):
+        self.inner.emit(text)
+
+    def event(self, event):
+        self.inner.event(event)
+
+    async def prompt(self, text=""):
+        answer = await self.inner.prompt(text)
+        self.inputs.append(answer)
+        return answer
+
+    async def pause(self, seconds):
+        await self.inner.pause(seconds)
+
+    def begin_round(self, number):
+        self.inner.begin_round(number)
+
+
+class ReplaySink(NullSink):
+    """Headless sink answering prompts from a recording; raises ScriptExhausted at the end."""
+
+    def __init__(self, inputs):
+        self.inputs = inputs
+        self.prompts = 0
+
+    async def prompt(self, text=""):
+        if self.prompts >= len(self.inputs):
+            raise ScriptExhausted(f"recording ended after {self.prompts} answers")
+        answer = self.inputs[self.prompts]
+        self.prompts += 1
+        return answer
+
+
+def _plain(value):
+    """Reduce game objects to hashable primitives (items and spells by name)."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_plain(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(map(repr, value)))
+    if isinstance(value, dict):
+        return tuple(sorted((repr(k), _plain(v)) for k, v in value.items()))
+    if isinstance(value, Inventory):  # hashed as the list of {"item", "qty"} dicts it replaced
+        return tuple(_plain({"item": stack.item, "qty": stack.qty}) for stack in value)
+    if hasattr(value, "name"):
+        return value.name
+    return repr(value)
+
+
+def attrs_of(obj):
+    """An object's attributes as a dict, whether they live in its __dict__ or in __slots__."""
+    if hasattr(obj, "__dict__"):
+        return vars(obj)
+    names = chain.from_iterable(getattr(cls, "__slots__", ()) for cls in type(obj).__mro__)
+    attrs = {name: getattr(obj, name) for name in names if hasattr(obj, name)}
+    attrs.pop("view", None)  # unit_view's draw cache, not game state
+    if isinstance(attrs.get("status"), StatusSet):
+        attrs.update(attrs.pop("status").as_fields())  # hashed as the flags and counters, as before
+    return attrs
+
+
+def state_hash(session):
+    """Stable digest of everything a run changes: party, inventory, rooms and progress."""
+    state = session.state
+    snapshot = (
+        tuple(_plain(attrs_of(p)) for p in session.players),
+        _plain(session.shared_inventory),
+        tuple((rid, _plain(vars(room))) for rid, room in sorted(state.rooms_map.items())),
+        state.current_room,
+        _plain(state.cleared_rooms),
+        _plain(state.visited_room_ids),
+        state.battles_won,
+        state.boss_defeated,
+        _plain(state.found_items),
+    )
+    return hashlib.sha256(repr(snapshot).encode()).hexdigest()
+
+
+def save_recording(path, session, inputs, offer_overlay=True):
+    record = {
+        "format": FORMAT,
+        "version": VERSION,
+        "seed": session.state.rng.seed,
+        "offer_overlay": offer_overlay,
+        "inputs": inputs,
+        "state_hash": state_hash(session),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(record, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def load_recording(path):
+    with open(path, encoding="utf-8") as f:
+        record = json.load(f)
+    if record.get("format") != FORMAT or record.get("version") != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} {FORMAT} file")
+    return record
+
+
+def replay(record):
+    """Play a recording back headless. Returns (matches, actual_hash, answers_used)."""
+    session = Session(record["seed"])
+    sink = ReplaySink(record["inputs"])
+    try:
+        run_sync(play(session, sink, record["offer_overlay"], allow_overlay=False))
+    except ScriptExhausted:
+        pass
+    actual = state_hash(session)
+    return actual == record["state_hash"], actual, sink.prompts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded runs and verify their final state.")
+    parser.add_argument("recordings", nargs="+", help="files written by main.py --record")
+    args = parser.parse_args()
+
+    failures = 0
+    for path in args.recordings:
+        record = load_recording(path)
+        start = time.perf_counter()
+        ok, actual, used = replay(record)
+        elapsed = (time.perf_counter() - start) * 1000
+        status = "OK  " if ok else "FAIL"
+        print(f"{status} {path}: seed {record['seed']}, {used}/{len(record['inputs'])} answers in {elapsed:.1f} ms")
+        if not ok:
+            failures += 1
+            print(f"     expected {record['state_hash'][:16]}, got {actual[:16]}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# server.py
+"""Telnet-style game server: every TCP connection plays its own party and dungeon.
+
+    python server.py --port 4000          then   telnet localhost 4000
+
+Sessions run on one asyncio event loop, so idle or slow players only cost a
+socket and a suspended coroutine. Each connection buffers its output and
+flushes it whenever the game waits on the player or pauses for effect.
+
+Scripted client for local testing (one answer per line of the script):
+
+    python server.py --client answers.txt --clients 50
+"""
+import argparse
+import asyncio
+import time
+from contextlib import suppress
+
+from game_io import ConnectionClosed, SocketSink
+from enemy_ai import LookaheadAI
+from main import Session, play
+
+
+class GameServer:
+    def __init__(self, pace=1.0, idle_timeout=None, boss_ai=None):
+        self.pace = pace
+        self.idle_timeout = idle_timeout
+        self.boss_ai = boss_ai  # seconds per boss decision, or None for the classic boss
+        self.active = 0
+        self.served = 0
+
+    async def handle(self, reader, writer):
+        sink = SocketSink(reader, writer, self.pace, self.idle_timeout)
+        session = Session(boss_ai=LookaheadAI(self.boss_ai) if self.boss_ai else None)
+        peer = writer.get_extra_info("peername")
+        self.active += 1
+        self.served += 1
+        print(f"🔌 {peer} connected ({self.active} active, seed {session.state.rng.seed})")
+        try:
+            await play(session, sink, offer_overlay=False)
+            await sink.flush()
+        except (ConnectionClosed, ConnectionError, asyncio.TimeoutError):
+            pass
+        finally:
+            self.active -= 1
+            print(f"👋 {peer} left ({self.active} active)")
+            ai = session.state.boss_ai
+            if ai and ai.stats["decisions"]:
+                print(f"🧠 {peer} {ai.summary()}")  # the search runs on the event loop, so watch its latency
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"🗝️  Dungeon of the Silver Key listening on {host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+
+async def scripted_client(host, port, answers):
+    """Connect, send every answer up front, and return the full transcript.
+
+    The game reads one line per prompt, so a pre-sent script is consumed in
+    order; closing our side ends the session once the script runs out.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write("".join(answer + "\r\n" for answer in answers).encode())
+    await writer.drain()
+    writer.write_eof()
+    transcript = await reader.read()
+    writer.close()
+    return transcript.decode(errors="replace")
+
+
+async def run_clients(host, port, answers, clients):
+    return await asyncio.gather(*(scripted_client(host, port, answers) for _ in range(clients)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-session TCP server for Dungeon of the Silver Key.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--pace", type=float, default=1.0, help="scale for the game's pacing delays")
+    parser.add_argument("--idle-timeout", type=float, default=900, help="seconds before an idle player is dropped")
+    parser.add_argument("--client", metavar="SCRIPT", help="act as a scripted client, answering from this file")
+    parser.add_argument("--clients", type=int, default=1, help="concurrent scripted clients")
+    parser.add_argument("--boss-ai", type=float, metavar="MS", help="final bosses think ahead, MS milliseconds per move")
+    args = parser.parse_args()
+
+    if args.client:
+        with open(args.client, encoding="utf-8") as f:
+            answers = f.read().splitlines()
+        start = time.perf_counter()
+        transcripts = asyncio.run(run_clients(args.host, args.port, answers, args.clients))
+        elapsed = time.perf_counter() - start
+        print(transcripts[0])
+        print(f"{args.clients} scripted sessions finished in {elapsed:.2f}s")
+        return
+
+    with suppress(KeyboardInterrupt):
+        boss_ai = args.boss_ai / 1000 if args.boss_ai else None
+        asyncio.run(GameServer(args.pace, args.idle_timeout, boss_ai).serve(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+# spell_handlers.py
+"""Special spell behaviour, registered by spell name and bound onto the spells once.
+
+spells.py calls compile_hooks() when it registers its spells, which sets up to
+four hook attributes on every Spell (None when the spell has no special rule),
+so a cast checks one attribute instead of walking a chain of name comparisons:
+
+    on_cast(battle, caster, spell)                  does the whole spell in place of damage or healing
+    pre_damage(battle, caster, spell, target)       before the hit is rolled; return FIZZLED to call it off
+    on_hit(caster, target, spell, damage, sink)     after a target has taken the spell's damage
+    post_cast(battle, caster, spell)                after every target of the cast has been hit
+
+`battle` is the vivid_battle.Battle being fought (both sides, sink, rng,
+policy and the Sentinel bookkeeping). Player and enemy casts run the same hooks.
+"""
+from colorama import Fore, Style
+
+from battle_events import (SpellCast, DamageDealt, Healed, SanityLost, StatusApplied, Warded,
+                           ProtectionPrimed, SpellFailed, UnitDefeated)
+from status_effects import apply_mental_affliction
+from status_table import RANDOM_MENTAL
+
+HOOKS = ("on_cast", "pre_damage", "on_hit", "post_cast")
+
+FIZZLED = "fizzled"  # pre_damage verdict: the spell fails and the caster's side loses the rest of the round
+
+handlers = {}  # (spell name, hook) -> function
+
+
+def hook(stage, *spell_names):
+    """Register the decorated function as the `stage` hook of the named spells."""
+    if stage not in HOOKS:
+        raise ValueError(f"unknown spell hook {stage!r}")
+
+    def register(fn):
+        for name in spell_names:
+            handlers[(name, stage)] = fn
+        return fn
+    return register
+
+
+def compile_hooks(spells):
+    """Bind the registered hooks onto each Spell object (called once, at spell registration)."""
+    for spell in spells:
+        for stage in HOOKS:
+            setattr(spell, stage, handlers.get((spell.name, stage)))
+
+
+# ------------------------ Party Spells ------------------------
+
+@hook("on_cast", "Guardian Shield")
+async def guardian_shield(battle, caster, spell):
+    caster.is_guarding = True
+    battle.sink.event(SpellCast(caster, spell, "guardian_shield"))
+    await battle.sink.pause(1.2)
+
+
+@hook("on_cast", "Sentinel's Oath")
+async def sentinels_oath(battle, caster, spell):
+    sink = battle.sink
+    # Choose target to heal and protect
+    valid_targets = [a for a in battle.players if a.hp > 0 and a != caster]
+    if not valid_targets:
+        sink.emit(Fore.YELLOW + f"No valid allies to protect with {spell.name}." + Style.RESET_ALL)
+        return
+
+    target = await battle.policy.choose_protect_target(caster, valid_targets)
+    if target is None:
+        sink.emit(Fore.YELLOW + "Invalid choice." + Style.RESET_ALL)
+        return
+
+    heal_amount = battle.rng.randint(*spell.damage_range)
+    target.hp = min(target.max_hp, target.hp + heal_amount)
+    target.is_guarded = True        # Mark this ally to be intercepted
+    battle.guarding_tank = caster   # The one who casted the spell
+
+    sink.event(Healed(caster, target, heal_amount, spell, "sentinel_oath"))
+    sink.event(ProtectionPrimed(caster, target))
+    await sink.pause(1.2)
+
+
+@hook("on_cast", "Pure of Mind")
+async def pure_of_mind(battle, caster, spell):
+    caster.is_confused = False  # Self-targeting
+    caster.is_feared = False
+    caster.is_insane = False
+    caster.mental_resistance_turns = 3
+    battle.sink.event(Warded(caster, caster, spell.name))
+
+
+@hook("on_cast", "Veil of Silence")
+async def veil_of_silence(battle, caster, spell):
+    caster.mental_resistance_turns = 2  # Lasts 2 turns, self-targeting
+    battle.sink.event(Warded(caster, caster, spell.name))
+    await battle.sink.pause(1.2)
+
+
+# ------------------------ Enemy Spells ------------------------
+
+@hook("pre_damage", "Sanguine Pounce")
+def sanguine_pounce(battle, caster, spell, target):
+    if not getattr(target, "is_bleeding", False):
+        battle.sink.event(SpellFailed(caster, spell, "no_blood", target))
+        caster.mp += spell.cost  # Refund MP
+        return FIZZLED
+    battle.sink.event(SpellCast(caster, spell, "blood_scent"))
+
+
+@hook("pre_damage", "Eviscerate")
+def eviscerate(battle, caster, spell, target):
+    # 🩸 Eviscerate does bonus damage to already bleeding targets (announced; the hit itself is rolled as usual)
+    if getattr(target, "is_bleeding", False):
+        battle.sink.event(SpellCast(caster, spell, "eviscerate"))
+        bonus = battle.rng.randint(5, 10)
+        battle.sink.event(DamageDealt(caster, target, bonus, spell=spell, cause="eviscerate"))
+
+
+@hook("pre_damage", "Fireball")
+def fireball_splash(battle, caster, spell, target):
+    if caster in battle.players:
+        return  # only enemy Fireballs splash
+    rng = battle.rng
+    if rng.random() < 0.5:
+        splash_targets = [p for p in battle.players if p.hp > 0 and p != target]
+        if splash_targets:
+            splash_target = rng.choice(splash_targets)
+            splash_dmg = rng.randint(5, 10)
+            splash_target.hp = max(0, splash_target.hp - splash_dmg)
+            battle.sink.event(DamageDealt(caster, splash_target, splash_dmg, "magical", spell, cause="splash"))
+            if splash_target.hp == 0:
+                battle.sink.event(UnitDefeated(splash_target))
+
+
+@hook("pre_damage", "Gaze of the Abyss")
+def gaze_of_the_abyss(battle, caster, spell, target):
+    if target.sanity < 40:
+        target.is_stunned = True
+        target.stun_turns = 1
+        battle.sink.event(StatusApplied(target, "stun", spell.name))
+
+
+@hook("on_hit", "Cosmic Vampirism")
+def cosmic_vampirism(caster, target, spell, damage, sink):
+    # 🧛 Drain: heals the caster for 50% of damage dealt
+    if damage > 0:
+        drain = damage // 2
+        caster.hp = min(caster.max_hp, caster.hp + drain)
+        sink.event(Healed(target, caster, drain, spell, "drain"))
+
+
+@hook("post_cast", "Curse of the Stars")
+def curse_of_the_stars(battle, caster, spell):
+    for player in battle.players:
+        if player.hp <= 0:
+            continue
+        sanity_loss = battle.rng.randint(6, 12)
+        player.sanity = max(0, player.sanity - sanity_loss)
+        battle.sink.event(SanityLost(player, sanity_loss, spell))
+
+
+@hook("post_cast", "Arcane Cataclysm")
+def arcane_cataclysm(battle, caster, spell):
+    rng, sink = battle.rng, battle.sink
+    player = battle.players[-1]  # the side effects have always landed on the last party member
+    if rng.random() < 0.6:
+        effect = rng.choice(RANDOM_MENTAL)
+        apply_mental_affliction(player, effect, sink=sink)
+
+    if rng.random() < 0.3:
+        burn = rng.randint(6, 12)
+        sanity_burn = rng.randint(6, 12)
+        player.hp = max(0, player.hp - burn)
+        player.sanity = max(0, player.sanity - sanity_burn)
+        sink.event(DamageDealt(caster, player, burn, "magical", spell, cause="sear", sanity=sanity_burn))
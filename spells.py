@@ -7,14 +7,8 @@ class SimpleStrike:
         self.name = name
         self.effect = None
 
-def get_class_melee_spell(player_class):
-    class_melee_options = {
-        "Tank": [slash, thrust],
-        "Occultist": [slash, thrust],
-        "White Mage": [staff_tap],
-        "Black Mage": [arcane_bash],
-    }
-    return random.choice(class_melee_options.get(player_class, [slash]))
+def get_class_melee_spell(player_class, rng=random):
+    return rng.choice(class_melee_options.get(player_class, [slash]))
 
 
 class Spell:
@@ -27,6 +21,7 @@ class Spell:
         self.special = special  # If True, it's a charged spell
         self.effect = effect
         self.is_aoe = is_aoe
+        self.on_cast = self.pre_damage = self.on_hit = self.post_cast = None  # set by spell_handlers.compile_hooks
         self.description_pool = self.generate_description_pool()
 
     def generate_description_pool(self):
@@ -337,6 +332,13 @@ thrust = Spell("Thrust", 0, (10, 20), "melee", ["Tank", "Occultist"])
 staff_tap = Spell("Staff Tap", 0, (4, 10), "melee", ["White Mage"])
 arcane_bash = Spell("Arcane Bash", 0, (6, 14), "melee", ["Black Mage"])
 
+class_melee_options = {
+    "Tank": [slash, thrust],
+    "Occultist": [slash, thrust],
+    "White Mage": [staff_tap],
+    "Black Mage": [arcane_bash],
+}
+
 # ------------------------ Enemy Melee Attacks ------------------------
 
 claw = Spell("Claw", 0, (20, 30), "melee", [], effect="bleed")
@@ -411,6 +413,10 @@ all_spells = [
 
 spell_lookup = {spell.name: spell for spell in all_spells}
 
+# Bind each spell's special behaviour once, here, instead of matching names on every cast
+from spell_handlers import compile_hooks  # noqa: E402  (spell_handlers never imports spells)
+compile_hooks(all_spells)
+
 
 # ======================== Future Spell Additions ========================
 # These are planned or optional additions to expand spell variety and mechanics.
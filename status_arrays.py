@@ -0,0 +1,141 @@
+# status_arrays.py
+"""Status effects for N units at once, in NumPy arrays.
+
+StatusArrays is the array form of StatusSet: `mask` holds one uint8 bitmask per
+unit (same bits as status_set) and `turns[effect]` a row of turn counters.
+tick() is handle_status_effects and sanity_check() is handle_sanity_effects
+for every unit in one call, with the numbers from status_table, so the odds
+match the scalar engine. Only the draws differ (they come from a NumPy
+Generator), and each returns boolean masks over all N units instead of a verdict.
+
+    status = StatusArrays(1_000_000)
+    skip, chaos = status.tick(hp, sanity, rng)
+"""
+import numpy as np
+
+from status_set import EFFECT_NAMES, MADNESS, STUN, TICK_ORDER, WARD
+from status_table import effects, sanity_rules
+
+by_bit = tuple(effects.values())
+
+
+def _roll(rng, low_high, size):
+    low, high = low_high
+    return rng.integers(low, high + 1, size, dtype=np.int32)
+
+
+def _pick(idx, keep):
+    """idx[keep] for a boolean keep; flatnonzero and a gather beat boolean indexing on scattered picks."""
+    return idx[np.flatnonzero(keep)]
+
+
+class StatusArrays:
+    """Flags and turn counters for `n` units; unit i's effects are bit e of mask[i] and turns[e, i]."""
+
+    def __init__(self, n):
+        self.n = n
+        self.mask = np.zeros(n, np.uint8)
+        self.turns = np.zeros((len(EFFECT_NAMES), n), np.int32)
+
+    def has(self, effect, idx=None):
+        """Boolean array: which units (all, or those in idx) have `effect`."""
+        mask = self.mask if idx is None else self.mask[idx]
+        return (mask >> effect) & 1 == 1
+
+    def set(self, idx, effect, turns=None):
+        self.mask[idx] |= np.uint8(1 << effect)
+        if turns is not None:
+            self.turns[effect, idx] = turns
+
+    def clear(self, idx, effect):
+        self.mask[idx] &= np.uint8(~(1 << effect) & 0xFF)
+
+    def afflict(self, idx, effect):
+        """Vector apply_mental_affliction(): units in idx that are warded or already have it are spared.
+
+        Returns the units it took hold on (for per-spell extras such as an MP drain).
+        """
+        record = effects[effect]
+        took = _pick(idx, self.mask[idx] & np.uint8((1 << WARD) | (1 << record.bit)) == 0)
+        self.set(took, record.bit, record.turns)
+        return took
+
+    def tick(self, hp, sanity, rng, units=None):
+        """One status tick for `units` (an index array; default every unit), like handle_status_effects.
+
+        Mindfire and bleed damage `hp` and `sanity` (arrays indexed like the
+        units) in place. Returns boolean (skip, chaos) masks over all N units.
+        """
+        skip = np.zeros(self.n, bool)
+        chaos = np.zeros(self.n, bool)
+        idx = np.flatnonzero(self.mask != 0) if units is None else _pick(units, self.mask[units] != 0)
+        if not idx.size:
+            return skip, chaos
+
+        mask = self.mask[idx]
+        pending = np.ones(idx.size, bool)  # no verdict yet: still ticking
+        for effect in TICK_ORDER:
+            on = np.flatnonzero(((mask >> effect) & 1 == 1) & pending)
+            if not on.size:
+                continue
+            record, hit = by_bit[effect], idx[on]
+            if record.tick_hp:
+                hp[hit] = np.maximum(0, hp[hit] - _roll(rng, record.tick_hp, hit.size))
+            if record.tick_sanity:
+                sanity[hit] = np.maximum(0, sanity[hit] - _roll(rng, record.tick_sanity, hit.size))
+
+            left = self.turns[effect, hit] - 1
+            self.turns[effect, hit] = left
+            expired = left <= 0
+            mask[_pick(on, expired)] &= np.uint8(~(1 << effect) & 0xFF)
+
+            if effect == STUN:  # costs the turn even as it wears off
+                skip[hit] = True
+                pending[on] = False
+            elif record.turn_loss:
+                chance, _, verdict = record.turn_loss
+                lost = _pick(on, ~expired)
+                lost = _pick(lost, rng.random(lost.size) < chance)
+                (skip if verdict == "skip" else chaos)[idx[lost]] = True
+                pending[lost] = False
+
+        self.mask[idx] = mask
+        return skip, chaos
+
+    def sanity_check(self, hp, sanity, rng, units=None):
+        """handle_sanity_effects for `units` (default every unit) about to cast.
+
+        Units at 0 sanity go mad; the brink's self-hits land on `hp` and the
+        struggle's drain on `sanity`, in place. Returns boolean (skip, chaos,
+        miscast, fizzle) masks over all N units.
+        """
+        skip, chaos, miscast, fizzle = (np.zeros(self.n, bool) for _ in range(4))
+        idx = np.arange(self.n) if units is None else units
+        unit_hp = hp if units is None else hp[idx]
+        skip[_pick(idx, unit_hp <= 0)] = True
+        live = unit_hp > 0
+        san = np.where(live, sanity if units is None else sanity[idx], -1)  # -1: in no band
+
+        broken = _pick(idx, live & (san <= 0))
+        self.set(broken, MADNESS)
+        chaos[broken] = True
+
+        def band(rule):
+            low, high = rule["band"]
+            return _pick(idx, (san >= low) & (san <= high))
+
+        brink, struggle, falters = sanity_rules["brink"], sanity_rules["struggle"], sanity_rules["falters"]
+        shaken = band(brink)
+        shaken = _pick(shaken, rng.random(shaken.size) < brink["chance"])
+        action = rng.integers(0, 3, shaken.size)  # skip / self-hit / hallucinate
+        skip[_pick(shaken, action == 0)] = True
+        self_hit = _pick(shaken, action == 1)
+        hp[self_hit] = np.maximum(0, hp[self_hit] - _roll(rng, brink["self_hit"], self_hit.size))
+
+        shaky = band(struggle)
+        sanity[shaky] = np.maximum(0, sanity[shaky] - _roll(rng, struggle["drain"], shaky.size))
+        miscast[_pick(shaky, rng.random(shaky.size) < struggle["miscast"])] = True
+
+        faltering = band(falters)
+        fizzle[_pick(faltering, rng.random(faltering.size) < falters["fizzle"])] = True
+        return skip, chaos, miscast, fizzle
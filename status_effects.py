@@ -1,181 +1,117 @@
 # status_effects.py
-from colorama import Fore, Style
 import random
+from game_io import console
+from battle_events import (StatusApplied, StatusResisted, StatusExpired, MpLost, DamageDealt,
+                           UnitDefeated, TurnLost, SanityEffect)
+from status_set import STUN, WARD
+from status_table import DEFAULT_CHANCE, RANDOM_MENTAL, effects, afflictions, inflict_chance, sanity_rules
 
-# 🎯 Custom status effect chances for specific spells
-special_status_chances = {
-    "Unsettling Gaze": ("bleed", 1.0),        # 100% chance
-    "Eldritch Flame": ("mindfire", 0.75),     # 75% chance
-    "Void Flame": ("mindfire", 0.5),          # 50% chance
-    "Fireball": ("mindfire", 0.4),            # 40% chance
-    "Void Bolt": ("random_mental", 0.5),      # 50% chance
-    "Cursed Blow": ("mindfire", 0.4),         # 40% chance
-    "Claw": ("bleed", 0.6),                   # 60% chance
-    "Bite": ("bleed", 0.6),                   # 60% chance
-    "Eviscerate": ("bleed", 0.8),             # 80% chance
-    "Tear": ("bleed", 0.7),                   # 70% chance
-    "Mutilate": ("bleed", 0.9),               # 90% chance
-    "Dread Aura": ("fear", 1.0),              # 100% chance
-    "Gaze of the Abyss": ("madness", 1.0),    # 100% chance
-    "Hypnotic Gaze": ("confusion", 1.0),      # 100% chance
-    "Unnerving Aura": ("fear", 0.6),          # 60% chance
-    "Foul Affliction": ("madness", 0.6),      # 60% chance
-    "Horrific Wail": ("madness", 0.7),        # 70% chance
-    "Call of Madness": ("madness", 0.6),      # 60% chance
-    "Curse of the Stars": ("madness", 0.5),   # 50% chance
-    "Cosmic Vampirism": ("madness", 0.3),     # 30% chance
-}
+by_bit = tuple(effects.values())  # StatusSet bit -> EffectRecord
 
 # === Apply a mental affliction or physical effect if not protected ===
-def apply_mental_affliction(target, effect, spell_name=None):
-    if getattr(target, 'mental_resistance_turns', 0) > 0:
-        print(Fore.YELLOW + f"{target.name} resists the {effect} due to mental clarity!" + Style.RESET_ALL)
+def apply_mental_affliction(target, effect, spell_name=None, sink=console):
+    status = target.status
+    if status.has(WARD):
+        sink.event(StatusResisted(target, effect, "clarity"))
         return
 
-    if effect == "confusion":
-        if target.is_confused:
-            return
-        target.is_confused = True
-        target.confusion_turns = 3  # default
-        if spell_name == "Hypnotic Gaze":
-            target.confusion_turns = max(target.confusion_turns, 2)
-            if hasattr(target, 'mp'):
-                target.mp = max(0, target.mp - 5)
-                print(Fore.BLUE + f"{target.name} loses 5 MP to Hypnotic Gaze!" + Style.RESET_ALL)
-        print(Fore.MAGENTA + f"{target.name} is confused by the horrors they perceive!" + Style.RESET_ALL)
-
-    elif effect == "fear":
-        if target.is_feared:
-            return
-        target.is_feared = True
-        target.fear_turns = 3
-        print(Fore.MAGENTA + f"{target.name} trembles in fear, heart pounding!" + Style.RESET_ALL)
-
-    elif effect == "madness":
-        if target.is_insane:
-            return
-        target.is_insane = True
-        target.madness_turns = 3
-        print(Fore.MAGENTA + f"{target.name}'s eyes glaze with madness!" + Style.RESET_ALL)
-
-    elif effect == "mindfire":
-        if target.is_mindfired:
-            return
-        target.is_mindfired = True
-        target.mindfire_turns = 3
-        print(Fore.LIGHTRED_EX + f"{target.name} is engulfed in a burning Mindfire!" + Style.RESET_ALL)
-
-    elif effect == "bleed":
-        if target.is_bleeding:
-            return
-        target.is_bleeding = True
-        target.bleeding_turns = 3
-        if spell_name == "Unsettling Gaze":
-            print(Fore.RED + f"{target.name} begins to bleed profusely from an unseen wound!" + Style.RESET_ALL)
-        else:
-            print(Fore.RED + f"{target.name} starts bleeding!" + Style.RESET_ALL)
+    record = effects.get(effect)
+    if record is None or not record.inflictable or status.has(record.bit):
+        return
+    status.set(record.bit, record.turns)
+
+    affliction = afflictions.get((spell_name, effect))
+    if affliction and affliction.mp_loss and hasattr(target, 'mp'):
+        target.mp = max(0, target.mp - affliction.mp_loss)
+        sink.event(MpLost(target, affliction.mp_loss, spell_name))
+    sink.event(StatusApplied(target, effect, spell_name))
 
 # === Apply effects based on spell or item ===
-def try_inflict_status(target, effect: str, chance: float = 0.4, spell_name=None):
+def try_inflict_status(target, effect: str, chance: float = DEFAULT_CHANCE, spell_name=None, sink=console, rng=random):
     if not effect or target.hp <= 0:
         return
 
-    # 🎯 Override chance if a special spell rule is defined
-    if spell_name and spell_name in special_status_chances:
-        special_effect, special_chance = special_status_chances[spell_name]
-        if effect == special_effect:
-            chance = special_chance
+    # 🎯 The spell's own chance, if status_table gives it this effect
+    chance = inflict_chance(effect, spell_name, chance)
 
-    # 🧠 Apply mental resistance if applicable
+    # 🧠 Apply mental resistance if applicable (no unit has the stat yet; see the TODO below)
     resistance = getattr(target, 'mental_resistance', 0)
-    if resistance and effect in special_status_chances.values():
+    if resistance:
         chance *= (1 - resistance)
 
     # 🎲 Random mental affliction handler
     if effect == "random_mental":
-        if random.random() < chance:
-            affliction = random.choice(["confusion", "fear", "madness"])
-            apply_mental_affliction(target, affliction)
+        if rng.random() < chance:
+            affliction = rng.choice(RANDOM_MENTAL)
+            apply_mental_affliction(target, affliction, sink=sink)
         else:
-            print(Fore.YELLOW + f"{target.name} resists the creeping madness!" + Style.RESET_ALL)
+            sink.event(StatusResisted(target, effect))
         return
 
-    if random.random() < chance:
-        apply_mental_affliction(target, effect, spell_name=spell_name)
+    if rng.random() < chance:
+        apply_mental_affliction(target, effect, spell_name=spell_name, sink=sink)
     else:
-        print(Fore.YELLOW + f"{target.name} resists the {effect}!" + Style.RESET_ALL)
+        sink.event(StatusResisted(target, effect))
 
 
 # === Called each turn to apply status logic ===
-def handle_status_effects(unit):
-    if getattr(unit, 'is_mindfired', False):
-        burn = random.randint(5, 10)
-        sanity_burn = random.randint(3, 6)
-        unit.hp = max(0, unit.hp - burn)
-        unit.sanity = max(0, unit.sanity - sanity_burn)
-        unit.mindfire_turns -= 1
-        print(Fore.RED + f"🔥 {unit.name} suffers {burn} HP and {sanity_burn} sanity from Mindfire!" + Style.RESET_ALL)
-        if unit.mindfire_turns <= 0:
-            unit.is_mindfired = False
-            print(Fore.YELLOW + f"{unit.name}'s Mindfire has burned out." + Style.RESET_ALL)
-
-    if getattr(unit, 'is_bleeding', False):
-        bleed = random.randint(3, 6)
-        unit.hp = max(0, unit.hp - bleed)
-        unit.bleeding_turns -= 1
-        print(Fore.LIGHTRED_EX + f"🩸 {unit.name} bleeds for {bleed} damage!" + Style.RESET_ALL)
-        
-        if unit.hp == 0:
-            print(Fore.RED + f"{unit.name} succumbs to blood loss..." + Style.RESET_ALL)
-
-        if unit.bleeding_turns <= 0:
-            unit.is_bleeding = False
-            print(Fore.YELLOW + f"{unit.name}'s wounds stop bleeding." + Style.RESET_ALL)
-
-
-    if getattr(unit, 'mental_resistance_turns', 0) > 0:
-        unit.mental_resistance_turns -= 1
-
-    if getattr(unit, 'is_confused', False):
-        unit.confusion_turns -= 1
-        if unit.confusion_turns <= 0:
-            unit.is_confused = False
-            print(Fore.YELLOW + f"{unit.name}'s confusion fades." + Style.RESET_ALL)
-        elif random.random() < 0.4:
-            print(Fore.LIGHTMAGENTA_EX + f"{unit.name} is confused and skips their turn..." + Style.RESET_ALL)
-            return "skip"
-
-    if getattr(unit, 'is_feared', False):
-        unit.fear_turns -= 1
-        if unit.fear_turns <= 0:
-            unit.is_feared = False
-            print(Fore.YELLOW + f"{unit.name}'s fear subsides." + Style.RESET_ALL)
-        elif random.random() < 0.3:
-            print(Fore.LIGHTBLUE_EX + f"{unit.name} hesitates in fear and cannot act!" + Style.RESET_ALL)
+def handle_status_effects(unit, sink=console, rng=random):
+    """Tick the unit's active effects; returns "normal", "skip" or "chaos".
+
+    Counters count this unit's ticks, not battle turns: a lost turn stops the
+    effects after it from ticking, and a "skip" ticks everything again on the
+    retry, so each effect keeps its own countdown rather than an expiry turn.
+    """
+    status = unit.status
+    if not status.mask:
+        return "normal"  # the usual case: nothing to tick
+    turns = status.turns
+
+    for effect in status.active():  # active effects only, in tick order
+        record = by_bit[effect]
+
+        if effect == WARD:
+            status.set_turns(WARD, turns[WARD] - 1)
+            continue
+
+        if record.tick_hp:  # damage over time (mindfire, bleed)
+            damage = rng.randint(*record.tick_hp)
+            sanity_damage = rng.randint(*record.tick_sanity) if record.tick_sanity else 0
+            unit.hp = max(0, unit.hp - damage)
+            if sanity_damage:
+                unit.sanity = max(0, unit.sanity - sanity_damage)
+            turns[effect] -= 1
+            sink.event(DamageDealt(None, unit, damage, record.dmg_type, cause=record.name, sanity=sanity_damage))
+            if record.announce_death and unit.hp == 0:
+                sink.event(UnitDefeated(unit, record.name))
+            if turns[effect] <= 0:
+                status.clear(effect)
+                sink.event(StatusExpired(unit, record.name))
+
+        elif effect == STUN:
+            turns[STUN] -= 1
+            if turns[STUN] <= 0:
+                status.clear(STUN)
+                sink.event(StatusExpired(unit, "stun"))
+            else:
+                sink.event(TurnLost(unit, "stunned"))
             return "skip"
 
-    if getattr(unit, 'is_insane', False):
-        unit.madness_turns -= 1
-        if unit.madness_turns <= 0:
-            unit.is_insane = False
-            print(Fore.YELLOW + f"{unit.name} regains their sanity." + Style.RESET_ALL)
-        elif random.random() < 0.2:
-            print(Fore.LIGHTRED_EX + f"{unit.name} is overtaken by madness and lashes out randomly!" + Style.RESET_ALL)
-            return "chaos"
-        
-    if getattr(unit, 'is_stunned', False):
-        unit.stun_turns -= 1
-        if unit.stun_turns <= 0:
-            unit.is_stunned = False
-            print(Fore.YELLOW + f"{unit.name} shakes off the abyssal stupor." + Style.RESET_ALL)
-        else:
-            print(Fore.LIGHTBLACK_EX + f"{unit.name} is stunned and cannot act!" + Style.RESET_ALL)
-        return "skip"
+        else:  # confusion, fear, madness: each tick may cost the turn
+            turns[effect] -= 1
+            if turns[effect] <= 0:
+                status.clear(effect)
+                sink.event(StatusExpired(unit, record.name))
+            else:
+                chance, reason, verdict = record.turn_loss
+                if rng.random() < chance:
+                    sink.event(TurnLost(unit, reason))
+                    return verdict
 
     return "normal"
 
 
-def handle_sanity_effects(player):
+def handle_sanity_effects(player, sink=console, rng=random):
     """Applies sanity-based behavior and consequences."""
     if player.hp <= 0:
         return "skip"
@@ -183,37 +119,34 @@ def handle_sanity_effects(player):
     if player.sanity <= 0:
         if not getattr(player, "is_insane", False):
             player.is_insane = True
-            print(Fore.RED + f"💀 {player.name} has gone completely insane!" + Style.RESET_ALL)
+            sink.event(SanityEffect(player, "insane"))
         return "chaos"
 
-    if 1 <= player.sanity <= 25:
-        print(Fore.MAGENTA + f"😱 {player.name} is on the brink of madness!" + Style.RESET_ALL)
-        if random.random() < 0.25:
-            action = random.choice(["skip", "self_hit", "hallucinate"])
+    brink, struggle, falters = sanity_rules["brink"], sanity_rules["struggle"], sanity_rules["falters"]
+    if brink["band"][0] <= player.sanity <= brink["band"][1]:
+        sink.event(SanityEffect(player, "brink", player.sanity))
+        if rng.random() < brink["chance"]:
+            action = rng.choice(["skip", "self_hit", "hallucinate"])
             if action == "skip":
-                print(Fore.RED + f"{player.name} is frozen by terror and does nothing!" + Style.RESET_ALL)
+                sink.event(TurnLost(player, "terror"))
                 return "skip"
             elif action == "self_hit":
-                dmg = random.randint(5, 12)
+                dmg = rng.randint(*brink["self_hit"])
                 player.hp = max(0, player.hp - dmg)
-                print(Fore.RED + f"{player.name} lashes out at unseen horrors, taking {dmg} self-inflicted damage!" + Style.RESET_ALL)
+                sink.event(DamageDealt(player, player, dmg, cause="self"))
             elif action == "hallucinate":
-                print(Fore.LIGHTMAGENTA_EX + random.choice([
-                    f"{player.name} whispers about the eyes in the floor...",
-                    f"{player.name} sees something reaching from the walls...",
-                    f"{player.name} claws at their skin, muttering eldritch syllables..."
-                ]) + Style.RESET_ALL)
-
-    elif 26 <= player.sanity <= 50:
-        print(Fore.LIGHTMAGENTA_EX + f"🌀 {player.name} struggles to maintain clarity..." + Style.RESET_ALL)
-        player.sanity = max(0, player.sanity - random.randint(1, 2))
-        if random.random() < 0.15:
-            print(Fore.YELLOW + f"{player.name}'s spell goes awry!" + Style.RESET_ALL)
+                sink.event(SanityEffect(player, "hallucinate", player.sanity))
+
+    elif struggle["band"][0] <= player.sanity <= struggle["band"][1]:
+        sink.event(SanityEffect(player, "struggle", player.sanity))
+        player.sanity = max(0, player.sanity - rng.randint(*struggle["drain"]))
+        if rng.random() < struggle["miscast"]:
+            sink.event(SanityEffect(player, "awry", player.sanity))
             return "miscast"
 
-    elif 51 <= player.sanity <= 74:
-        if random.random() < 0.05:
-            print(Fore.YELLOW + f"{player.name}'s concentration falters..." + Style.RESET_ALL)
+    elif falters["band"][0] <= player.sanity <= falters["band"][1]:
+        if rng.random() < falters["fizzle"]:
+            sink.event(SanityEffect(player, "falters", player.sanity))
             return "fizzle"
 
     return "normal"
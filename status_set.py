@@ -0,0 +1,142 @@
+# status_set.py
+"""Compact status effects: one int bitmask of active effects plus a small array of turn counters.
+
+Every unit carries a StatusSet in `unit.status`. Bit i of `mask` is set while
+effect i is active, and turns[i] is its turn counter. Flags and counters are
+independent (madness from lost sanity has no counter; counters keep their
+last value after an effect ends), exactly like the old attribute pairs.
+
+StatusHolder gives Player and Enemy the familiar is_confused / confusion_turns
+style attributes as views onto the StatusSet, so existing code keeps working,
+while hot paths (the turn tick, the icons) read the mask directly: a unit
+with no effects costs a single zero check.
+"""
+from functools import lru_cache
+
+from status_table import effects, tick_order
+
+# Bits come from status_table's order, which is also the order the icons are shown in
+EFFECT_NAMES = tuple(effects)
+BLEED, MINDFIRE, CONFUSION, FEAR, MADNESS, STUN, WARD = (
+    effects[name].bit for name in ("bleed", "mindfire", "confusion", "fear", "madness", "stun", "ward"))
+
+# The order handle_status_effects ticks them in
+TICK_ORDER = tuple(effects[name].bit for name in tick_order)
+
+ICONS = tuple(record.icon for record in effects.values())
+
+# Attribute name -> effect, for the StatusHolder views (WARD has no flag: it is on while its counter is)
+FLAG_ATTRS = {"is_bleeding": BLEED, "is_mindfired": MINDFIRE, "is_confused": CONFUSION,
+              "is_feared": FEAR, "is_insane": MADNESS, "is_stunned": STUN}
+TURN_ATTRS = {"bleeding_turns": BLEED, "mindfire_turns": MINDFIRE, "confusion_turns": CONFUSION,
+              "fear_turns": FEAR, "madness_turns": MADNESS, "stun_turns": STUN,
+              "mental_resistance_turns": WARD}
+
+# For every possible mask: its active effects, in icon order and in tick order
+ACTIVE = tuple(tuple(e for e in range(len(EFFECT_NAMES)) if mask >> e & 1) for mask in range(1 << len(EFFECT_NAMES)))
+ACTIVE_TICKS = tuple(tuple(e for e in TICK_ORDER if mask >> e & 1) for mask in range(1 << len(EFFECT_NAMES)))
+
+
+@lru_cache(maxsize=1024)
+def _icons(mask, turns):
+    parts = []
+    for effect in ACTIVE[mask]:
+        t = turns[effect]
+        parts.append(f"{ICONS[effect]}({t})" if t > 0 else ICONS[effect])
+    return " ".join(parts)
+
+
+class StatusSet:
+    __slots__ = ("mask", "turns")
+
+    def __init__(self):
+        self.mask = 0
+        self.turns = [0] * len(EFFECT_NAMES)
+
+    def has(self, effect):
+        return bool(self.mask >> effect & 1)
+
+    def set(self, effect, turns=None):
+        self.mask |= 1 << effect
+        if turns is not None:
+            self.turns[effect] = turns
+
+    def clear(self, effect):
+        self.mask &= ~(1 << effect)
+
+    def set_turns(self, effect, turns):
+        self.turns[effect] = turns
+        if effect == WARD:  # the ward is active exactly while it has turns left
+            if turns > 0:
+                self.mask |= 1 << WARD
+            else:
+                self.mask &= ~(1 << WARD)
+
+    def active(self):
+        """Active effects, in tick order."""
+        return ACTIVE_TICKS[self.mask]
+
+    def icons(self):
+        """Status icons with turn counts (e.g. "🩸(2) 🔰(1)"), cached per mask and counters."""
+        if not self.mask:
+            return ""
+        return _icons(self.mask, tuple(self.turns))
+
+    def as_fields(self):
+        """The flags and counters under their attribute names (is_bleeding, bleeding_turns, ...)."""
+        fields = {name: self.has(effect) for name, effect in FLAG_ATTRS.items()}
+        fields.update((name, self.turns[effect]) for name, effect in TURN_ATTRS.items())
+        return fields
+
+
+def afflicted(units):
+    """The units with at least one active effect (the only ones a status tick has work for)."""
+    return [unit for unit in units if unit.status.mask]
+
+
+def _flag(effect):
+    def get(self):
+        return self.status.mask >> effect & 1 == 1
+
+    def set_(self, on):
+        if on:
+            self.status.mask |= 1 << effect
+        else:
+            self.status.mask &= ~(1 << effect)
+    return property(get, set_)
+
+
+def _turns(effect):
+    def get(self):
+        return self.status.turns[effect]
+
+    def set_(self, turns):
+        self.status.set_turns(effect, turns)
+    return property(get, set_)
+
+
+class StatusHolder:
+    """Mixin for units with a `status` StatusSet: the old per-effect attributes as views onto it."""
+    __slots__ = ()
+
+    @property
+    def status_mask(self):
+        return self.status.mask
+
+    @status_mask.setter
+    def status_mask(self, mask):
+        self.status.mask = mask
+
+    @property
+    def status_turns(self):
+        return tuple(self.status.turns)
+
+    @status_turns.setter
+    def status_turns(self, turns):
+        self.status.turns[:] = turns
+
+
+for _name, _effect in FLAG_ATTRS.items():
+    setattr(StatusHolder, _name, _flag(_effect))
+for _name, _effect in TURN_ATTRS.items():
+    setattr(StatusHolder, _name, _turns(_effect))
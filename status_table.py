@@ -0,0 +1,148 @@
+# status_table.py
+"""Every status effect number and line of flavor text, in one declarative table.
+
+effect_table describes each effect (its order is the StatusSet bit order, which
+is also the order the icons are shown in); spell_afflictions lists the spells
+whose effect lands with its own chance, or with extra rules; sanity_rules holds
+the numbers behind a caster's sanity checks. The first two are compiled
+once, at import, into EffectRecord / Affliction objects:
+
+    effects[name]                 -> EffectRecord
+    afflictions[(spell, effect)]  -> Affliction (chance, MP drain, applied text)
+
+status_effects (the scalar engine), status_arrays and vector_sim, status_set (icons), battle_render
+and the inspect screen all read these, so a number changed here changes
+everywhere at once.
+"""
+from dataclasses import dataclass
+
+from colorama import Fore
+
+DEFAULT_CHANCE = 0.4        # try_inflict_status() when the spell has no entry below
+RANDOM_MENTAL = ("confusion", "fear", "madness")  # what "random_mental" (and a mental backlash) picks from
+
+effect_table = {
+    "bleed": {
+        "icon": "🩸", "turns": 3,
+        "tick_hp": (3, 6), "announce_death": True,
+        "applied": (Fore.RED, "{name} starts bleeding!"),
+        "expired": "{name}'s wounds stop bleeding.",
+        "describe": "🩸 Bleeding – Losing HP each turn",
+    },
+    "mindfire": {
+        "icon": "🔥", "turns": 3,
+        "tick_hp": (5, 10), "tick_sanity": (3, 6), "dmg_type": "magical",
+        "applied": (Fore.LIGHTRED_EX, "{name} is engulfed in a burning Mindfire!"),
+        "expired": "{name}'s Mindfire has burned out.",
+        "describe": "🔥 Mindfire – Tormented by burning psychic flames",
+    },
+    "confusion": {
+        "icon": "❓", "turns": 3,
+        "turn_loss": (0.4, "confused", "skip"),
+        "applied": (Fore.MAGENTA, "{name} is confused by the horrors they perceive!"),
+        "expired": "{name}'s confusion fades.",
+        "describe": "🤯 Confused – Struggles to discern friend from foe",
+    },
+    "fear": {
+        "icon": "😨", "turns": 3,
+        "turn_loss": (0.3, "feared", "skip"),
+        "applied": (Fore.MAGENTA, "{name} trembles in fear, heart pounding!"),
+        "expired": "{name}'s fear subsides.",
+        "describe": "😨 Feared – Frozen by terror",
+    },
+    "madness": {
+        "icon": "🧠", "turns": 3,
+        "turn_loss": (0.2, "madness", "chaos"),
+        "applied": (Fore.MAGENTA, "{name}'s eyes glaze with madness!"),
+        "expired": "{name} regains their sanity.",
+        "describe": "🧠 Madness – Lost in hallucination and chaos",
+    },
+    "stun": {  # costs every turn it lasts, including the one it wears off on; only Gaze of the Abyss stuns
+        "icon": "💫", "turns": 1, "inflictable": False,
+        "applied": (Fore.MAGENTA, "{name} stares into the abyss and is frozen in terror!"),
+        "expired": "{name} shakes off the abyssal stupor.",
+    },
+    "ward": {  # mental clarity: on while mental_resistance_turns > 0, set by the spells that grant it
+        "icon": "🔰", "inflictable": False,
+    },
+}
+
+# The order a turn's tick walks the effects in, and the order the inspect screen lists them
+tick_order = ("mindfire", "bleed", "ward", "confusion", "fear", "madness", "stun")
+describe_order = ("confusion", "fear", "madness", "mindfire", "bleed")
+
+# 🌀 What a caster's sanity does to their cast (handle_sanity_effects), by sanity band
+sanity_rules = {
+    "brink": {"band": (1, 25), "chance": 0.25, "self_hit": (5, 12)},  # then skip / self-hit / hallucinate, evenly
+    "struggle": {"band": (26, 50), "drain": (1, 2), "miscast": 0.15},
+    "falters": {"band": (51, 74), "fizzle": 0.05},
+}
+
+# 🎯 Spells whose effect lands with its own chance (and any extra rules)
+spell_afflictions = {
+    "Unsettling Gaze": {"effect": "bleed", "chance": 1.0,
+                        "applied": (Fore.RED, "{name} begins to bleed profusely from an unseen wound!")},
+    "Eldritch Flame": {"effect": "mindfire", "chance": 0.75},
+    "Void Flame": {"effect": "mindfire", "chance": 0.5},
+    "Fireball": {"effect": "mindfire", "chance": 0.4},
+    "Void Bolt": {"effect": "random_mental", "chance": 0.5},
+    "Cursed Blow": {"effect": "mindfire", "chance": 0.4},
+    "Claw": {"effect": "bleed", "chance": 0.6},
+    "Bite": {"effect": "bleed", "chance": 0.6},
+    "Eviscerate": {"effect": "bleed", "chance": 0.8},
+    "Tear": {"effect": "bleed", "chance": 0.7},
+    "Mutilate": {"effect": "bleed", "chance": 0.9},
+    "Dread Aura": {"effect": "fear", "chance": 1.0},
+    "Gaze of the Abyss": {"effect": "madness", "chance": 1.0},
+    "Hypnotic Gaze": {"effect": "confusion", "chance": 1.0, "mp_loss": 5},
+    "Unnerving Aura": {"effect": "fear", "chance": 0.6},
+    "Foul Affliction": {"effect": "madness", "chance": 0.6},
+    "Horrific Wail": {"effect": "madness", "chance": 0.7},
+    "Call of Madness": {"effect": "madness", "chance": 0.6},
+    "Curse of the Stars": {"effect": "madness", "chance": 0.5},
+    "Cosmic Vampirism": {"effect": "madness", "chance": 0.3},
+}
+
+
+@dataclass(frozen=True, slots=True)
+class EffectRecord:
+    name: str
+    bit: int
+    icon: str
+    turns: int = 0                  # duration when applied
+    tick_hp: tuple = None           # (low, high) damage per tick
+    tick_sanity: tuple = None       # (low, high) sanity lost per tick
+    dmg_type: str = "physical"
+    announce_death: bool = False    # narrate the unit falling to this effect's tick
+    turn_loss: tuple = None         # (chance, TurnLost reason, verdict) rolled each tick it lasts
+    applied: tuple = None           # (color, text) when it takes hold
+    expired: str = None
+    describe: str = None            # inspect-screen line
+    inflictable: bool = True        # can be landed by apply_mental_affliction()
+
+
+@dataclass(frozen=True, slots=True)
+class Affliction:
+    spell_name: str
+    effect: str
+    chance: float
+    mp_loss: int = 0
+    applied: tuple = None           # replaces the effect's own applied text
+
+
+effects = {name: EffectRecord(name, bit, **data) for bit, (name, data) in enumerate(effect_table.items())}
+afflictions = {(name, data["effect"]): Affliction(name, **data) for name, data in spell_afflictions.items()}
+
+
+def inflict_chance(effect, spell_name, chance=DEFAULT_CHANCE):
+    """The chance `spell_name` lands `effect`: its own, if the table gives it that effect, else `chance`."""
+    affliction = afflictions.get((spell_name, effect))
+    return affliction.chance if affliction else chance
+
+
+def applied_text(effect, spell_name=None):
+    """(color, text) announcing `effect` taking hold, honouring per-spell wording."""
+    affliction = afflictions.get((spell_name, effect))
+    if affliction and affliction.applied:
+        return affliction.applied
+    return effects[effect].applied
@@ -0,0 +1,105 @@
+# transposition.py
+"""Zobrist hashing of battle positions and an LRU-bounded transposition table.
+
+A position is everything Battle.snapshot() captures except the rng and the
+turn timeline: the flat UNIT_STATE tuple of every unit plus the guard and
+Sentinel bookkeeping. Each (slot, value) pair of the unit tuple gets its own
+random 64-bit key and a position's hash is the XOR of its keys, so the hash
+of a position that differs from a known one in a few fields costs a key
+lookup per changed field (Zobrist.update) instead of a rehash.
+
+Who is fighting (names and fixed stats) is folded in once per battle, so the
+same values in a different matchup never collide.
+"""
+import random
+from collections import OrderedDict
+
+
+class Zobrist:
+    """Lazily drawn 64-bit keys for (slot, value) features; one instance per table."""
+
+    def __init__(self, seed=0):
+        self._rng = random.Random(seed)
+        self._keys = {}
+
+    def key(self, *feature):
+        k = self._keys.get(feature)
+        if k is None:
+            k = self._keys[feature] = self._rng.getrandbits(64)
+        return k
+
+    def hash_values(self, values):
+        h = 0
+        for slot, value in enumerate(values):
+            h ^= self.key(slot, value)
+        return h
+
+    def update(self, h, old_values, new_values):
+        """Hash of new_values given the hash of old_values (same battle layout)."""
+        for slot, (old, new) in enumerate(zip(old_values, new_values)):
+            if old != new:
+                h ^= self.key(slot, old) ^ self.key(slot, new)
+        return h
+
+    def layout_key(self, battle):
+        """Key for who is fighting: each unit's name and fixed stats, in snapshot order (speed only moves the timeline)."""
+        return self.key("layout", tuple(
+            (unit.name, unit.max_hp, unit.max_mp, unit.attack_power, unit.magic_power,
+             unit.defense, unit.resistance)
+            for unit in battle.players + battle.enemies))
+
+    def flags_key(self, battle):
+        units = battle.players + battle.enemies
+        slot = lambda unit: units.index(unit) if unit in units else None
+        return self.key("flags", slot(battle.guarding_tank), slot(battle.protected_ally),
+                        battle.sentinel_instinct_used, battle.sentinel_successful)
+
+
+class PositionHasher:
+    """Hashes a battle's current position, incrementally from the last one it hashed."""
+
+    def __init__(self, zobrist=None):
+        self.zobrist = zobrist or Zobrist()
+        self._battle = None
+        self._layout = 0
+        self._values = None
+        self._units_hash = 0
+
+    def __call__(self, battle):
+        z = self.zobrist
+        values = battle.unit_values()
+        if battle is not self._battle:
+            self._battle, self._layout = battle, z.layout_key(battle)
+            self._units_hash = z.hash_values(values)
+        else:
+            self._units_hash = z.update(self._units_hash, self._values, values)
+        self._values = values
+        return self._units_hash ^ self._layout ^ z.flags_key(battle)
+
+
+class TranspositionTable:
+    """Maps position hashes to search results, evicting the least recently used past `capacity`."""
+
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
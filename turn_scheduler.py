@@ -0,0 +1,97 @@
+# turn_scheduler.py
+"""ATB-style battle timeline: a heap of units keyed on their next action time.
+
+Time is counted in integer ticks. A round lasts `round_length` ticks and the
+fastest combatant acts exactly once per round; everyone else waits
+round_length * fastest / speed ticks between actions, so a unit half as fast
+acts every other round. Everyone acts at tick 0, so round 1 plays out in plain
+speed order like the original sorted list.
+"""
+import heapq
+from math import lcm
+
+REMOVED = None  # placeholder for a unit taken off the timeline (lazy deletion, as in the heapq docs)
+
+
+class TurnScheduler:
+    def __init__(self, units):
+        order = sorted(units, key=lambda u: u.speed, reverse=True)  # ties keep listing order (party first)
+        speeds = [max(1, u.speed) for u in order]
+        self.round_length = lcm(*speeds) if speeds else 1
+        self.round_number = 0
+        self._heap = []
+        self._entries = {}
+        self._interval = {}
+        self._rank = {}
+        for rank, (unit, speed) in enumerate(zip(order, speeds)):
+            self._interval[unit] = self.round_length * speeds[0] // speed
+            self._rank[unit] = rank
+            self._push(unit, 0)
+
+    def _push(self, unit, time):
+        entry = [time, self._rank[unit], unit]
+        self._entries[unit] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _next_before(self, time):
+        """Pop the earliest live entry due before `time`, or None."""
+        heap = self._heap
+        while heap and heap[0][2] is REMOVED:
+            heapq.heappop(heap)
+        if not heap or heap[0][0] >= time:
+            return None
+        entry = heapq.heappop(heap)
+        del self._entries[entry[2]]
+        return entry
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, unit):
+        return unit in self._entries
+
+    def snapshot(self):
+        """The timeline as plain tuples, for restore()."""
+        return self.round_number, tuple(map(tuple, self._heap))
+
+    def restore(self, snapshot):
+        self.round_number, heap = snapshot
+        self._heap = [list(entry) for entry in heap]  # a copied heap is still a heap
+        self._entries = {entry[2]: entry for entry in self._heap if entry[2] is not REMOVED}
+
+    def remove(self, unit):
+        """Take a unit off the timeline; its stale heap slot is dropped by a later O(log n) pop."""
+        entry = self._entries.pop(unit, None)
+        if entry:
+            entry[2] = REMOVED
+
+    def start_round(self):
+        """Begin the next round; turns skipped by an early end of the last round are forfeited."""
+        self.round_number += 1
+        start = (self.round_number - 1) * self.round_length
+        while (entry := self._next_before(start)) is not None:
+            time, _, unit = entry
+            interval = self._interval[unit]
+            self._push(unit, time + -(-(start - time) // interval) * interval)
+        return self.round_number
+
+    def round_turns(self):
+        """Yield this round's actors in timeline order, dropping units that have fallen."""
+        end = self.round_number * self.round_length
+        while (entry := self._next_before(end)) is not None:
+            time, _, unit = entry
+            if unit.hp <= 0:
+                continue  # dead units leave the timeline for good
+            self._push(unit, time + self._interval[unit])
+            yield unit
+
+    def preview(self, k):
+        """The next k living actors (a unit may appear more than once), without advancing time."""
+        heap = [list(entry) for entry in self._heap if entry[2] is not REMOVED and entry[2].hp > 0]
+        heapq.heapify(heap)
+        upcoming = []
+        while heap and len(upcoming) < k:
+            time, rank, unit = heapq.heappop(heap)
+            upcoming.append(unit)
+            heapq.heappush(heap, [time + self._interval[unit], rank, unit])
+        return upcoming
@@ -3,6 +3,9 @@ from colorama import Fore, Style
 import random
 from spells import spell_lookup
 from status_effects import try_inflict_status
+from game_io import console
+from battle_events import DamageDealt, UnitDefeated
+from unit_view import status_icons, unit_row
 
 def render_bar(label, current, maximum, bar_color=Fore.GREEN, bar_width=20):
     if maximum == 0:
@@ -15,11 +18,16 @@ def render_bar(label, current, maximum, bar_color=Fore.GREEN, bar_width=20):
     bar = f"{bar_color}{label:<10} [{filled}{empty}] {current}/{maximum}{Style.RESET_ALL}"
     return bar
 
-def display_combat_unit(unit, is_enemy=False):
+def display_combat_unit(unit, is_enemy=False, sink=console):
     """Render name, status icons, and HP/MP/SAN bars for a player or enemy."""
-    from vivid_battle import get_status_icons  # avoid circular imports
+    if not sink.renders:
+        return
+    sink.emit(unit_row(unit, combat_unit_row, is_enemy, getattr(unit, "show_sanity_bar", False)))
+    sink.emit()
 
-    status = get_status_icons(unit)
+def combat_unit_row(unit, is_enemy=False, show_sanity=False):
+    """The display_combat_unit line, uncached."""
+    status = status_icons(unit)
     name_display = f"{unit.name} {status}" if status else unit.name
     hp_bar = render_bar("HP", unit.hp, unit.max_hp, Fore.RED if is_enemy else Fore.GREEN, bar_width=25)
 
@@ -30,12 +38,11 @@ def display_combat_unit(unit, is_enemy=False):
 
     # Show SAN bar only for players and if flagged
     sanity_bar = ""
-    if not is_enemy and getattr(unit, "show_sanity_bar", False):
+    if not is_enemy and show_sanity:
         sanity_bar = render_bar("SAN", unit.sanity, 100, Fore.MAGENTA, bar_width=15)
 
     # Final layout
-    print(f"{name_display:<25} {hp_bar}   {mp_bar}   {sanity_bar}".strip())
-    print()
+    return f"{name_display:<25} {hp_bar}   {mp_bar}   {sanity_bar}".strip()
 
 def sanity_descriptor(sanity):
     if sanity >= 75:
@@ -78,233 +85,225 @@ def is_mentally_stable(unit):
         getattr(unit, 'sanity', 100) >= 75
     )
 
-def cast_healing_spell(spell, caster, target):
+def cast_healing_spell(spell, caster, target, sink=console):
     healing_amount = spell.power
     target.hp = min(target.max_hp, target.hp + healing_amount)
-    print(Fore.GREEN + f"{caster.name} casts {spell.name} on {target.name}, restoring {healing_amount} HP!" + Style.RESET_ALL)
+    sink.emit(Fore.GREEN + f"{caster.name} casts {spell.name} on {target.name}, restoring {healing_amount} HP!" + Style.RESET_ALL)
 
-def cast_defensive_spell(spell, caster):
+def cast_defensive_spell(spell, caster, sink=console):
     if spell.name == "Sentinel's Oath":
         heal_amount = spell.power
         caster.hp = min(caster.max_hp, caster.hp + heal_amount)
         caster.sent_oath_active = True
 
-        print(Fore.GREEN + f"{caster.name} regains {heal_amount} HP while swearing a Sentinel’s Oath!" + Style.RESET_ALL)
-        print(Fore.CYAN + f"{caster.name} is now ready to intercept a fatal blow to an ally." + Style.RESET_ALL)
+        sink.emit(Fore.GREEN + f"{caster.name} regains {heal_amount} HP while swearing a Sentinel’s Oath!" + Style.RESET_ALL)
+        sink.emit(Fore.CYAN + f"{caster.name} is now ready to intercept a fatal blow to an ally." + Style.RESET_ALL)
     else:
-        print(Fore.YELLOW + f"{spell.name} is a defensive spell, but has no defined effect yet." + Style.RESET_ALL)
+        sink.emit(Fore.YELLOW + f"{spell.name} is a defensive spell, but has no defined effect yet." + Style.RESET_ALL)
 
-def choose_healing_target(players):
+async def choose_healing_target(players, sink=console):
     injured = [p for p in players if p.hp < p.max_hp and p.hp > 0]
     if not injured:
-        print(Fore.YELLOW + "⚠️ No injured allies to heal." + Style.RESET_ALL)
+        sink.emit(Fore.YELLOW + "⚠️ No injured allies to heal." + Style.RESET_ALL)
         return None
     if len(injured) == 1:
         return injured[0]
 
-    print(Fore.LIGHTWHITE_EX + "\nChoose someone to heal:" + Style.RESET_ALL)
+    sink.emit(Fore.LIGHTWHITE_EX + "\nChoose someone to heal:" + Style.RESET_ALL)
     for i, p in enumerate(injured, 1):
-        print(f"  {i}. {p.name} ({p.hp}/{p.max_hp} HP)")
-    choice = input("> ").strip()
+        sink.emit(f"  {i}. {p.name} ({p.hp}/{p.max_hp} HP)")
+    choice = (await sink.prompt("> ")).strip()
     if choice.isdigit():
         idx = int(choice) - 1
         if 0 <= idx < len(injured):
             return injured[idx]
-    print(Fore.YELLOW + "⚠️ Invalid selection." + Style.RESET_ALL)
+    sink.emit(Fore.YELLOW + "⚠️ Invalid selection." + Style.RESET_ALL)
     return None
 
-def post_loot_menu(players, shared_inventory, current_room):
+async def post_loot_menu(players, shared_inventory, current_room, sink=console, rng=random):
 
     while True:
-        print("\n[i]nspect inventory, [u]se item, [h]eal with magic, [v]iew map, or [c]ontinue?")
-        action = input("> ").strip().lower()
+        sink.emit("\n[i]nspect inventory, [u]se item, [h]eal with magic, [v]iew map, or [c]ontinue?")
+        action = (await sink.prompt("> ")).strip().lower()
 
         if action == "i":
-            print(Fore.YELLOW + "\n📦 Party Inventory:" + Style.RESET_ALL)
+            sink.emit(Fore.YELLOW + "\n📦 Party Inventory:" + Style.RESET_ALL)
             if not shared_inventory:
-                print(Fore.LIGHTBLACK_EX + "👜 Inventory is empty." + Style.RESET_ALL)
+                sink.emit(Fore.LIGHTBLACK_EX + "👜 Inventory is empty." + Style.RESET_ALL)
             else:
-                for idx, entry in enumerate(shared_inventory, 1):
-                    print(f"  {idx}. {entry['item'].name} x{entry['qty']} – {entry['item'].description}")
+                for idx, stack in enumerate(shared_inventory, 1):
+                    sink.emit(f"  {idx}. {stack.item.name} x{stack.qty} – {stack.item.description}")
 
         elif action == "u":
             if not shared_inventory:
-                print("The party has no items.")
+                sink.emit("The party has no items.")
                 continue
 
             if len(players) == 1:
                 user = players[0]
             else:
-                print("\nChoose a character to use an item:")
+                sink.emit("\nChoose a character to use an item:")
                 for i, player in enumerate(players, 1):
-                    print(f"  {i}. {player.name}")
+                    sink.emit(f"  {i}. {player.name}")
                 try:
-                    choice = int(input("> "))
+                    choice = int(await sink.prompt("> "))
                     if 1 <= choice <= len(players):
                         user = players[choice - 1]
                     else:
-                        print("Invalid choice.")
+                        sink.emit("Invalid choice.")
                         continue
                 except ValueError:
-                    print("Please enter a number.")
+                    sink.emit("Please enter a number.")
                     continue
 
-            print("\n🎒 Choose an item:")
-            for i, entry in enumerate(shared_inventory, 1):
-                item = entry["item"]
-                qty = entry["qty"]
-                print(f"  {i}. {item.name} x{qty} – {item.description}")
-            print("  0. Cancel")
+            sink.emit("\n🎒 Choose an item:")
+            for i, stack in enumerate(shared_inventory, 1):
+                sink.emit(f"  {i}. {stack.item.name} x{stack.qty} – {stack.item.description}")
+            sink.emit("  0. Cancel")
 
             try:
-                item_choice = int(input("Select item number: "))
+                item_choice = int(await sink.prompt("Select item number: "))
                 if item_choice == 0:
                     continue
-                selected_entry = shared_inventory[item_choice - 1]
+                item = shared_inventory[item_choice - 1].item
             except (ValueError, IndexError):
-                print("Invalid selection.")
+                sink.emit("Invalid selection.")
                 continue
 
-            item = selected_entry["item"]
             item_used = False
 
             if item.item_type == "healing":
-                target = choose_healing_target(players)
+                target = await choose_healing_target(players, sink=sink)
                 if not target:
                     continue
-                heal_amount = random.randint(*item.heal_range)
+                heal_amount = rng.randint(*item.heal_range)
                 target.hp = min(target.max_hp, target.hp + heal_amount)
-                print(Fore.GREEN + f"{target.name} uses {item.name} and heals for {heal_amount} HP." + Style.RESET_ALL)
+                sink.emit(Fore.GREEN + f"{target.name} uses {item.name} and heals for {heal_amount} HP." + Style.RESET_ALL)
                 item_used = True
 
 
             elif item.item_type == "mana":
                 if user.mp >= user.max_mp:
-                    print(Fore.YELLOW + f"{user.name} already has full MP. The {item.name} is not used." + Style.RESET_ALL)
+                    sink.emit(Fore.YELLOW + f"{user.name} already has full MP. The {item.name} is not used." + Style.RESET_ALL)
                 else:
                     if item.mana_restore is None:
-                        print(Fore.YELLOW + f"⚠️ {item.name} has no defined MP restore value." + Style.RESET_ALL)
+                        sink.emit(Fore.YELLOW + f"⚠️ {item.name} has no defined MP restore value." + Style.RESET_ALL)
                         return
 
-                    mp_restore = random.randint(*item.mana_restore) if isinstance(item.mana_restore, tuple) else item.mana_restore
+                    mp_restore = rng.randint(*item.mana_restore) if isinstance(item.mana_restore, tuple) else item.mana_restore
 
                     user.mp = min(user.max_mp, user.mp + mp_restore)
-                    print(Fore.BLUE + f"{user.name} recovers {mp_restore} MP!" + Style.RESET_ALL)
+                    sink.emit(Fore.BLUE + f"{user.name} recovers {mp_restore} MP!" + Style.RESET_ALL)
                     item_used = True
 
             elif item.teaches_spell:
                 spell = spell_lookup.get(item.teaches_spell)
                 if not spell:
-                    print(Fore.RED + "⚠️ The scroll is blank or corrupted." + Style.RESET_ALL)
+                    sink.emit(Fore.RED + "⚠️ The scroll is blank or corrupted." + Style.RESET_ALL)
                 elif spell in user.spells:
-                    print(Fore.YELLOW + f"{user.name} already knows {spell.name}. The scroll crumbles unused." + Style.RESET_ALL)
+                    sink.emit(Fore.YELLOW + f"{user.name} already knows {spell.name}. The scroll crumbles unused." + Style.RESET_ALL)
                 elif user.job not in spell.allowed_classes:
-                    print(Fore.RED + f"{user.name} cannot learn {spell.name}. The scroll rejects your essence." + Style.RESET_ALL)
+                    sink.emit(Fore.RED + f"{user.name} cannot learn {spell.name}. The scroll rejects your essence." + Style.RESET_ALL)
                 else:
-                    confirm = input(f"This will teach {spell.name}. Use it? (Y/N): ").lower()
+                    confirm = (await sink.prompt(f"This will teach {spell.name}. Use it? (Y/N): ")).lower()
                     if confirm == "y":
                         user.spells.append(spell)
-                        print(Fore.MAGENTA + f"{user.name} learned {spell.name}!" + Style.RESET_ALL)
+                        sink.emit(Fore.MAGENTA + f"{user.name} learned {spell.name}!" + Style.RESET_ALL)
                         item_used = True
                     else:
-                        print("Cancelled.")
+                        sink.emit("Cancelled.")
 
             if item_used:
-                selected_entry["qty"] -= 1
-                if selected_entry["qty"] <= 0:
-                    shared_inventory.remove(selected_entry)
+                shared_inventory.remove(item)
 
             if not item_used:
-                print(Fore.LIGHTBLACK_EX + "Nothing happened. You still have the item." + Style.RESET_ALL)
+                sink.emit(Fore.LIGHTBLACK_EX + "Nothing happened. You still have the item." + Style.RESET_ALL)
 
         elif action == "h":
             healers = [p for p in players if any(s.category == "heal" and p.mp >= s.cost for s in p.spells)]
             if not healers:
-                print(Fore.YELLOW + "⚠️ No one in your party can currently cast healing spells." + Style.RESET_ALL)
+                sink.emit(Fore.YELLOW + "⚠️ No one in your party can currently cast healing spells." + Style.RESET_ALL)
                 continue
 
-            print("\nAvailable healers:")
+            sink.emit("\nAvailable healers:")
             for i, p in enumerate(healers, 1):
-                print(f"  {i}. {p.name} (MP: {p.mp}/{p.max_mp})")
+                sink.emit(f"  {i}. {p.name} (MP: {p.mp}/{p.max_mp})")
             try:
-                h_choice = int(input("Choose a healer: ")) - 1
+                h_choice = int(await sink.prompt("Choose a healer: ")) - 1
                 caster = healers[h_choice]
             except (ValueError, IndexError):
-                print("Invalid selection.")
+                sink.emit("Invalid selection.")
                 continue
 
             healing_spells = [s for s in caster.spells if s.category in ("heal", "defense") and caster.mp >= s.cost]
             if not healing_spells:
-                print(Fore.YELLOW + f"{caster.name} has no usable healing spells." + Style.RESET_ALL)
+                sink.emit(Fore.YELLOW + f"{caster.name} has no usable healing spells." + Style.RESET_ALL)
                 continue
 
-            print("\nAvailable healing spells:")
+            sink.emit("\nAvailable healing spells:")
             for i, s in enumerate(healing_spells, 1):
-                print(f"  {i}. {s.name} (MP: {s.cost}) – {s.cast_description()}")
+                sink.emit(f"  {i}. {s.name} (MP: {s.cost}) – {s.cast_description()}")
             try:
-                s_choice = int(input("Choose a spell: ")) - 1
+                s_choice = int(await sink.prompt("Choose a spell: ")) - 1
                 spell = healing_spells[s_choice]
             except (ValueError, IndexError):
-                print("Invalid selection.")
+                sink.emit("Invalid selection.")
                 continue
 
-            target = choose_healing_target(players)
+            target = await choose_healing_target(players, sink=sink)
             if not target:
                 continue
 
             caster.mp -= spell.cost
             if spell.category == "heal":
-                cast_healing_spell(spell, caster, target)
+                cast_healing_spell(spell, caster, target, sink=sink)
             elif spell.category == "defense":
-                cast_defensive_spell(spell, caster)
+                cast_defensive_spell(spell, caster, sink=sink)
             else:
-                print(Fore.YELLOW + f"⚠️ {spell.name} has no defined casting behavior in this context." + Style.RESET_ALL)
+                sink.emit(Fore.YELLOW + f"⚠️ {spell.name} has no defined casting behavior in this context." + Style.RESET_ALL)
 
         elif action == "v":
-            render_map(current_room)
+            render_map(current_room, sink=sink)
 
 
         elif action == "c":
             break
 
         else:
-            print("Invalid input.")
+            sink.emit("Invalid input.")
 
-def use_item_in_combat(user, allies, enemies, shared_inventory):
+async def use_item_in_combat(user, allies, enemies, shared_inventory, sink=console, rng=random):
     if not shared_inventory:
-        print("You have no items.")
+        sink.emit("You have no items.")
         return
 
-    print("\n🎒 Choose an item:")
-    for i, entry in enumerate(shared_inventory, 1):
-        item = entry["item"]
-        qty = entry["qty"]
-        print(f"  {i}. {item.name} x{qty} – {item.description}")
-    print("  0. Cancel")
+    sink.emit("\n🎒 Choose an item:")
+    for i, stack in enumerate(shared_inventory, 1):
+        sink.emit(f"  {i}. {stack.item.name} x{stack.qty} – {stack.item.description}")
+    sink.emit("  0. Cancel")
 
     try:
-        choice = int(input("> "))
+        choice = int(await sink.prompt("> "))
         if choice == 0:
             return
-        selected_entry = shared_inventory[choice - 1]
+        item = shared_inventory[choice - 1].item
     except (ValueError, IndexError):
-        print("Invalid selection.")
+        sink.emit("Invalid selection.")
         return
 
-    item = selected_entry["item"]
     item_used = False
 
     if item.item_type == "healing":
-        target = choose_healing_target(allies)
+        target = await choose_healing_target(allies, sink=sink)
         if not target:
             return
-        heal_amount = random.randint(*item.heal_range)
+        heal_amount = rng.randint(*item.heal_range)
         target.hp = min(target.max_hp, target.hp + heal_amount)
 
         if target == user:
-            print(Fore.GREEN + f"{user.name} drinks the {item.name} and heals for {heal_amount} HP!" + Style.RESET_ALL)
+            sink.emit(Fore.GREEN + f"{user.name} drinks the {item.name} and heals for {heal_amount} HP!" + Style.RESET_ALL)
         else:
-            print(Fore.GREEN + f"{user.name} throws a {item.name} to {target.name}, who heals for {heal_amount} HP!" + Style.RESET_ALL)
+            sink.emit(Fore.GREEN + f"{user.name} throws a {item.name} to {target.name}, who heals for {heal_amount} HP!" + Style.RESET_ALL)
 
         item_used = True
 
@@ -312,115 +311,113 @@ def use_item_in_combat(user, allies, enemies, shared_inventory):
 
     elif item.item_type == "mana":
         if len(allies) > 1:
-            print("\nChoose who to restore MP to:")
+            sink.emit("\nChoose who to restore MP to:")
             for i, ally in enumerate(allies, 1):
-                print(f"  {i}. {ally.name} ({ally.mp}/{ally.max_mp} MP)")
+                sink.emit(f"  {i}. {ally.name} ({ally.mp}/{ally.max_mp} MP)")
             try:
-                t_choice = int(input("> "))
+                t_choice = int(await sink.prompt("> "))
                 if 1 <= t_choice <= len(allies):
                     target = allies[t_choice - 1]
                 else:
-                    print("Invalid selection.")
+                    sink.emit("Invalid selection.")
                     return
             except ValueError:
-                print("Invalid input.")
+                sink.emit("Invalid input.")
                 return
         else:
             target = allies[0]
 
         if target.mp >= target.max_mp:
-            print(Fore.YELLOW + f"{target.name} already has full MP. The {item.name} is not used." + Style.RESET_ALL)
+            sink.emit(Fore.YELLOW + f"{target.name} already has full MP. The {item.name} is not used." + Style.RESET_ALL)
             return
 
         if item.mana_restore is None:
-            print(Fore.YELLOW + f"⚠️ {item.name} has no defined MP restore value." + Style.RESET_ALL)
+            sink.emit(Fore.YELLOW + f"⚠️ {item.name} has no defined MP restore value." + Style.RESET_ALL)
             return
 
-        mp_restore = random.randint(*item.mana_restore) if isinstance(item.mana_restore, tuple) else item.mana_restore
+        mp_restore = rng.randint(*item.mana_restore) if isinstance(item.mana_restore, tuple) else item.mana_restore
 
         target.mp = min(target.max_mp, target.mp + mp_restore)
 
         if target == user:
-            print(Fore.BLUE + f"{user.name} drinks the {item.name} and restores {mp_restore} MP!" + Style.RESET_ALL)
+            sink.emit(Fore.BLUE + f"{user.name} drinks the {item.name} and restores {mp_restore} MP!" + Style.RESET_ALL)
         else:
-            print(Fore.BLUE + f"{user.name} throws a {item.name} to {target.name}, restoring {mp_restore} MP!" + Style.RESET_ALL)
+            sink.emit(Fore.BLUE + f"{user.name} throws a {item.name} to {target.name}, restoring {mp_restore} MP!" + Style.RESET_ALL)
 
         item_used = True
 
 
     elif item.item_type == "attack":
-        print("\nChoose an enemy to throw the item at:")
+        sink.emit("\nChoose an enemy to throw the item at:")
         for i, enemy in enumerate(enemies, 1):
-            print(f"  {i}. {enemy.name} ({enemy.hp}/{enemy.max_hp})")
+            sink.emit(f"  {i}. {enemy.name} ({enemy.hp}/{enemy.max_hp})")
         try:
-            t_choice = int(input("> "))
+            t_choice = int(await sink.prompt("> "))
             if 1 <= t_choice <= len(enemies):
                 target = enemies[t_choice - 1]
             else:
-                print("Invalid target.")
+                sink.emit("Invalid target.")
                 return
         except ValueError:
-            print("Invalid input.")
+            sink.emit("Invalid input.")
             return
 
-        print(f"{user.name} throws {item.name} at {target.name}!")
-        damage = random.randint(*item.damage_range)
+        sink.emit(f"{user.name} throws {item.name} at {target.name}!")
+        damage = rng.randint(*item.damage_range)
         target.hp = max(0, target.hp - damage)
-        print(Fore.RED + f"{target.name} takes {damage} damage!" + Style.RESET_ALL)
+        sink.event(DamageDealt(user, target, damage, cause="item"))
 
         if item.effect:
-            try_inflict_status(target, item.effect)
+            try_inflict_status(target, item.effect, sink=sink, rng=rng)
 
         if target.hp <= 0:
-            print(Fore.GREEN + f"{target.name} has been defeated!" + Style.RESET_ALL)
+            sink.event(UnitDefeated(target, "item"))
 
         item_used = True
 
 
     elif item.item_type == "spellbook":
         if item.spell in user.spells:
-            print(Fore.YELLOW + f"{user.name} already knows {item.spell.name}. The scroll crumbles unused." + Style.RESET_ALL)
+            sink.emit(Fore.YELLOW + f"{user.name} already knows {item.spell.name}. The scroll crumbles unused." + Style.RESET_ALL)
         else:
-            print(f"{user.name} quickly reads the {item.name} scroll mid-battle!")
+            sink.emit(f"{user.name} quickly reads the {item.name} scroll mid-battle!")
             user.spells.append(item.spell)
-            print(Fore.MAGENTA + f"{user.name} learns the spell {item.spell.name}!" + Style.RESET_ALL)
+            sink.emit(Fore.MAGENTA + f"{user.name} learns the spell {item.spell.name}!" + Style.RESET_ALL)
             item_used = True
 
     if item_used:
-        selected_entry["qty"] -= 1
-        if selected_entry["qty"] <= 0:
-            shared_inventory.remove(selected_entry)
+        shared_inventory.remove(item)
 
-def render_map(player_position=None):
-    print(Fore.GREEN + "\n🗺️ You glance at the map..." + Style.RESET_ALL)
+def render_map(player_position=None, sink=console):
+    sink.emit(Fore.GREEN + "\n🗺️ You glance at the map..." + Style.RESET_ALL)
     top_border = "╒════╤════╤════╤════╤════╕"
     mid_border = "├────┼────┼────┼────┼────┤"
     bottom_border = "╘════╧════╧════╧════╧════╛"
 
-    print(top_border)
+    sink.emit(top_border)
     for row in range(5):  # Rows: top to bottom
         row_cells = []
         for col in range(5):  # Columns: left to right
             room_num = col * 5 + row + 1  # Column-major numbering
             cell = " @  " if player_position == room_num else f"{room_num:2}".rjust(4)
             row_cells.append(cell)
-        print("│" + "│".join(row_cells) + "│")
+        sink.emit("│" + "│".join(row_cells) + "│")
         if row < 4:
-            print(mid_border)
-    print(bottom_border)
-    print(Fore.LIGHTBLACK_EX + "\n@ = Your position\n" + Style.RESET_ALL)
+            sink.emit(mid_border)
+    sink.emit(bottom_border)
+    sink.emit(Fore.LIGHTBLACK_EX + "\n@ = Your position\n" + Style.RESET_ALL)
 
-def cycle_party_inspect(players, shared_inventory=None):
+async def cycle_party_inspect(players, shared_inventory=None, sink=console):
     index = 0
     while True:
         player = players[index]
-        print("\n" + "="*60)
-        player.inspect_character(shared_inventory)
-        print("\n" + "="*60)
-        print(f"\nViewing {player.name} ({index + 1}/{len(players)})")
-        print("Press [N]ext, [P]revious, or [Q]uit.")
+        sink.emit("\n" + "="*60)
+        await player.inspect_character(shared_inventory, sink=sink)
+        sink.emit("\n" + "="*60)
+        sink.emit(f"\nViewing {player.name} ({index + 1}/{len(players)})")
+        sink.emit("Press [N]ext, [P]revious, or [Q]uit.")
 
-        choice = input("> ").strip().lower()
+        choice = (await sink.prompt("> ")).strip().lower()
         if choice == "n":
             index = (index + 1) % len(players)
         elif choice == "p":
@@ -428,5 +425,5 @@ def cycle_party_inspect(players, shared_inventory=None):
         elif choice == "q":
             break
         else:
-            print("Invalid input. Try [N], [P], or [Q].")
+            sink.emit("Invalid input. Try [N], [P], or [Q].")
 
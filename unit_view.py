@@ -0,0 +1,76 @@
+# unit_view.py
+"""Cached unit rows (name, status icons, HP/MP/SAN bars), shared by the terminal and the overlay.
+
+Each unit gets a UnitView the first time it is drawn. Its `version` goes up
+whenever the unit's hp, mp, sanity or status has changed since the last
+draw, and every kind of row is rendered once per version: a unit that has not
+changed since the last screen is redrawn from cache for the price of a tuple
+compare. A client streaming battle screens can likewise send only the
+units whose version moved.
+
+Changes are spotted by comparing those values with the ones last drawn, so
+the engine's many `unit.hp = ...` writes need no hooks to keep it honest.
+
+    row = unit_row(unit, combat_unit_row, is_enemy)   # render(unit, *args), cached
+"""
+from operator import attrgetter
+
+
+_watched = {}  # unit class -> attrgetter over the values its rows show (maxima never change)
+
+
+def _state(unit):
+    get = _watched.get(type(unit))
+    if get is None:
+        fields = [name for name in ("hp", "mp", "sanity") if hasattr(unit, name)]
+        get = _watched[type(unit)] = attrgetter(*fields, "status.mask")
+    return get(unit), tuple(unit.status.turns)
+
+
+class UnitView:
+    """One unit's version counter and its rendered rows for that version."""
+    __slots__ = ("unit", "version", "_state", "_rows")
+
+    def __init__(self, unit):
+        self.unit = unit
+        self.version = 0
+        self._state = None
+        self._rows = {}
+
+    def refresh(self):
+        """Bump the version if the unit changed since the last draw; returns the version."""
+        state = _state(self.unit)
+        if state != self._state:
+            self._state = state
+            self.version += 1
+            self._rows.clear()
+        return self.version
+
+    def row(self, render, *args):
+        """render(unit, *args), rendered once per version."""
+        self.refresh()
+        key = (render, args)
+        row = self._rows.get(key)
+        if row is None:
+            row = self._rows[key] = render(self.unit, *args)
+        return row
+
+
+def view_of(unit):
+    view = getattr(unit, "view", None)
+    if view is None:
+        view = unit.view = UnitView(unit)
+    return view
+
+
+def unit_row(unit, render, *args):
+    """The unit's row as drawn by render(unit, *args), from cache while the unit is unchanged."""
+    return view_of(unit).row(render, *args)
+
+
+def _icons(unit):
+    return unit.status.icons()  # 🩸 🔥 ❓ 😨 🧠 💫 🔰, with turns left
+
+
+def status_icons(unit):
+    return unit_row(unit, _icons)
@@ -0,0 +1,454 @@
+# vector_sim.py
+"""Lockstep NumPy battle simulator for massed 1v1 fights (e.g. Clay Golem vs Tank).
+
+Every battle's HP, MP, sanity and status counters live in NumPy arrays, so a turn
+is a handful of masked array operations instead of a Python loop per battle.
+The rules mirror start_battle played by AutoPolicy with a one-member party:
+the same damage formulas, status_table numbers, status ticks, sanity
+checks (both from status_arrays) and miscasts. Randomness is drawn from a
+NumPy Generator, so individual battles differ from the scalar engine but the distributions match; validate()
+checks that statistically.
+
+    python vector_sim.py Tank "Clay Golem" -n 100000
+    python vector_sim.py Tank "Clay Golem" --validate
+"""
+import argparse
+import math
+import random
+import time
+
+import numpy as np
+
+from battle_policy import AutoPolicy
+from damage import mitigate_array
+from battle_sim import MAX_ROUNDS, RoundCounter, RoundLimitReached, party_classes
+from enemies import compiled_templates, enemy_templates, spawn_enemy
+from game_io import run_sync
+from spells import class_melee_options, spell_lookup
+from status_arrays import StatusArrays
+from status_set import BLEED, STUN
+from status_table import RANDOM_MENTAL, afflictions, effects, inflict_chance
+from vivid_battle import start_battle
+
+LOSE, WIN, DRAW = 0, 1, 2
+
+
+class LockstepBattles:
+    """N independent one-player-vs-one-enemy battles advanced in lockstep."""
+
+    def __init__(self, job, enemy_name, battles, seed=0, max_rounds=MAX_ROUNDS):
+        if enemy_name not in enemy_templates:
+            raise KeyError(f"Enemy template '{enemy_name}' not found.")
+        self.rng = np.random.default_rng(seed)
+        self.n = battles
+        self.max_rounds = max_rounds
+
+        # Player stats come from a throwaway instance (its speed roll is discarded).
+        player_cls = party_classes[job]
+        sample = player_cls("sim", random.Random(0))
+
+        self.p_max_hp = sample.max_hp
+        self.p_max_mp = sample.max_mp
+        self.p_attack = sample.attack_power
+        self.p_magic = sample.magic_power
+        self.p_defense = sample.defense
+        self.p_resistance = sample.resistance
+        self.melee_options = class_melee_options.get(job, [spell_lookup["Slash"]])
+
+        # AutoPolicy's choices: heal when below its threshold, else best affordable attack.
+        self.heal_threshold = AutoPolicy().heal_threshold
+        affordable = [s for s in sample.spells]
+        heals = [s for s in affordable if s.category == "heal" and s.damage_range != (0, 0)]
+        self.heals = sorted(heals, key=lambda s: -s.damage_range[1])
+        attacks = [s for s in affordable if s.category in ("damage", "special")]
+        self.attacks = sorted(attacks, key=lambda s: -sum(s.damage_range))
+        if any(s.is_aoe for s in self.attacks):
+            raise NotImplementedError("AOE player spells are not modelled by the lockstep engine.")
+
+        enemy = compiled_templates[enemy_name]
+        self.e_max_hp = enemy.hp
+        self.e_attack = enemy.attack_power
+        self.e_magic = enemy.magic_power
+        self.e_defense = enemy.defense
+        self.e_resistance = enemy.resistance
+        self.e_speed = enemy.speed
+        self.e_spells = list(enemy.spells)
+        melee = [i for i, s in enumerate(self.e_spells) if s.category == "melee"]
+        zero_cost = [i for i, s in enumerate(self.e_spells) if s.cost == 0]
+        self.e_fallback = np.array(melee or zero_cost, dtype=np.int64)
+        self.e_by_cost = np.argsort([s.cost for s in self.e_spells], kind="stable")
+        self.e_sorted_costs = np.array([self.e_spells[i].cost for i in self.e_by_cost])
+
+        n = battles
+        self.p_hp = np.full(n, self.p_max_hp, np.int32)
+        self.p_mp = np.full(n, self.p_max_mp, np.int32)
+        self.p_san = np.full(n, 100, np.int32)
+        self.e_hp = np.full(n, self.e_max_hp, np.int32)
+        self.e_mp = np.full(n, enemy.mp, np.int32)
+        speed = self.rng.integers(player_cls.speed_range[0], player_cls.speed_range[1] + 1, n)
+        self.player_first = speed >= self.e_speed  # ties: players were listed first
+        # TurnScheduler timeline for two units: the faster acts every round, the
+        # slower every fast/slow rounds (integer ticks, round = lcm of the speeds).
+        self.round_ticks = np.lcm(speed, self.e_speed)
+        self.slow_interval = self.round_ticks * np.maximum(speed, self.e_speed) // np.minimum(speed, self.e_speed)
+        self.slow_next = np.zeros(n, np.int64)
+
+        self.status = StatusArrays(n)
+        self.defending = np.zeros(n, bool)
+
+        self._mark = np.zeros(n, bool)
+        self.running = np.ones(n, bool)
+        self.result = np.full(n, DRAW)
+        self.rounds = np.zeros(n, np.int32)
+
+    # --- helpers -----------------------------------------------------------
+
+    def _roll(self, low, high, size):
+        return self.rng.integers(low, high + 1, size, dtype=np.int32)
+
+    def _chance(self, idx, p):
+        return idx[self.rng.random(idx.size) < p]
+
+    def _split(self, idx, k):
+        """Split idx uniformly at random into k groups (like random.choice over k options)."""
+        pick = self.rng.integers(0, k, idx.size)
+        return [idx[pick == i] for i in range(k)]
+
+    def _without(self, idx, drop):
+        """idx minus the battles in drop (both are index arrays)."""
+        if not drop.size:
+            return idx
+        self._mark[drop] = True
+        kept = idx[~self._mark[idx]]
+        self._mark[drop] = False
+        return kept
+
+    def _within(self, idx, keep):
+        """idx restricted to the battles in keep."""
+        if not keep.size:
+            return keep
+        self._mark[keep] = True
+        kept = idx[self._mark[idx]]
+        self._mark[keep] = False
+        return kept
+
+    def _hurt_player(self, idx, dmg):
+        self.p_hp[idx] = np.maximum(0, self.p_hp[idx] - dmg)
+
+    def _hurt_enemy(self, idx, dmg):
+        self.e_hp[idx] = np.maximum(0, self.e_hp[idx] - dmg)
+
+    def _win(self, idx):
+        self.result[idx] = WIN
+        self.running[idx] = False
+
+    # --- status_effects.py -------------------------------------------------
+
+    def apply_affliction(self, idx, effect, spell_name=None):
+        idx = self.status.afflict(idx, effect)
+        affliction = afflictions.get((spell_name, effect))
+        if affliction and affliction.mp_loss:
+            self.p_mp[idx] = np.maximum(0, self.p_mp[idx] - affliction.mp_loss)
+
+    def inflict_on_player(self, idx, effect, spell_name):
+        if not effect:
+            return
+        idx = idx[self.p_hp[idx] > 0]
+        hit = self._chance(idx, inflict_chance(effect, spell_name))
+        if effect == "random_mental":
+            for affliction, group in zip(RANDOM_MENTAL, self._split(hit, 3)):
+                self.apply_affliction(group, affliction)
+        else:
+            self.apply_affliction(hit, effect, spell_name)
+
+    def tick_status(self, act):
+        """Vector form of handle_status_effects; returns (skipped, chaos) index arrays."""
+        skipped, chaos = self.status.tick(self.p_hp, self.p_san, self.rng, act)
+        return np.flatnonzero(skipped), np.flatnonzero(chaos)
+
+    def sanity_check(self, idx):
+        """Vector form of handle_sanity_effects; returns (miscast, fizzle) index arrays.
+
+        Like the engine, a caster goes ahead on a "skip" or "chaos" verdict.
+        """
+        _, _, miscast, fizzle = self.status.sanity_check(self.p_hp, self.p_san, self.rng, idx)
+        return np.flatnonzero(miscast), np.flatnonzero(fizzle)
+
+    # --- vivid_battle.py ---------------------------------------------------
+
+    def miscast(self, idx, spell):
+        outcome = self._split(idx, 3)
+        if spell.category == "heal":
+            heal = self._roll(*spell.damage_range, idx.size) + self.p_magic
+            backlash = self._roll(3, 10, idx.size)
+            self.p_hp[idx] = np.minimum(self.p_max_hp, np.maximum(0, self.p_hp[idx] - backlash) + (heal * 0.6).astype(int))
+            spill = self.e_hp[idx] > 0
+            self.e_hp[idx[spill]] = np.minimum(self.e_max_hp, self.e_hp[idx[spill]] + (heal[spill] * 0.4).astype(int))
+            return
+
+        self_hit, random_target, backlash = outcome
+        self._hurt_player(self_hit, self._roll(5, 15, self_hit.size))
+
+        p_alive = self.p_hp[random_target] > 0
+        e_alive = self.e_hp[random_target] > 0
+        coin = self.rng.random(random_target.size) < 0.5
+        at_player = p_alive & (~e_alive | coin)
+        at_enemy = e_alive & ~at_player
+        hit_p, hit_e = random_target[at_player], random_target[at_enemy]
+        self._hurt_player(hit_p, mitigate_array(self._roll(*spell.damage_range, hit_p.size), self.p_magic, self.p_resistance))
+        self.inflict_on_player(hit_p, spell.effect, spell.name)
+        self._hurt_enemy(hit_e, mitigate_array(self._roll(*spell.damage_range, hit_e.size), self.p_magic, self.e_resistance))
+
+        for affliction, group in zip(RANDOM_MENTAL, self._split(backlash, 3)):
+            self.apply_affliction(group, affliction)
+
+    def player_turn(self, act):
+        while act.size:
+            self.defending[act] = False
+            skipped, chaos = self.tick_status(act)
+            go = self._without(act, skipped)
+
+            self.defending[self._split(chaos, 3)[1]] = True
+
+            # AutoPolicy: pick heal / best affordable attack / melee
+            choice = np.full(go.size, -1)
+            spells = []
+            hp, mp = self.p_hp[go], self.p_mp[go]
+            undecided = np.ones(go.size, bool)
+            if self.heals:
+                wounded = (hp > 0) & (hp < self.heal_threshold * self.p_max_hp)
+                for spell in self.heals:
+                    pick = undecided & wounded & (mp >= spell.cost)
+                    choice[pick] = len(spells)
+                    undecided &= ~pick
+                    spells.append(spell)
+            for spell in self.attacks:
+                pick = undecided & (mp >= spell.cost)
+                choice[pick] = len(spells)
+                undecided &= ~pick
+                spells.append(spell)
+
+            melee = go[choice < 0]
+            casters = go[choice >= 0]
+            miscast, fizzle = self.sanity_check(casters)
+            self.defending[fizzle] = True
+
+            retry = [skipped]
+            for i, spell in enumerate(spells):
+                cast = go[choice == i]
+                bad = self._within(cast, miscast)
+                self.miscast(bad, spell)
+                retry.append(bad)
+                cast = self._without(self._without(cast, bad), fizzle)
+
+                if spell.category == "heal":
+                    wounded = (self.p_hp[cast] > 0) & (self.p_hp[cast] < self.p_max_hp)
+                    self.p_mp[cast[~wounded]] += spell.cost  # "Spell cancelled" refund
+                    healed = cast[wounded]
+                    self.p_hp[healed] = np.minimum(self.p_max_hp, self.p_hp[healed] + self._roll(*spell.damage_range, healed.size) + self.p_magic)
+                    continue
+
+                cast = cast[self.e_hp[cast] > 0]
+                self.p_mp[cast] -= spell.cost
+                self._hurt_enemy(cast, mitigate_array(self._roll(*spell.damage_range, cast.size), self.p_magic, self.e_resistance))
+                self._win(cast[self.e_hp[cast] <= 0])
+
+            melee = melee[self.e_hp[melee] > 0]
+            weapon = self._split(melee, len(self.melee_options))
+            for spell, group in zip(self.melee_options, weapon):
+                self._hurt_enemy(group, mitigate_array(self._roll(*spell.damage_range, group.size), self.p_attack, self.e_defense))
+                self._win(group[self.e_hp[group] <= 0])
+
+            act = np.concatenate(retry)
+            act = act[self.running[act]]
+
+    def enemy_choose(self, idx):
+        """Vector form of Enemy.choose_action (enemies carry no healing spells).
+
+        With spells ordered by cost, "affordable" is always a prefix of that order,
+        so the random pick is a single index computation per battle.
+        """
+        affordable = np.searchsorted(self.e_sorted_costs, self.e_mp[idx], side="right")
+        # One uniform draw decides both the 60% branch and the pick inside it.
+        u = self.rng.random(idx.size)
+        use_affordable = (affordable > 0) & (u < 0.6)
+        picked = np.full(idx.size, -1)
+
+        nth = (u / 0.6 * affordable).astype(int)
+        picked[use_affordable] = self.e_by_cost[nth[use_affordable]]
+        if self.e_fallback.size:
+            rest = ~use_affordable
+            u_rest = np.where(affordable > 0, (u - 0.6) / 0.4, u)[rest]
+            picked[rest] = self.e_fallback[(u_rest * self.e_fallback.size).astype(int)]
+        return picked
+
+    def enemy_damage(self, idx, spell):
+        raw = self._roll(*spell.damage_range, idx.size)
+        if spell.category == "melee":
+            return mitigate_array(raw, self.e_attack, self.p_defense, self.defending[idx])
+        return mitigate_array(raw, self.e_magic, self.p_resistance, self.defending[idx])
+
+    def enemy_turn(self, act, broken):
+        picked = self.enemy_choose(act)
+        for i, spell in enumerate(self.e_spells):
+            idx = act[picked == i]
+            if not idx.size:
+                continue
+
+            if spell.is_aoe:
+                self._hurt_player(idx, self.enemy_damage(idx, spell))
+                self.inflict_on_player(idx, spell.effect, spell.name)
+                if spell.name == "Curse of the Stars":
+                    alive = idx[self.p_hp[idx] > 0]
+                    self.p_san[alive] = np.maximum(0, self.p_san[alive] - self._roll(6, 12, alive.size))
+                if spell.name == "Arcane Cataclysm":
+                    mad = self._chance(idx, 0.6)
+                    for affliction, group in zip(RANDOM_MENTAL, self._split(mad, 3)):
+                        self.apply_affliction(group, affliction)
+                    seared = self._chance(idx, 0.3)
+                    self._hurt_player(seared, self._roll(6, 12, seared.size))
+                    self.p_san[seared] = np.maximum(0, self.p_san[seared] - self._roll(6, 12, seared.size))
+                continue
+
+            if spell.name == "Sanguine Pounce":
+                bleeding = self.status.has(BLEED, idx)
+                dry = idx[~bleeding]
+                self.e_mp[dry] += spell.cost
+                broken[dry] = True
+                idx = idx[bleeding]
+
+            if spell.name == "Gaze of the Abyss":
+                frozen = idx[self.p_san[idx] < 40]
+                self.status.set(frozen, STUN, effects["stun"].turns)
+
+            dmg = self.enemy_damage(idx, spell)
+            self._hurt_player(idx, dmg)
+            if spell.name == "Cosmic Vampirism":
+                self.e_hp[idx] = np.minimum(self.e_max_hp, self.e_hp[idx] + dmg // 2)
+            self.inflict_on_player(idx, spell.effect, spell.name)
+
+    def run(self):
+        for round_number in range(1, self.max_rounds + 1):
+            live = np.flatnonzero(self.running)
+            if not live.size:
+                break
+            self.rounds[live] = round_number
+            broken = np.zeros(self.n, bool)
+            slow_due = self.slow_next < round_number * self.round_ticks
+            self.slow_next[slow_due] += self.slow_interval[slow_due]
+
+            for player_slot in (True, False):
+                due = True if player_slot else slow_due  # second slot = the slower unit
+                slot = self.running & ~broken & due & (self.player_first == player_slot)
+                self.player_turn(np.flatnonzero(slot & (self.p_hp > 0)))
+
+                slot = self.running & ~broken & due & (self.player_first != player_slot) & (self.e_hp > 0)
+                no_target = slot & (self.p_hp <= 0)
+                broken |= no_target
+                self.enemy_turn(np.flatnonzero(slot & ~no_target), broken)
+
+            won = self.running & (self.e_hp <= 0)
+            self._win(np.flatnonzero(won))
+            lost = self.running & (self.p_hp <= 0)
+            self.result[lost] = LOSE
+            self.running &= ~lost
+        return self
+
+
+def simulate(job, enemy_name, battles=10000, seed=0, max_rounds=MAX_ROUNDS):
+    """Play `battles` lockstep fights; returns per-battle outcome arrays."""
+    sim = LockstepBattles(job, enemy_name, battles, seed, max_rounds).run()
+    return {"result": sim.result, "rounds": sim.rounds, "hp": sim.p_hp, "mp": sim.p_mp, "sanity": sim.p_san}
+
+
+def scalar_sample(job, enemy_name, battles, seed=0, max_rounds=MAX_ROUNDS):
+    """Same per-battle arrays from the scalar engine (start_battle + AutoPolicy)."""
+    out = {key: np.zeros(battles, np.int64) for key in ("result", "rounds", "hp", "mp", "sanity")}
+    codes = {"lose": LOSE, "win": WIN, "draw": DRAW}
+    for i in range(battles):
+        rng = random.Random(f"{seed}:{job}:{enemy_name}:{i}")
+        player = party_classes[job](job, rng)
+        sink = RoundCounter(max_rounds)
+        try:
+            result = run_sync(start_battle([player], [spawn_enemy(enemy_name)], [], policy=AutoPolicy(), sink=sink, rng=rng))
+        except RoundLimitReached:
+            result = "draw"
+        out["result"][i] = codes[result]
+        out["rounds"][i] = min(sink.rounds, max_rounds)
+        out["hp"][i], out["mp"][i], out["sanity"][i] = player.hp, player.mp, player.sanity
+    return out
+
+
+def summarize(out):
+    result = out["result"]
+    return {
+        "battles": result.size,
+        "win_rate": float(np.mean(result == WIN)),
+        "draw_rate": float(np.mean(result == DRAW)),
+        "avg_rounds": float(np.mean(out["rounds"])),
+        "avg_hp": float(np.mean(out["hp"])),
+        "avg_mp": float(np.mean(out["mp"])),
+        "avg_sanity": float(np.mean(out["sanity"])),
+    }
+
+
+def _z_score(a, b):
+    """Welch z statistic for the difference of two sample means."""
+    se = math.sqrt(np.var(a) / a.size + np.var(b) / b.size)
+    diff = float(np.mean(a) - np.mean(b))
+    return 0.0 if se == 0 else diff / se
+
+
+def validate(job, enemy_name, battles=2000, seed=0, z_limit=4.0):
+    """Compare lockstep and scalar outcome distributions for one pairing.
+
+    Returns (passed, report) where report holds both summaries and the z score
+    of every compared metric; |z| above z_limit means the engines disagree.
+    """
+    fast = simulate(job, enemy_name, battles * 10, seed)
+    slow = scalar_sample(job, enemy_name, battles, seed)
+    z = {}
+    for key in ("rounds", "hp", "mp", "sanity"):
+        z[key] = _z_score(fast[key], slow[key])
+    z["win_rate"] = _z_score((fast["result"] == WIN).astype(float), (slow["result"] == WIN).astype(float))
+    passed = all(abs(v) <= z_limit for v in z.values())
+    return passed, {"lockstep": summarize(fast), "scalar": summarize(slow), "z": z}
+
+
+def benchmark(job, enemy_name, battles=100000, scalar_battles=2000, seed=0):
+    """Battles per second for the lockstep engine versus looping start_battle."""
+    start = time.perf_counter()
+    simulate(job, enemy_name, battles, seed)
+    fast = battles / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    scalar_sample(job, enemy_name, scalar_battles, seed)
+    slow = scalar_battles / (time.perf_counter() - start)
+    return fast, slow
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lockstep NumPy simulator for massed 1v1 battles.")
+    parser.add_argument("job", choices=list(party_classes))
+    parser.add_argument("enemy", choices=list(enemy_templates))
+    parser.add_argument("-n", "--battles", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--validate", action="store_true", help="compare against the scalar engine")
+    parser.add_argument("--benchmark", action="store_true", help="measure speedup over the scalar engine")
+    args = parser.parse_args()
+
+    if args.validate:
+        passed, report = validate(args.job, args.enemy, seed=args.seed)
+        for engine in ("lockstep", "scalar"):
+            print(engine, report[engine])
+        print("z scores", {k: round(v, 2) for k, v in report["z"].items()})
+        print("PASS" if passed else "FAIL")
+    elif args.benchmark:
+        fast, slow = benchmark(args.job, args.enemy, args.battles, seed=args.seed)
+        print(f"lockstep: {fast:,.0f} battles/s   scalar: {slow:,.0f} battles/s   speedup: {fast / slow:,.0f}x")
+    else:
+        print(summarize(simulate(args.job, args.enemy, args.battles, args.seed)))
+
+
+if __name__ == "__main__":
+    main()
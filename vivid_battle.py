@@ -1,202 +1,262 @@
 # vivid_battle.py
 
 import random
-import time
+from itertools import chain
+from operator import attrgetter
 from colorama import Fore, Style
-from ui_utils import use_item_in_combat
+from game_io import console
+from battle_events import (BattleStarted, RoundStarted, TurnStarted, SpellCast, DamageDealt, Healed,
+                           Defended, Defending, StatusExpired, Intercepted, ClingsToLife, SpellFailed,
+                           Backlash, SanityEffect, MadnessScream, UnitDefeated, BattleEnded)
+from battle_policy import InteractivePolicy
+from turn_scheduler import TurnScheduler
 from status_effects import apply_mental_affliction, try_inflict_status, handle_status_effects, handle_sanity_effects
-from ui_utils import choose_healing_target, display_combat_unit
+from status_table import RANDOM_MENTAL
 from spells import get_class_melee_spell
+from spell_handlers import FIZZLED
+from damage import mitigate, resolve_hits
+from unit_view import status_icons
 
 def get_status_icons(unit):
-    icons = []
-
-    # 🩸 Bleeding
-    if getattr(unit, 'is_bleeding', False):
-        turns = getattr(unit, 'bleeding_turns', 0)
-        icons.append(f"🩸({turns})" if turns > 0 else "🩸")
-
-    # 🔥 Mindfire
-    if getattr(unit, 'is_mindfired', False):
-        turns = getattr(unit, 'mindfire_turns', 0)
-        icons.append(f"🔥({turns})" if turns > 0 else "🔥")
-
-    # ❓ Confusion
-    if getattr(unit, 'is_confused', False):
-        turns = getattr(unit, 'confusion_turns', 0)
-        icons.append(f"❓({turns})" if turns > 0 else "❓")
-
-    # 😨 Fear
-    if getattr(unit, 'is_feared', False):
-        turns = getattr(unit, 'fear_turns', 0)
-        icons.append(f"😨({turns})" if turns > 0 else "😨")
-
-    # 🧠 Madness
-    if getattr(unit, 'is_insane', False):
-        turns = getattr(unit, 'madness_turns', 0)
-        icons.append(f"🧠({turns})" if turns > 0 else "🧠")
-
-    # 💫 Stunned
-    if getattr(unit, 'is_stunned', False):
-        turns = getattr(unit, 'stun_turns', 1)
-        icons.append(f"💫({turns})" if turns > 0 else "💫")
-
-    # 🔰 Mental Resistance
-    if getattr(unit, 'mental_resistance_turns', 0) > 0:
-        icons.append(f"🔰({unit.mental_resistance_turns})")
-
-    return " ".join(icons)
-
-
-def enemy_spell_cast_text(enemy_name, spell_name):
-    lore_lines = {
-        "Void Bolt": [
-            f"{enemy_name} chants in a forgotten tongue and hurls a bolt from the void!",
-            f"Space distorts around {enemy_name} as {spell_name} tears toward its prey!",
-            f"A whisper from the Outer Dark rides the {spell_name} released by {enemy_name}!"
-        ],
-        "Eldritch Flame": [
-            f"{enemy_name} ignites a flame that screams with the voices of dead stars!",
-            f"{spell_name} writhes unnaturally in {enemy_name}'s grasp before lashing out!",
-            f"An inferno born of madness erupts as {enemy_name} casts {spell_name}!"
-        ],
-        "Fireball": [
-            f"{enemy_name}'s eyes burn red as a blazing sphere engulfs the air!",
-            f"With an inhuman roar, {enemy_name} hurls {spell_name} from a burning sigil!",
-            f"The heat of ancient suns answers {enemy_name}'s call through {spell_name}!"
-        ],
-        "Arcane Cataclysm": [
-            f"The veil of reality rends as {enemy_name} unleashes {spell_name}!",
-            f"{spell_name} swirls with impossible geometry as {enemy_name} calls upon it!",
-            f"The dungeon trembles — {enemy_name} channels the will of Nyarlathotep!"
-        ]
-    }
-
-    return random.choice(lore_lines.get(spell_name, [f"{enemy_name} casts {spell_name} with unsettling calm..."]))
-
-fizzle_flavor_texts = [
-    "⛧ The air twists violently, whispering in tongues no one understands...",
-    "☍ An eye blinks open in the void, then vanishes without a trace...",
-    "✦ The runes shimmer briefly before crumbling into black ash...",
-    "☉ {name} hears laughter — it echoes from somewhere beneath the floor.",
-    "⟁ The veil wavers. Something watches — but chooses not to act.",
-    "✣ A stifling silence falls, as if the dungeon holds its breath.",
-    "☌ A chorus of unseen voices hums dissonantly around {name}...",
-    "⯎ The sigils sputter and flare, then collapse into themselves."
-]
+    return status_icons(unit)  # 🩸 🔥 ❓ 😨 🧠 💫 🔰, with turns left
+
 
 def all_enemies_defeated(enemies):
     return all(e.hp <= 0 for e in enemies)
 
-def handle_spell_miscast(caster, spell, players, enemies):
-    outcome = random.choice(["self_hit", "random_target", "mental_backlash"])
+def handle_spell_miscast(caster, spell, players, enemies, sink=console, rng=random):
+    outcome = rng.choice(["self_hit", "random_target", "mental_backlash"])
 
     if spell.category == "heal":
         # Twisted healing: partial heal, partial enemy benefit, and backlash
-        heal_amount = random.randint(*spell.damage_range) + caster.magic_power
+        heal_amount = rng.randint(*spell.damage_range) + caster.magic_power
         heal_ally = int(heal_amount * 0.6)
         enemy_heal = int(heal_amount * 0.4)
-        backlash = random.randint(3, 10)
+        backlash = rng.randint(3, 10)
 
         caster.hp = max(0, caster.hp - backlash)
         caster.hp = min(caster.max_hp, caster.hp + heal_ally)
 
-        print(Fore.YELLOW + f"{caster.name} miscasts {spell.name} — distorted energies ripple outward!" + Style.RESET_ALL)
-        print(Fore.GREEN + f"{caster.name} heals for {heal_ally} HP..." + Style.RESET_ALL)
+        sink.event(SpellFailed(caster, spell, "miscast_heal"))
+        sink.event(Healed(caster, caster, heal_ally, spell, "miscast"))
 
         # Pick a random living enemy to receive the healing spill
         living_enemies = [e for e in enemies if e.hp > 0]
         if living_enemies:
-            target_enemy = random.choice(living_enemies)
+            target_enemy = rng.choice(living_enemies)
             target_enemy.hp = min(target_enemy.max_hp, target_enemy.hp + enemy_heal)
-            print(Fore.LIGHTRED_EX + f"💢 The remaining {enemy_heal} healing energy is absorbed by {target_enemy.name}!" + Style.RESET_ALL)
+            sink.event(Healed(caster, target_enemy, enemy_heal, spell, "miscast_spill"))
 
-        print(Fore.RED + f"{caster.name} suffers {backlash} backlash damage!" + Style.RESET_ALL)
+        sink.event(DamageDealt(caster, caster, backlash, spell=spell, cause="backlash"))
 
     else:
         if outcome == "self_hit":
-            dmg = random.randint(5, 15)
+            dmg = rng.randint(5, 15)
             caster.hp = max(0, caster.hp - dmg)
-            print(Fore.RED + f"{caster.name}'s {spell.name} explodes in their hands, dealing {dmg} self-inflicted damage!" + Style.RESET_ALL)
+            sink.event(DamageDealt(caster, caster, dmg, spell=spell, cause="miscast_self"))
 
         elif outcome == "random_target":
             possible_targets = [c for c in players + enemies if c.hp > 0]
             if possible_targets:
-                target = random.choice(possible_targets)
-                dmg = random.randint(*spell.damage_range) + caster.magic_power
-                actual_dmg = max(0, dmg - target.resistance)
+                target = rng.choice(possible_targets)
+                hit, = resolve_hits(caster, spell, [target], rng, defend=False)
+                actual_dmg = hit.amount
                 target.hp = max(0, target.hp - actual_dmg)
-                print(Fore.YELLOW + f"{caster.name}'s {spell.name} wildly fires at {target.name}, dealing {actual_dmg} damage!" + Style.RESET_ALL)
+                sink.event(DamageDealt(caster, target, actual_dmg, "magical", spell, cause="miscast_wild"))
 
                 if spell.effect:
                     effects = spell.effect if isinstance(spell.effect, list) else [spell.effect]
                     for effect in effects:
-                        try_inflict_status(target, effect, spell_name=spell.name)
+                        try_inflict_status(target, effect, spell_name=spell.name, sink=sink, rng=rng)
 
         elif outcome == "mental_backlash":
-            affliction = random.choice(["confusion", "fear", "madness"])
-            apply_mental_affliction(caster, affliction)
-            print(Fore.LIGHTMAGENTA_EX + f"The miscast {spell.name} echoes back into {caster.name}'s mind, inducing {affliction}!" + Style.RESET_ALL)
-
-def cast_pure_of_mind(caster, target):
-    target.is_confused = False
-    target.is_feared = False
-    target.is_insane = False
-    target.mental_resistance_turns = 3
-    print(Fore.CYAN + f"{caster.name} casts Pure of Mind!" + Style.RESET_ALL)
-    print(Fore.LIGHTWHITE_EX + f"A calming glow surrounds {target.name}, clearing their mind and bolstering it against future corruption." + Style.RESET_ALL)
-
-def cast_veil_of_silence(caster, target):
-    target.mental_resistance_turns = 2  # Lasts 2 turns
-    print(Fore.CYAN + f"{caster.name} invokes the Veil of Silence!" + Style.RESET_ALL)
-    print(Fore.LIGHTWHITE_EX + f"An intangible silence shields {target.name}'s mind from intrusion." + Style.RESET_ALL)
-
-def apply_aoe_spell(spell, caster, targets, is_enemy_cast=False):
-    for target in targets:
-        if target.hp <= 0:
-            continue
-
-        # Determine if target is defending
-        defending = getattr(target, "defending", False)
-
-        # Damage type and calculation
-        raw_dmg = random.randint(*spell.damage_range)
-        if spell.category == "melee":
-            total_dmg = raw_dmg + caster.attack_power
-            actual_dmg = max(0, total_dmg - target.defense)
-            dmg_type = "physical"
-        else:
-            total_dmg = raw_dmg + caster.magic_power
-            actual_dmg = max(0, total_dmg - target.resistance)
-            dmg_type = "magical"
-
-        if defending:
-            actual_dmg = int(actual_dmg * 0.5)
-            print(Fore.CYAN + f"{target.name} defends and takes reduced {dmg_type} damage!" + Style.RESET_ALL)
-
-        apply_spell_damage_and_effect(spell, caster, target, dmg_type, actual_dmg)
-
-        time.sleep(0.4)
-
-def apply_spell_damage_and_effect(spell, caster, target, dmg_type, actual_dmg):
+            affliction = rng.choice(RANDOM_MENTAL)
+            apply_mental_affliction(caster, affliction, sink=sink)
+            sink.event(Backlash(caster, spell, affliction))
+
+# Everything a fight changes on a unit (enemies skip the ones they don't have, like sanity)
+UNIT_STATE = (
+    "hp", "mp", "sanity",
+    "status_mask", "status_turns",  # every status flag and counter (status_set.StatusHolder)
+    "defending", "is_guarding", "is_guarded",
+)
+
+
+TURN_OVER = "turn_over"  # enemy_cast(): the turn has already ended
+
+
+class Battle:
+    """One fight in progress: what spell hooks (spell_handlers) get to see and change.
+
+    snapshot() captures the whole fight (unit stats, statuses, guards, Sentinel
+    state, rng and turn timeline) as flat tuples and restore() rolls back to
+    it, so an AI can play a line out and undo it in microseconds.
+    """
+
+    def __init__(self, players, enemies, policy, sink=console, rng=random):
+        self.players = players
+        self.enemies = enemies
+        self.policy = policy
+        self.sink = sink
+        self.rng = rng
+        self.scheduler = None
+        self.guarding_tank = None           # Tank who cast Sentinel's Oath
+        self.protected_ally = None          # Holds the player the Tank is watching over
+        self.sentinel_instinct_used = False
+        self.sentinel_successful = False
+        self._layout = []                   # (unit, fields, getter) in snapshot order
+        for unit in players + enemies:
+            fields = tuple(f for f in UNIT_STATE if hasattr(unit, f))
+            self._layout.append((unit, fields, attrgetter(*fields)))
+
+    def unit_values(self):
+        """Every unit's UNIT_STATE fields, in one flat tuple."""
+        return tuple(chain.from_iterable(get(unit) for unit, _, get in self._layout))
+
+    def snapshot(self):
+        """The fight's state as a tuple of flat tuples; pass it to restore() to go back."""
+        values = self.unit_values()
+        timeline = self.scheduler.snapshot() if self.scheduler else None
+        return (values, self.guarding_tank, self.protected_ally, self.sentinel_instinct_used,
+                self.sentinel_successful, self.rng.getstate(), timeline)
+
+    def restore(self, snapshot):
+        (values, self.guarding_tank, self.protected_ally, self.sentinel_instinct_used,
+         self.sentinel_successful, rng_state, timeline) = snapshot
+        start = 0
+        for unit, fields, get in self._layout:
+            end = start + len(fields)
+            saved, now = values[start:end], get(unit)
+            if saved != now:  # usually only a few fields moved; write just those
+                for field, value, current in zip(fields, saved, now):
+                    if value != current:
+                        setattr(unit, field, value)
+            start = end
+        self.rng.setstate(rng_state)
+        if timeline is not None:
+            self.scheduler.restore(timeline)
+
+async def apply_aoe_spell(spell, caster, targets, is_enemy_cast=False, sink=console, rng=random):
+    # Every living target's damage is rolled in one batch, then applied in order
+    for hit in resolve_hits(caster, spell, [t for t in targets if t.hp > 0], rng):
+        if hit.defended:
+            sink.event(Defended(hit.target, hit.dmg_type))
+
+        apply_spell_damage_and_effect(spell, caster, hit.target, hit.dmg_type, hit.amount, sink=sink, rng=rng)
+
+        await sink.pause(0.4)
+
+def apply_spell_damage_and_effect(spell, caster, target, dmg_type, actual_dmg, sink=console, rng=random, cause="spell"):
     target.hp = max(0, target.hp - actual_dmg)
-    color = Fore.RED if dmg_type == "physical" else Fore.MAGENTA
-    print(color + f"{target.name} takes {actual_dmg} {dmg_type} damage from {spell.name} cast by {caster.name}!" + Style.RESET_ALL)
+    sink.event(DamageDealt(caster, target, actual_dmg, dmg_type, spell, cause=cause))
+    if target.hp == 0:
+        sink.event(UnitDefeated(target))
 
-    # 🧛 Drain for Cosmic Vampirism
-    if spell.name == "Cosmic Vampirism" and actual_dmg > 0:
-        drain = actual_dmg // 2
-        caster.hp = min(caster.max_hp, caster.hp + drain)
-        print(Fore.MAGENTA + f"{caster.name} drains {drain} HP from {target.name}!" + Style.RESET_ALL)
+    if spell.on_hit:
+        spell.on_hit(caster, target, spell, actual_dmg, sink)
 
     # Always treat spell.effect as list
     if spell.effect:
         effects = spell.effect if isinstance(spell.effect, list) else [spell.effect]
         for effect in effects:
-            try_inflict_status(target, effect, spell_name=spell.name)
+            try_inflict_status(target, effect, spell_name=spell.name, sink=sink, rng=rng)
+
+async def enemy_cast(battle, unit, spell, target):
+    """Resolve one enemy spell aimed at `target` (AOE spells hit the whole party).
+
+    Returns FIZZLED when the spell fails and costs the enemy side the rest of
+    the round, TURN_OVER when the turn already ended (AOE and intercepted hits
+    skip the usual pause and guard check), or None.
+    """
+    players, sink, rng = battle.players, battle.sink, battle.rng
+    sink.event(SpellCast(unit, spell, "enemy"))
+
+    if spell.is_aoe:
+        await apply_aoe_spell(spell, unit, players, is_enemy_cast=True, sink=sink, rng=rng)
+
+        if spell.post_cast:
+            spell.post_cast(battle, unit, spell)
+
+        player = players[-1]  # only the last party member listed has ever been checked here
+        if player.hp == 1 and not battle.sentinel_instinct_used:
+            battle.protected_ally = player
+            sink.event(ClingsToLife(player, "protect"))
+
+        return TURN_OVER  # Skip rest for AOE
+
+    if spell.pre_damage and spell.pre_damage(battle, unit, spell, target) == FIZZLED:
+        return FIZZLED
+
+    # --- Handle Single Target Spells (including melee)
+    hit, = resolve_hits(unit, spell, [target], rng)
+    actual_dmg, dmg_type = hit.amount, hit.dmg_type
+    if hit.defended:
+        sink.event(Defended(target, dmg_type))
+
+    # 🛡️ Guardian Shield Interception
+    guardian_candidates = [p for p in players if p.job == "Tank" and getattr(p, "is_guarding", False) and p.hp > 0]
+    if guardian_candidates and target != guardian_candidates[0]:
+        guardian = guardian_candidates[0]
+        redirected_dmg = int(actual_dmg * 0.5)
+        guardian.hp = max(0, guardian.hp - redirected_dmg)
+        sink.event(Intercepted(guardian, target, redirected_dmg, spell))
+        if guardian.hp == 0:
+            sink.event(UnitDefeated(guardian))
+        return TURN_OVER  # Skip applying damage to the original target
+
+    # 🛡️ Sentinel Passive
+    guarding_tank = battle.guarding_tank
+    if battle.protected_ally == target and target.hp == 1 and not battle.sentinel_instinct_used:
+        battle.sentinel_instinct_used = True
+        battle.sentinel_successful = True
+
+        if guarding_tank and guarding_tank.hp > 0:
+            reduced_dmg = int(actual_dmg * 0.1)
+            reduced_dmg = max(0, reduced_dmg - guarding_tank.resistance)
+            sink.event(Intercepted(guarding_tank, target, reduced_dmg, spell, "sentinel"))
+
+            apply_spell_damage_and_effect(spell, unit, guarding_tank, dmg_type, reduced_dmg, sink=sink, rng=rng)
+
+            battle.guarding_tank = None
+            await sink.pause(1.0)
+
+            heal_amount = rng.randint(15, 30)
+            target.hp = min(target.max_hp, target.hp + heal_amount)
+            sink.event(Healed(guarding_tank, target, heal_amount, spell, "sentinel_instinct"))
+            await sink.pause(1.2)
+
+        else:
+            apply_spell_damage_and_effect(spell, unit, target, dmg_type, actual_dmg, sink=sink, rng=rng)
+
+    else:
+        apply_spell_damage_and_effect(spell, unit, target, dmg_type, actual_dmg, sink=sink, rng=rng)
+
+    if spell.post_cast:
+        spell.post_cast(battle, unit, spell)
+
+    if target.hp == 1 and not battle.sentinel_instinct_used:
+        battle.protected_ally = target
+        sink.event(ClingsToLife(target, "protect"))
 
-def start_battle(players, enemies, shared_inventory, overlay=None):
-    print(Fore.RED + Style.BRIGHT + "\n⚔️  The battle begins!\n" + Style.RESET_ALL)
+
+async def start_battle(players, enemies, shared_inventory, overlay=None, policy=None, sink=console, rng=random):
+    """Run a battle to completion and return "win" or "lose".
+
+    Player decisions come from `policy` (the keyboard by default) and all text,
+    prompts and pacing delays go to `sink`. Passing an AutoPolicy and a NullSink
+    runs the exact same combat rules headless, without prompts, prints or sleeps.
+
+    Every combat roll is drawn from `rng` (a random.Random; the global
+    random module by default), so a battle given a seeded rng and the same
+    choices replays exactly.
+
+    This is a coroutine: await it on an event loop, or drive it with
+    game_io.run_sync when the sink never really waits (console, headless).
+    """
+    policy = policy or InteractivePolicy(sink)
+    battle = Battle(players, enemies, policy, sink, rng)
+
+    sink.event(BattleStarted(players, enemies))
 
     if overlay:
         overlay.party_ref = players
@@ -204,274 +264,188 @@ def start_battle(players, enemies, shared_inventory, overlay=None):
         try:
             overlay.update_display()
         except Exception as e:
-            print(f"(Overlay display error: {e})")
-
-    all_combatants = players + enemies
-    all_combatants.sort(key=lambda x: x.speed, reverse=True)
+            sink.emit(f"(Overlay display error: {e})")
 
-    class_icons = {
-        "White Mage": "✨",
-        "Black Mage": "🧙",
-        "Tank": "🛡️",
-        "Occultist": "🔮"
-    }
-
-    guarding_tank = None
-    sentinel_instinct_used = False
-    protected_ally = None  # Holds the player the Tank is watching over
-    sentinel_successful = False
+    scheduler = battle.scheduler = TurnScheduler(players + enemies)  # faster units act more often
 
     while True:
-        if sentinel_instinct_used and sentinel_successful:
-                sentinel_instinct_used = False  # 🔁 Reset passive each round if successfully used
-                protected_ally = None
-
-        
-        print(Fore.LIGHTWHITE_EX + "\n👥 Party Status:" + Style.RESET_ALL)
-        for player in players:
-            if player.hp > 0:
-                display_combat_unit(player)
+        round_number = scheduler.start_round()
+        sink.begin_round(round_number)
 
-        print(Fore.LIGHTWHITE_EX + "\n👹 Enemy Status:" + Style.RESET_ALL)
-        for enemy in enemies:
-            if enemy.hp > 0:
-                display_combat_unit(enemy, is_enemy=True)
+        if battle.sentinel_instinct_used and battle.sentinel_successful:
+                battle.sentinel_instinct_used = False  # 🔁 Reset passive each round if successfully used
+                battle.protected_ally = None
 
-        time.sleep(1.5)
+        
+        upcoming = scheduler.preview(len(scheduler)) if sink.renders else ()
+        sink.event(RoundStarted(round_number, players, enemies, upcoming))
 
-        for unit in all_combatants:
-            if unit.hp <= 0:
-                continue
+        await sink.pause(1.5)
 
+        for unit in scheduler.round_turns():
             if unit in players:
                 while True:
                     for player in players:
                         player.defending = False # Reset for previously defending
-                    icon = class_icons.get(unit.job, "🎭")
-                    print(Fore.CYAN + f"\n{icon}  {unit.name}'s Turn {icon}" + Style.RESET_ALL)
-                    status_result = handle_status_effects(unit)
+                    sink.event(TurnStarted(unit))
+                    status_result = handle_status_effects(unit, sink=sink, rng=rng)
                     if status_result == "skip":
                         continue
                     elif status_result == "chaos":
-                        random_action = random.choice(["attack_ally", "defend", "scream"])
+                        random_action = rng.choice(["attack_ally", "defend", "scream"])
                         if random_action == "attack_ally":
-                            ally = random.choice([p for p in players if p.hp > 0 and p != unit])
+                            allies = [p for p in players if p.hp > 0 and p != unit]
+                            ally = rng.choice(allies) if allies else None
                             if ally:
-                                base_dmg = unit.attack_power + random.randint(2, 8)
-                                actual_dmg = max(0, base_dmg - ally.defense)
-                                if getattr(ally, "defending", False):
-                                    actual_dmg = int(actual_dmg * 0.5)
-                                    print(Fore.CYAN + f"{ally.name} defends instinctively against the blow!" + Style.RESET_ALL)
+                                defending = getattr(ally, "defending", False)
+                                actual_dmg = mitigate(rng.randint(2, 8), unit.attack_power, ally.defense, defending)
+                                if defending:
+                                    sink.event(Defended(ally, "physical", instinctive=True))
                                 ally.hp = max(0, ally.hp - actual_dmg)
-                                print(Fore.RED + f"{unit.name} attacks {ally.name} in a fit of madness for {actual_dmg} damage!" + Style.RESET_ALL)
+                                sink.event(DamageDealt(unit, ally, actual_dmg, cause="madness"))
+                                if ally.hp == 0:
+                                    sink.event(UnitDefeated(ally))
                         elif random_action == "defend":
                             unit.defending = True  # You can check for this elsewhere to reduce damage taken this round
-                            print(Fore.LIGHTYELLOW_EX + f"{unit.name} curls into a ball defensively, whispering to unseen forces..." + Style.RESET_ALL)
+                            sink.event(Defending(unit, "madness"))
                         elif random_action == "scream":
-                            print(Fore.LIGHTMAGENTA_EX + f"{unit.name} screams at the darkness, hands clutching their skull — doing nothing useful!" + Style.RESET_ALL)
-
-                    if unit.sanity < 25:
-                        print(Fore.MAGENTA + f"😱 {unit.name} is on the edge of madness, whispering to unseen horrors..." + Style.RESET_ALL)
-                    elif unit.sanity < 50:
-                        print(Fore.MAGENTA + f"🌀 {unit.name}'s hands shake as visions cloud their eyes..." + Style.RESET_ALL)
-                    elif unit.sanity < 75:
-                        print(Fore.MAGENTA + f"😧 {unit.name} breathes heavily, shadows swirling in the corners of their vision." + Style.RESET_ALL)
-
-                    available_actions = ["Attack", "Cast Spell", "Use Item", "Inspect", "Defend"]
+                            sink.event(MadnessScream(unit))
 
-                    for idx, action in enumerate(available_actions, 1):
-                        print(f"  {idx}. {action}")
+                    if unit.sanity < 75:
+                        sink.event(SanityEffect(unit, "strain", unit.sanity))
 
-                    choice = input(Fore.LIGHTWHITE_EX + "> " + Style.RESET_ALL).strip()
+                    choice = await policy.choose_action(unit, players, enemies)
 
                     if choice == "1":
-                        melee_spell = get_class_melee_spell(unit.job)
-                        target = choose_target(enemies)
+                        melee_spell = get_class_melee_spell(unit.job, rng)
+                        target = await policy.choose_target(unit, enemies)
                         if target:
-                            base_dmg = random.randint(*melee_spell.damage_range)
-                            total_dmg = base_dmg + unit.attack_power
-                            actual_dmg = max(0, total_dmg - target.defense)
+                            hit, = resolve_hits(unit, melee_spell, [target], rng)
+                            actual_dmg = hit.amount
                             target.hp = max(0, target.hp - actual_dmg)
 
-                            print(Fore.CYAN + melee_spell.cast_description() + Style.RESET_ALL)
-
-                            if actual_dmg == 0:
-                                print(random.choice([
-                                    f"{unit.name}'s strike glances off {target.name}, dealing no damage.",
-                                    f"{target.name} shrugs off the attack — unscathed.",
-                                    f"{unit.name} fails to penetrate {target.name}'s defense."
-                                ]))
-                            elif actual_dmg <= 3:
-                                print(f"A light hit — {unit.name} deals just {actual_dmg} damage.")
-                            else:
-                                print(Fore.GREEN + f"\n🗡️ {unit.name} hits {target.name} for {actual_dmg} damage!" + Style.RESET_ALL)
+                            sink.event(SpellCast(unit, melee_spell, "melee"))
+                            if hit.defended:
+                                sink.event(Defended(target, hit.dmg_type))
+                            sink.event(DamageDealt(unit, target, actual_dmg, spell=melee_spell, cause="melee"))
+                            if target.hp == 0:
+                                sink.event(UnitDefeated(target))
 
                             if target.hp == 1:
-                                print(Fore.YELLOW + f"{target.name} clings to life with a sliver of strength!" + Style.RESET_ALL)
+                                sink.event(ClingsToLife(target, "melee"))
 
-                            time.sleep(1.2)
+                            await sink.pause(1.2)
                             if all_enemies_defeated(enemies):
-                                print(Fore.GREEN + Style.BRIGHT + "\n🎉 Victory! The enemies have been defeated!" + Style.RESET_ALL)
+                                sink.event(BattleEnded("win"))
                                 return "win"
                         break
 
                     elif choice == "2":
-                        spell = unit.choose_spell()
+                        spell = await policy.choose_spell(unit)
                         if not spell:
                             continue
 
                         if spell.cost > unit.mp:
-                            print(Fore.RED + "⚠️ Not enough MP!" + Style.RESET_ALL)
+                            sink.emit(Fore.RED + "⚠️ Not enough MP!" + Style.RESET_ALL)
                             continue
 
                         # Sanity effects happen now, after the player *chooses* to cast a spell
-                        sanity_check = handle_sanity_effects(unit)
+                        sanity_check = handle_sanity_effects(unit, sink=sink, rng=rng)
                         if sanity_check == "miscast":
                             # Miscast: spell backfires or hits wrong target
-                            print(Fore.YELLOW + f"{unit.name}'s concentration wavers — the spell misfires!" + Style.RESET_ALL)
-                            handle_spell_miscast(unit, spell, players, enemies)
+                            sink.event(SpellFailed(unit, spell, "miscast"))
+                            handle_spell_miscast(unit, spell, players, enemies, sink=sink, rng=rng)
                             continue
 
                         elif sanity_check == "fizzle":
-                            print(Fore.YELLOW + f"{unit.name} loses focus — the spell fizzles before it forms!" + Style.RESET_ALL)
-
-                            # 🎭 Add eerie flavor text
-                            fizzle_line = random.choice(fizzle_flavor_texts)
-                            if "{name}" in fizzle_line:
-                                fizzle_line = fizzle_line.format(name=unit.name)
-                            print(Fore.LIGHTBLACK_EX + fizzle_line + Style.RESET_ALL)
+                            sink.event(SpellFailed(unit, spell, "fizzle"))
 
                             # Fizzle recovery phase: only allow Inspect or Defend
                             while True:
-                                print(Fore.LIGHTWHITE_EX + f"\n🔄 {unit.name} may still inspect or defend:" + Style.RESET_ALL)
-                                print("  1. Inspect Self")
-                                print("  2. Defend")
-                                fizzle_choice = input(Fore.LIGHTWHITE_EX + "> " + Style.RESET_ALL).strip()
+                                fizzle_choice = await policy.choose_fizzle_action(unit)
 
                                 if fizzle_choice == "1":
-                                    print(Fore.LIGHTCYAN_EX + f"\n📖 Inspecting {unit.name} the {unit.job}..." + Style.RESET_ALL)
-                                    unit.inspect_character()
-                                    input(Fore.YELLOW + "\nPress Enter to return to battle..." + Style.RESET_ALL)
+                                    sink.emit(Fore.LIGHTCYAN_EX + f"\n📖 Inspecting {unit.name} the {unit.job}..." + Style.RESET_ALL)
+                                    await policy.inspect(unit, returning_to="battle")
                                     continue
 
                                 elif fizzle_choice == "2":
                                     unit.defending = True
-                                    print(Fore.LIGHTYELLOW_EX + f"{unit.name} steadies their stance after the failed casting attempt." + Style.RESET_ALL)
-                                    time.sleep(1.2)
+                                    sink.event(Defending(unit, "fizzle"))
+                                    await sink.pause(1.2)
                                     break
 
                                 else:
-                                    print(Fore.YELLOW + "Invalid choice. Choose 1 or 2." + Style.RESET_ALL)
+                                    sink.emit(Fore.YELLOW + "Invalid choice. Choose 1 or 2." + Style.RESET_ALL)
                             break  # Ends the player's turn after fallback
 
-                        if spell.name == "Guardian Shield":
-                            unit.is_guarding = True
-                            print(Fore.YELLOW + f"\n🛡️ {unit.name} activates Guardian Shield, ready to protect allies!" + Style.RESET_ALL)
-                            print(Fore.YELLOW + f"\n🛡️ {unit.name} braces to intercept incoming attacks!" + Style.RESET_ALL)
-                            time.sleep(1.2)
-                            break
-
-                        elif spell.name == "Sentinel's Oath":
-                            # Choose target to heal and protect
-                            valid_targets = [a for a in players if a.hp > 0 and a != unit]
-                            if not valid_targets:
-                                print(Fore.YELLOW + f"No valid allies to protect with {spell.name}." + Style.RESET_ALL)
-                                break
-
-                            print("\nWho will you heal and protect?")
-                            for i, ally in enumerate(valid_targets, 1):
-                                print(f"  {i}. {ally.name} ({ally.hp}/{ally.max_hp} HP)")
-                            try:
-                                choice = int(input("> ")) - 1
-                                target = valid_targets[choice]
-                            except (ValueError, IndexError):
-                                print(Fore.YELLOW + "Invalid choice." + Style.RESET_ALL)
-                                break
-
-                            heal_amount = random.randint(*spell.damage_range)
-                            target.hp = min(target.max_hp, target.hp + heal_amount)
-                            target.is_guarded = True         # Mark this ally to be intercepted
-                            guarding_tank = unit             # The one who casted the spell
-
-                            print(Fore.GREEN + f"\n✨ {unit.name} casts {spell.name}, healing {target.name} for {heal_amount} HP!" + Style.RESET_ALL)
-                            print(Fore.LIGHTCYAN_EX + f"🛡️ {unit.name} prepares to intercept any attack against {target.name}!" + Style.RESET_ALL)
-                            time.sleep(1.2)
-                            break
-                        
-                        elif spell.name == "Pure of Mind":
-                            target = unit  # Self-targeting
-                            cast_pure_of_mind(unit, target)
-                            break
-
-                        elif spell.name == "Veil of Silence":
-                            cast_veil_of_silence(unit, unit)  # Self-targeting
-                            time.sleep(1.2)
+                        if spell.on_cast:
+                            await spell.on_cast(battle, unit, spell)  # Guardian Shield, Sentinel's Oath, wards...
                             break
 
                         # Healing spells with targeting
                         elif spell.category == "heal":
-                            target = choose_healing_target(players)
+                            target = await policy.choose_heal_target(unit, players)
                             if not target:
-                                print(Fore.YELLOW + "Spell cancelled." + Style.RESET_ALL)
+                                sink.emit(Fore.YELLOW + "Spell cancelled." + Style.RESET_ALL)
                                 unit.mp += spell.cost  # Refund MP if cancelled
                                 break
-                            heal = random.randint(*spell.damage_range) + unit.magic_power
+                            heal = rng.randint(*spell.damage_range) + unit.magic_power
                             target.hp = min(target.max_hp, target.hp + heal)
-                            print(Fore.GREEN + f"\n✨ {unit.name} casts {spell.name} and heals {target.name} for {heal} HP!" + Style.RESET_ALL)
-                            time.sleep(1.2)
+                            sink.event(Healed(unit, target, heal, spell))
+                            await sink.pause(1.2)
                             break
 
                         elif spell.is_aoe:
-                            print(Fore.MAGENTA + f"\n✨ {unit.name} unleashes {spell.name}, targeting all enemies!" + Style.RESET_ALL)
+                            sink.event(SpellCast(unit, spell, "aoe"))
                             unit.mp -= spell.cost  # MP deducted before applying AOE spell
-                            apply_aoe_spell(spell, unit, enemies, is_enemy_cast=False)
-                            time.sleep(0.4)
+                            await apply_aoe_spell(spell, unit, enemies, is_enemy_cast=False, sink=sink, rng=rng)
+                            if spell.post_cast:
+                                spell.post_cast(battle, unit, spell)
+                            await sink.pause(0.4)
                         else:
-                            target = choose_target(enemies)
+                            target = await policy.choose_target(unit, enemies)
                             if target:
 
                                 unit.mp -= spell.cost  # MP deducted only after successful target confirmation
-                                base_dmg = random.randint(*spell.damage_range)
-                                total_dmg = base_dmg + unit.magic_power
-                                final_dmg = max(0, total_dmg - target.resistance)
-                                target.hp = max(0, target.hp - final_dmg)
-                                print(Fore.MAGENTA + f"\n🔥 {unit.name} successfully casts {spell.name} and hits {target.name} for {final_dmg} damage!" + Style.RESET_ALL)
-                                # Always treat spell.effect as list if it's not None
-                                if spell.effect:
-                                    effects = spell.effect if isinstance(spell.effect, list) else [spell.effect]
-                                    for effect in effects:
-                                        try_inflict_status(target, effect, spell_name=spell.name)
+                                if spell.pre_damage and spell.pre_damage(battle, unit, spell, target) == FIZZLED:
+                                    break
+                                hit, = resolve_hits(unit, spell, [target], rng)
+                                if hit.defended:
+                                    sink.event(Defended(target, hit.dmg_type))
+                                apply_spell_damage_and_effect(spell, unit, target, hit.dmg_type, hit.amount, sink=sink, rng=rng, cause="cast")
+                                if spell.post_cast:
+                                    spell.post_cast(battle, unit, spell)
 
                                 if target.hp == 1:
-                                    print(Fore.YELLOW + f"{target.name}'s form flickers—barely hanging on!" + Style.RESET_ALL)
-                                time.sleep(1.2)
+                                    sink.event(ClingsToLife(target, "spell"))
+                                await sink.pause(1.2)
                                 if all_enemies_defeated(enemies):
-                                    print(Fore.GREEN + Style.BRIGHT + "\n🎉 Victory! The enemies have been defeated!" + Style.RESET_ALL)
+                                    sink.event(BattleEnded("win"))
                                     return "win"
                             break
 
                     elif choice == "3":
-                        use_item_in_combat(unit, players, enemies, shared_inventory)
-                        time.sleep(1.2)
+                        await policy.use_item(unit, players, enemies, shared_inventory, rng=rng)
+                        await sink.pause(1.2)
                         if all_enemies_defeated(enemies):
-                            print(Fore.GREEN + Style.BRIGHT + "\n🎉 Victory! The enemies have been defeated!" + Style.RESET_ALL)
+                            sink.event(BattleEnded("win"))
                             return "win"
                         break
 
                     elif choice == "4":
-                        print(Fore.LIGHTCYAN_EX + f"\n📖 Inspecting {unit.name} the {unit.job}..." + Style.RESET_ALL)
-                        unit.inspect_character()
-                        input(Fore.YELLOW + "\nPress Enter to return to combat..." + Style.RESET_ALL)
+                        sink.emit(Fore.LIGHTCYAN_EX + f"\n📖 Inspecting {unit.name} the {unit.job}..." + Style.RESET_ALL)
+                        await policy.inspect(unit)
                         continue  # loop back to same player
 
                     elif choice == "5":
                         unit.defending = True
-                        print(Fore.LIGHTYELLOW_EX + f"{unit.name} raises their guard and prepares for the next attack." + Style.RESET_ALL)
-                        time.sleep(1.2)
+                        sink.event(Defending(unit, "guard"))
+                        await sink.pause(1.2)
                         break
 
                     else:
-                        print(Fore.YELLOW + "Invalid action." + Style.RESET_ALL)
+                        sink.emit(Fore.YELLOW + "Invalid action." + Style.RESET_ALL)
                         continue
 
             else:
@@ -479,161 +453,58 @@ def start_battle(players, enemies, shared_inventory, overlay=None):
                 if not alive_players:
                     break
 
-                target = random.choice(alive_players)
-                action, spell = unit.choose_action()
+                move = unit.ai.choose(battle, unit) if unit.ai else None
+                if move:
+                    action, (spell, target) = "spell", move
+                else:
+                    target = rng.choice(alive_players)
+                    action, spell = unit.choose_action(rng)
 
                 if action == "spell":
-                    print(Fore.RED + f"\n👹 {enemy_spell_cast_text(unit.name, spell.name)}" + Style.RESET_ALL)
-
-                    if spell.is_aoe:
-                        apply_aoe_spell(spell, unit, players, is_enemy_cast=True)
-
-                        if spell.name == "Curse of the Stars":
-                            for player in players:
-                                if player.hp <= 0:
-                                    continue
-                                sanity_loss = random.randint(6, 12)
-                                player.sanity = max(0, player.sanity - sanity_loss)
-                                print(Fore.MAGENTA + f"{player.name} loses {sanity_loss} sanity under the Curse of the Stars!" + Style.RESET_ALL)
-
-                        if spell.name == "Arcane Cataclysm":
-                            if random.random() < 0.6:
-                                effect = random.choice(["confusion", "fear", "madness"])
-                                apply_mental_affliction(player, effect)
-
-                            if random.random() < 0.3:
-                                burn = random.randint(6, 12)
-                                sanity_burn = random.randint(6, 12)
-                                player.hp = max(0, player.hp - burn)
-                                player.sanity = max(0, player.sanity - sanity_burn)
-                                print(Fore.LIGHTRED_EX + f"🔥 {player.name} is seared for {burn} HP and {sanity_burn} sanity!" + Style.RESET_ALL)
-
-                        if player.hp == 1 and not sentinel_instinct_used:
-                            protected_ally = player
-                            print(Fore.YELLOW + f"⚠️ {player.name} clings to life... something in the air shifts protectively." + Style.RESET_ALL)
-
-                        continue  # Skip rest for AOE
-                    
-                    if spell.name == "Sanguine Pounce" and not getattr(target, "is_bleeding", False):
-                        print(Fore.YELLOW + f"{unit.name} lunges with {spell.name}, but {target.name} isn't bleeding — the spell fizzles!" + Style.RESET_ALL)
-                        unit.mp += spell.cost  # Refund MP
-                        time.sleep(1.2)
+                    outcome = await enemy_cast(battle, unit, spell, target)
+                    if outcome == FIZZLED:
+                        await sink.pause(1.2)
                         break  # End player's turn
-                    elif spell.name == "Sanguine Pounce":
-                        print(Fore.RED + f"{spell.name} locks onto the scent of blood — {unit.name} strikes with savage precision!" + Style.RESET_ALL)
-
-                    # 🩸 Eviscerate does bonus damage to already bleeding targets
-                    if spell.name == "Eviscerate" and getattr(target, "is_bleeding", False):
-                        print(Fore.RED + f"{spell.name} carves into open wounds — the bleeding makes it worse!" + Style.RESET_ALL)
-                        bonus = random.randint(5, 10)
-                        actual_dmg += bonus
-                        print(Fore.LIGHTRED_EX + f"{target.name} takes an extra {bonus} damage due to bleeding!" + Style.RESET_ALL)
-
-                    if spell.name == "Fireball":
-                        if random.random() < 0.5:
-                            splash_targets = [p for p in players if p.hp > 0 and p != target]
-                            if splash_targets:
-                                splash_target = random.choice(splash_targets)
-                                splash_dmg = random.randint(5, 10)
-                                splash_target.hp = max(0, splash_target.hp - splash_dmg)
-                                print(Fore.LIGHTRED_EX + f"🔥 Splash damage from Fireball scorches {splash_target.name} for {splash_dmg} HP!" + Style.RESET_ALL)
-
-                    if spell.name == "Gaze of the Abyss" and target.sanity < 40:
-                        target.is_stunned = True
-                        target.stun_turns = 1
-                        print(Fore.MAGENTA + f"{target.name} stares into the abyss and is frozen in terror!" + Style.RESET_ALL)
-
-                    # --- Handle Single Target Spells (including melee)
-                    raw_dmg = random.randint(*spell.damage_range)
-                    if spell.category == "melee":
-                        total_dmg = raw_dmg + unit.attack_power
-                        actual_dmg = max(0, total_dmg - target.defense)
-                        dmg_type = "physical"
-                    else:
-                        total_dmg = raw_dmg + unit.magic_power
-                        actual_dmg = max(0, total_dmg - target.resistance)
-                        dmg_type = "magical"
-
-                    if getattr(target, "defending", False):
-                        actual_dmg = int(actual_dmg * 0.5)
-                        print(Fore.CYAN + f"{target.name} defends and takes reduced {dmg_type} damage!" + Style.RESET_ALL)
-
-                    # 🛡️ Guardian Shield Interception
-                    guardian_candidates = [p for p in players if p.job == "Tank" and getattr(p, "is_guarding", False) and p.hp > 0]
-                    if guardian_candidates and target != guardian_candidates[0]:
-                        guardian = guardian_candidates[0]
-                        redirected_dmg = int(actual_dmg * 0.5)
-                        guardian.hp = max(0, guardian.hp - redirected_dmg)
-                        print(Fore.CYAN + f"{guardian.name} intercepts the blow from {spell.name}, taking {redirected_dmg} damage for {target.name}!" + Style.RESET_ALL)
-                        continue  # Skip applying damage to the original target
-
-                    # 🛡️ Sentinel Passive
-                    if protected_ally == target and target.hp == 1 and not sentinel_instinct_used:
-                        sentinel_instinct_used = True
-                        sentinel_successful = True
-
-                        if guarding_tank and guarding_tank.hp > 0:
-                            print(Fore.CYAN + f"\n🛡️ {guarding_tank.name} senses danger and intercepts the {spell.name} meant for {target.name}!" + Style.RESET_ALL)
-
-                            reduced_dmg = int(actual_dmg * 0.1)
-                            reduced_dmg = max(0, reduced_dmg - guarding_tank.resistance)
-                            apply_spell_damage_and_effect(spell, unit, guarding_tank, dmg_type, reduced_dmg)
-
-                            guarding_tank = None
-                            time.sleep(1.0)
-
-                            heal_amount = random.randint(15, 30)
-                            target.hp = min(target.max_hp, target.hp + heal_amount)
-                            print(Fore.GREEN + f"{target.name} is enveloped in protective light and recovers {heal_amount} HP!" + Style.RESET_ALL)
-                            time.sleep(1.2)
-
-                        else:
-                            apply_spell_damage_and_effect(spell, unit, target, dmg_type, actual_dmg)
-
-                    else:
-                        apply_spell_damage_and_effect(spell, unit, target, dmg_type, actual_dmg)
-
-                    if target.hp == 1 and not sentinel_instinct_used:
-                        protected_ally = target
-                        print(Fore.YELLOW + f"⚠️ {target.name} clings to life... something in the air shifts protectively." + Style.RESET_ALL)
+                    if outcome == TURN_OVER:
+                        continue
 
-                time.sleep(1.2)
+                await sink.pause(1.2)
 
                 for player in players:
                     if player.is_guarding and not getattr(player, 'is_guarded', False):
                         player.is_guarding = False
-                        print(Fore.LIGHTWHITE_EX + f"{player.name}'s Guardian Shield fades." + Style.RESET_ALL)
+                        sink.event(StatusExpired(player, "guardian_shield"))
 
         if all_enemies_defeated(enemies):
-            print(Fore.GREEN + Style.BRIGHT + "\n🎉 Victory! The enemies have been defeated!" + Style.RESET_ALL)
+            sink.event(BattleEnded("win"))
             enemies.clear()
             if overlay:
                 overlay.update_display()
             return "win"
 
         if all(player.hp <= 0 for player in players):
-            print(Fore.RED + Style.BRIGHT + "\n💀 Your party has fallen to the dungeon..." + Style.RESET_ALL)
+            sink.event(BattleEnded("lose"))
             if overlay:
                 overlay.update_display()
             return "lose"
 
-def choose_target(units):
+async def choose_target(units, sink=console):
     alive_units = [u for u in units if u.hp > 0]
     if not alive_units:
         return None
 
     while True:
-        print(Fore.LIGHTWHITE_EX + "\nSelect a target:" + Style.RESET_ALL)
+        sink.emit(Fore.LIGHTWHITE_EX + "\nSelect a target:" + Style.RESET_ALL)
         for idx, unit in enumerate(alive_units, 1):
-            print(f"  {idx}. {unit.name} ({unit.hp} HP)")
+            sink.emit(f"  {idx}. {unit.name} ({unit.hp} HP)")
 
-        choice = input(Fore.LIGHTWHITE_EX + "> " + Style.RESET_ALL).strip()
+        choice = (await sink.prompt(Fore.LIGHTWHITE_EX + "> " + Style.RESET_ALL)).strip()
         if choice.isdigit():
             idx = int(choice) - 1
             if 0 <= idx < len(alive_units):
                 return alive_units[idx]
 
-        print(Fore.YELLOW + "⚠️ Invalid target. Please try again." + Style.RESET_ALL)
+        sink.emit(Fore.YELLOW + "⚠️ Invalid target. Please try again." + Style.RESET_ALL)
 
 
 # =============================
@@ -645,5 +516,5 @@ def choose_target(units):
 # =============================
 
 # A. Consider moving enemy spell flavor text to spells.py for easier management.
-# B. Expand enemy_spell_cast_text() for other spells beyond Fireball, Eldritch Flame, etc.
+# B. Expand battle_render.enemy_spell_cast_text() for other spells beyond Fireball, Eldritch Flame, etc.
 # C. Refactor spell.effect to support multiple concurrent effects or stacking logic.